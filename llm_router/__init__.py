@@ -1,18 +1,17 @@
-"""LLM Router Service for intelligent model selection and routing."""
+"""LLM Router Service for intelligent model selection and routing.
+
+``LLMRouterService`` and the response schemas are imported on first access,
+so ``import llm_router`` doesn't load LiteLLM, PromptLayer or transformers.
+"""
+
+from typing import TYPE_CHECKING
 
-from llm_router.routers.router import LLMRouterService  # was LLMRouter
 # from llm_router.schemas.council_schemas import (
 #     LLMResponse,
 #     RouterMetadata,
 #     LLMRouterResponse,
 # )
 
-from fyras_models import(
-    LLMResponse,
-    RouterMetadata,
-    LLMRouterResponse
-)
-
 from llm_router.exceptions.exceptions import (
     LLMRouterError,
     UsableModelForPromptError,
@@ -25,6 +24,19 @@ from llm_router.exceptions.exceptions import (
     ProviderCostError,
 )
 
+from llm_router.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from llm_router.routers.router import LLMRouterService  # was LLMRouter
+    from fyras_models import LLMResponse, RouterMetadata, LLMRouterResponse
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "LLMRouterService": "llm_router.routers.router",
+    "LLMResponse": "fyras_models",
+    "RouterMetadata": "fyras_models",
+    "LLMRouterResponse": "fyras_models",
+})
+
 __version__ = "0.1.0"
 
 __all__ = [
@@ -0,0 +1,97 @@
+"""Compare zero-shot classifier backends on CPU.
+
+Run with ``python -m llm_router.benchmarks.bench_backends``. Each backend is
+measured in its own subprocess so resident memory isn't shared between them.
+Reports p50/p99 latency, peak RSS and whether the label ranking matches the
+``torch`` backend within ``BACKEND_TOLERANCE``.
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+from llm_router.benchmarks.bench_selector_warmup import PROMPTS
+from llm_router.schemas.config import CANDIDATE_LABELS
+from llm_router.selectors.backends import BACKENDS, BACKEND_TOLERANCE, rankings_match
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_worker(backend: str, iterations: int) -> None:
+    from llm_router.selectors.classifier import HFZeroShotSelector
+    from llm_router.selectors.registry import ModelRegistry
+
+    selector = HFZeroShotSelector(registry=ModelRegistry(), backend=backend)
+    selector.warmup()
+    classifier = selector._get_classifier()
+
+    results = [classifier(prompt, CANDIDATE_LABELS) for prompt in PROMPTS]
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        classifier(PROMPTS[i % len(PROMPTS)], CANDIDATE_LABELS)
+        timings.append(time.perf_counter() - start)
+
+    json.dump(
+        {
+            "backend": backend,
+            "p50_ms": _percentile(timings, 50) * 1000,
+            "p99_ms": _percentile(timings, 99) * 1000,
+            "mean_ms": statistics.mean(timings) * 1000,
+            # ru_maxrss is reported in kilobytes on Linux.
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "results": results,
+        },
+        sys.stdout,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.iterations)
+        return
+
+    reports = {}
+    for backend in args.backends:
+        out = subprocess.run(
+            [sys.executable, "-m", __spec__.name, "--worker", backend,
+             "--iterations", str(args.iterations)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        reports[backend] = json.loads(out.strip().splitlines()[-1])
+
+    reference = reports.get("torch")
+    print(f"{'backend':<10} {'p50 ms':>8} {'p99 ms':>8} {'peak RSS MB':>12} {'ranking':>8}")
+    for backend, report in reports.items():
+        if reference is None:
+            agrees = "n/a"
+        else:
+            agrees = all(
+                rankings_match(ref, cand, BACKEND_TOLERANCE[backend])
+                for ref, cand in zip(reference["results"], report["results"])
+            )
+            agrees = "ok" if agrees else "DIFFERS"
+        print(
+            f"{backend:<10} {report['p50_ms']:>8.1f} {report['p99_ms']:>8.1f}"
+            f" {report['peak_rss_mb']:>12.0f} {agrees:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
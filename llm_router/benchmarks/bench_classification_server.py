@@ -0,0 +1,90 @@
+"""Compare in-process classification with the micro-batching server.
+
+Run with ``python -m llm_router.benchmarks.bench_classification_server``.
+``--clients`` threads each classify ``--requests`` prompts, once calling a
+shared in-process :class:`HFZeroShotSelector` directly (one forward pass per
+prompt) and once through :class:`RemoteSelector` against a
+:class:`ClassificationServer` running in its own process, which coalesces
+concurrent prompts into batches. Reports throughput and per-request p50/p99
+latency for each mode.
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import threading
+import time
+
+from llm_router.benchmarks.bench_selector_warmup import PROMPTS
+from llm_router.selectors.server import ClassificationServer, RemoteSelector
+
+
+def make_selector(backend: str):
+    from llm_router.selectors.classifier import HFZeroShotSelector
+    from llm_router.selectors.registry import ModelRegistry
+
+    return HFZeroShotSelector(registry=ModelRegistry(), backend=backend)
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(selector, clients: int, requests: int):
+    latencies = []
+    lock = threading.Lock()
+
+    def client(offset: int) -> None:
+        for i in range(requests):
+            start = time.perf_counter()
+            selector.select_model(PROMPTS[(offset + i) % len(PROMPTS)])
+            with lock:
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    inline = make_selector(args.backend)
+    inline.warmup()
+
+    path = os.path.join(tempfile.mkdtemp(), "classify.sock")
+    server = ClassificationServer.spawn(
+        path,
+        functools.partial(make_selector, args.backend),
+        max_batch_size=args.max_batch_size,
+        max_wait=args.max_wait_ms / 1000,
+    )
+    try:
+        print(f"{'mode':<8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, selector in (("inline", inline), ("server", RemoteSelector(path))):
+            run(selector, 1, 2)  # warm up connections and caches
+            elapsed, latencies = run(selector, args.clients, args.requests)
+            print(
+                f"{label:<8} {len(latencies) / elapsed:>8.1f}"
+                f" {_percentile(latencies, 50) * 1000:>8.1f}"
+                f" {_percentile(latencies, 99) * 1000:>8.1f}"
+            )
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure ``import llm_router`` with ``python -X importtime``.
+
+Run with ``python -m llm_router.benchmarks.bench_import_time``. Each run
+imports the package in a fresh interpreter and parses the ``-X importtime``
+report. Prints the median cumulative import time, the slowest imported
+modules, and any heavy dependency that was loaded eagerly. Exits with status
+1 when the median exceeds ``--budget-ms`` or a heavy dependency shows up, so
+the script can guard cold-start regressions in CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+#: Default regression budget for ``import llm_router``, in milliseconds.
+IMPORT_BUDGET_MS = 100.0
+
+#: Dependencies that must only be imported on first use.
+HEAVY_MODULES = ("litellm", "promptlayer", "transformers", "torch", "numpy", "openai")
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """Import ``module`` in a fresh interpreter.
+
+    Returns ``{module: (self_us, cumulative_us)}`` for every imported module.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def measure(module: str, runs: int) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Return the median cumulative import time in ms and the last run's report."""
+    totals: List[float] = []
+    times: Dict[str, Tuple[int, int]] = {}
+    for _ in range(runs):
+        times = import_times(module)
+        totals.append(times[module][1] / 1000)
+    return statistics.median(totals), times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="llm_router")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    median, times = measure(args.module, args.runs)
+    print(f"import {args.module}: median {median:.1f} ms over {args.runs} runs"
+          f" (budget {args.budget_ms:.0f} ms), {len(times)} modules")
+    print(f"{'module':<50} {'self ms':>8} {'cum ms':>8}")
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (own, cumulative) in slowest[: args.top]:
+        print(f"{name:<50} {own / 1000:>8.1f} {cumulative / 1000:>8.1f}")
+
+    eager = [name for name in HEAVY_MODULES if name in times]
+    if eager:
+        print(f"heavy dependencies imported eagerly: {', '.join(eager)}")
+    if median > args.budget_ms or eager:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Measure per-worker memory of the classifier with and without sharing.
+
+Run with ``python -m llm_router.benchmarks.bench_prefork_memory``. For each
+mode a fresh interpreter forks ``--workers`` children the way a pre-fork
+server does, every child classifies a prompt, and while all children are
+alive each reports its USS (memory only it uses) and PSS (its share of
+everything it maps) from ``/proc/<pid>/smaps_rollup``:
+
+* ``independent``: every worker loads its own copy of the weights.
+* ``prefork``: the parent loads the weights with :func:`preload` before
+  forking, so workers share them copy-on-write.
+* ``mmap``: every worker loads the ``torch-mmap`` backend, whose weights are
+  shared through the page cache.
+
+Linux only.
+"""
+
+import argparse
+import json
+import multiprocessing
+import statistics
+import subprocess
+import sys
+
+from llm_router.benchmarks.bench_selector_warmup import PROMPTS
+from llm_router.selectors.prefork import after_fork, memory_usage, preload
+
+MODES = ("independent", "prefork", "mmap")
+MB = 1024 * 1024
+
+
+def _selector(backend: str):
+    from llm_router.selectors.classifier import HFZeroShotSelector
+    from llm_router.selectors.registry import ModelRegistry
+
+    return HFZeroShotSelector(registry=ModelRegistry(), backend=backend)
+
+
+def _worker(selector, backend, results, done) -> None:
+    after_fork(num_threads=1)
+    if selector is None:
+        selector = _selector(backend)
+    selector.select_model(PROMPTS[0])
+    results.put(memory_usage())
+    done.wait()
+
+
+def run_mode(mode: str, workers: int) -> None:
+    ctx = multiprocessing.get_context("fork")
+    backend = "torch-mmap" if mode == "mmap" else "torch"
+    selector = None
+    if mode == "prefork":
+        selector = _selector(backend)
+        preload(selector)
+
+    results, done = ctx.Queue(), ctx.Event()
+    procs = [
+        ctx.Process(target=_worker, args=(selector, backend, results, done))
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    usage = [results.get() for _ in procs]
+    done.set()
+    for proc in procs:
+        proc.join()
+    print(json.dumps({"mode": mode, "workers": usage, "parent": memory_usage()}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--worker-mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker_mode:
+        run_mode(args.worker_mode, args.workers)
+        return
+
+    print(f"{'mode':<12} {'USS/worker MB':>14} {'PSS/worker MB':>14} {'total PSS MB':>13}")
+    for mode in args.modes:
+        proc = subprocess.run(
+            [sys.executable, "-m", __spec__.name, "--worker-mode", mode,
+             "--workers", str(args.workers)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        uss = statistics.mean(worker["uss"] for worker in result["workers"]) / MB
+        pss = statistics.mean(worker["pss"] for worker in result["workers"]) / MB
+        total = (sum(worker["pss"] for worker in result["workers"]) + result["parent"]["pss"]) / MB
+        print(f"{mode:<12} {uss:>14.0f} {pss:>14.0f} {total:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare per-request ``litellm.cost_per_token`` with :class:`PricingTable`.
+
+Run with ``python -m llm_router.benchmarks.bench_pricing``. Prices the same
+synthetic usage records three ways: one ``cost_per_token`` call per record,
+one :meth:`PricingTable.cost` per record, and a single
+:meth:`PricingTable.cost_many` over all of them.
+"""
+
+import argparse
+import random
+import time
+
+from litellm import cost_per_token
+
+from llm_router.providers import PricingTable
+from llm_router.schemas.config import TOPIC_TO_MODEL
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+
+    models = sorted({models["openai"] for models in TOPIC_TO_MODEL.values()})
+    rng = random.Random(0)
+    records = [
+        (rng.choice(models), rng.randint(10, 4000), rng.randint(10, 1000))
+        for _ in range(args.records)
+    ]
+    table = PricingTable.for_models(models)
+
+    start = time.perf_counter()
+    for model, prompt, completion in records:
+        sum(cost_per_token(model=model, prompt_tokens=prompt, completion_tokens=completion))
+    litellm_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for model, prompt, completion in records:
+        table.cost(model, prompt, completion)
+    table_time = time.perf_counter() - start
+
+    names, prompts, completions = zip(*records)
+    start = time.perf_counter()
+    table.cost_many(names, prompts, completions)
+    bulk_time = time.perf_counter() - start
+
+    print(f"{'method':<16} {'total ms':>9} {'us/record':>10}")
+    for label, elapsed in (
+        ("cost_per_token", litellm_time),
+        ("table.cost", table_time),
+        ("table.cost_many", bulk_time),
+    ):
+        print(f"{label:<16} {elapsed * 1000:>9.1f} {elapsed / len(records) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure classification throughput of the process pool per worker layout.
+
+Run with ``python -m llm_router.benchmarks.bench_process_pool``. For every
+combination of ``--workers`` and ``--threads`` a :class:`ProcessPoolSelector`
+is started and warmed up, then ``--clients`` threads each classify
+``--requests`` prompts through it. Reports throughput and per-request
+p50/p99 latency, plus a single in-process selector as the baseline. Layouts
+where ``workers * threads`` exceeds the core count oversubscribe the CPU.
+"""
+
+import argparse
+import functools
+import os
+import time
+
+from llm_router.benchmarks.bench_classification_server import _percentile, make_selector, run
+from llm_router.selectors.pool import ProcessPoolSelector
+
+
+def _report(label: str, workers: str, threads: str, elapsed: float, latencies) -> None:
+    print(
+        f"{label:<8} {workers:>7} {threads:>7} {len(latencies) / elapsed:>8.1f}"
+        f" {_percentile(latencies, 50) * 1000:>8.1f}"
+        f" {_percentile(latencies, 99) * 1000:>8.1f}"
+    )
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, cpus // 2])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--backend", default="torch")
+    args = parser.parse_args()
+
+    print(f"{cpus} cores")
+    print(f"{'mode':<8} {'workers':>7} {'threads':>7} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+
+    inline = make_selector(args.backend)
+    inline.warmup()
+    run(inline, 1, 2)
+    _report("inline", "-", "-", *run(inline, args.clients, args.requests))
+    del inline
+
+    factory = functools.partial(make_selector, args.backend)
+    for workers in sorted(set(w for w in args.workers if w > 0)):
+        for threads in sorted(set(args.threads)):
+            with ProcessPoolSelector(factory, workers=workers, threads_per_worker=threads) as pool:
+                started = time.perf_counter()
+                pool.warmup()
+                startup = time.perf_counter() - started
+                run(pool, workers, 2)
+                elapsed, latencies = run(pool, args.clients, args.requests)
+            _report("pool", str(workers), str(threads), elapsed, latencies)
+            print(f"{'':<8} started in {startup:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
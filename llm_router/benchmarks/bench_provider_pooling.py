@@ -0,0 +1,107 @@
+"""Compare pooled and per-call provider connections.
+
+Run with ``python -m llm_router.benchmarks.bench_provider_pooling``. A local
+OpenAI-compatible stub server answers every completion immediately; each new
+connection is delayed by ``--handshake-ms`` to stand in for the TCP and TLS
+setup of a real endpoint. The same :class:`OpenAIProvider` is measured once
+with its pooled keep-alive client and once building a client per call.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from llm_router.providers import OpenAIProvider
+
+RESPONSE = {
+    "id": "chatcmpl-bench",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+}
+
+
+def make_handler(handshake: float):
+    body = json.dumps(RESPONSE).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        connections = 0
+
+        def setup(self):
+            # Called once per connection, not per request.
+            type(self).connections += 1
+            time.sleep(handshake)
+            super().setup()
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(provider: OpenAIProvider, iterations: int):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        provider.complete(model="gpt-4o-mini", prompt="ping")
+        timings.append(time.perf_counter() - start)
+    provider.close()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--handshake-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    handler = make_handler(args.handshake_ms / 1000)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_base = f"http://127.0.0.1:{server.server_port}/v1"
+
+    print(f"{'mode':<10} {'p50 ms':>8} {'p99 ms':>8} {'mean ms':>8} {'conns':>6}")
+    try:
+        for label, pooled in (("per-call", False), ("pooled", True)):
+            handler.connections = 0
+            provider = OpenAIProvider(api_base=api_base, pooled=pooled)
+            timings = run(provider, args.iterations)
+            print(
+                f"{label:<10} {_percentile(timings, 50) * 1000:>8.2f}"
+                f" {_percentile(timings, 99) * 1000:>8.2f}"
+                f" {statistics.mean(timings) * 1000:>8.2f} {handler.connections:>6}"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
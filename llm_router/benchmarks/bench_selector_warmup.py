@@ -0,0 +1,47 @@
+"""Benchmark the first routing decision against steady-state decisions.
+
+Run with ``python -m llm_router.benchmarks.bench_selector_warmup``. The first
+call pays for loading the zero-shot pipeline into the shared registry; every
+following call reuses it.
+"""
+
+import argparse
+import statistics
+import time
+
+from llm_router.selectors.classifier import HFZeroShotSelector
+from llm_router.selectors.registry import ModelRegistry
+
+PROMPTS = [
+    "hi",
+    "What is the capital of France?",
+    "Write a Python function that merges two sorted lists.",
+    "Explain how compound interest works on a savings account.",
+    "What are the early symptoms of type 2 diabetes?",
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    selector = HFZeroShotSelector(registry=ModelRegistry())
+
+    start = time.perf_counter()
+    selector.select_model(PROMPTS[0])
+    first = time.perf_counter() - start
+
+    timings = []
+    for i in range(args.iterations):
+        start = time.perf_counter()
+        selector.select_model(PROMPTS[i % len(PROMPTS)])
+        timings.append(time.perf_counter() - start)
+
+    print(f"first decision (cold load): {first * 1000:.1f} ms")
+    print(f"steady state mean:          {statistics.mean(timings) * 1000:.1f} ms")
+    print(f"steady state median:        {statistics.median(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
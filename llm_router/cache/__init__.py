@@ -0,0 +1,32 @@
+from typing import TYPE_CHECKING
+
+from llm_router.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import KeyedResponseCache, ResponseCache, make_cache_key, normalize_prompt
+    from .memory import InMemoryResponseCache
+    from .sqlite import SQLiteResponseCache
+    from .semantic import SemanticCache, SentenceEncoder
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ResponseCache": ".base",
+    "KeyedResponseCache": ".base",
+    "make_cache_key": ".base",
+    "normalize_prompt": ".base",
+    "InMemoryResponseCache": ".memory",
+    "SQLiteResponseCache": ".sqlite",
+    "SemanticCache": ".semantic",
+    "SentenceEncoder": ".semantic",
+})
+
+
+__all__ = [
+    "ResponseCache",
+    "KeyedResponseCache",
+    "make_cache_key",
+    "normalize_prompt",
+    "InMemoryResponseCache",
+    "SQLiteResponseCache",
+    "SemanticCache",
+    "SentenceEncoder",
+]
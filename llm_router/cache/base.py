@@ -0,0 +1,78 @@
+"""Common interface for response caches."""
+from __future__ import annotations
+
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from llm_router.providers.base import ProviderResponse
+
+_LINE_ENDING = re.compile(r"\r\n?")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Strip the ends of ``prompt`` and convert its line endings to ``\\n``.
+
+    Inner whitespace is kept: indentation and spacing can change the answer,
+    e.g. for code or tables.
+    """
+    return _LINE_ENDING.sub("\n", prompt).strip()
+
+
+def make_cache_key(provider: str, model: str, prompt: str) -> str:
+    """Return the cache key for a (provider, model, normalized prompt) triple."""
+    raw = "\x00".join((provider, model, normalize_prompt(prompt)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResponseCache(ABC):
+    """Cache of provider responses looked up by (provider, model, prompt).
+
+    This is the interface the router uses. :class:`KeyedResponseCache` is
+    the base of exact-match backends; other caches, such as the semantic
+    cache, match prompts their own way.
+    """
+
+    @abstractmethod
+    def lookup(self, provider: str, model: str, prompt: str) -> Optional[ProviderResponse]:
+        """Return the cached response for the request or ``None``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def store(self, provider: str, model: str, prompt: str, response: ProviderResponse) -> None:
+        """Cache ``response`` for the request, evicting entries if needed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class KeyedResponseCache(ResponseCache):
+    """Exact-match cache of provider responses.
+
+    Backends store :class:`ProviderResponse` objects under keys built by
+    :func:`make_cache_key` and enforce their own eviction limits.
+    """
+
+    def lookup(self, provider: str, model: str, prompt: str) -> Optional[ProviderResponse]:
+        return self.get(make_cache_key(provider, model, prompt))
+
+    def store(self, provider: str, model: str, prompt: str, response: ProviderResponse) -> None:
+        self.set(make_cache_key(provider, model, prompt), response)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ProviderResponse]:
+        """Return the cached response for ``key`` or ``None``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, response: ProviderResponse) -> None:
+        """Store ``response`` under ``key``, evicting entries if needed."""
+        raise NotImplementedError
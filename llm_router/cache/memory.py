@@ -0,0 +1,72 @@
+"""In-memory LRU response cache with optional TTL."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from llm_router.providers.base import ProviderResponse
+from .base import KeyedResponseCache
+
+
+class InMemoryResponseCache(KeyedResponseCache):
+    """Least-recently-used cache bounded by entry count and total bytes.
+
+    Args:
+        max_entries: Maximum number of cached responses.
+        max_bytes: Optional cap on the summed size of the serialized responses.
+        ttl: Optional time-to-live in seconds; expired entries are dropped on
+            access.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, Tuple[ProviderResponse, int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ProviderResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, size, created = entry
+            if self.ttl is not None and time.monotonic() - created > self.ttl:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: ProviderResponse) -> None:
+        size = len(response.model_dump_json())
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (response, size, time.monotonic())
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.total_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.total_bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
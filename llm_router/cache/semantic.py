@@ -0,0 +1,329 @@
+"""Embedding-similarity cache for routing decisions and responses."""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fyras_models import SelectorVote
+from llm_router.providers.base import ProviderResponse
+from llm_router.schemas.responses import RoutingVote
+from llm_router.selectors.registry import ModelRegistry, default_registry
+from .base import ResponseCache, make_cache_key, normalize_prompt
+
+logger = logging.getLogger(__name__)
+
+Encoder = Callable[[Sequence[str]], np.ndarray]
+
+
+class SentenceEncoder:
+    """Small local sentence encoder returning unit-length float32 vectors.
+
+    The ``sentence-transformers`` model is loaded once through the shared
+    :class:`ModelRegistry`. Install the ``semantic`` extra to use it.
+    """
+
+    task = "sentence-embedding"
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        registry: ModelRegistry | None = None,
+    ) -> None:
+        self.model_name = model_name
+        self.registry = registry or default_registry
+
+    def _load(self):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "SentenceEncoder requires sentence-transformers; install the "
+                "'semantic' extra."
+            ) from exc
+        return SentenceTransformer(self.model_name, device="cpu")
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        model = self.registry.get(
+            self.registry.make_key(self.task, self.model_name), self._load
+        )
+        vectors = model.encode(list(texts), convert_to_numpy=True)
+        return normalize_rows(vectors)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length so dot products are cosine similarities."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class SemanticCache(ResponseCache):
+    """Cache that matches prompts by cosine similarity of their embeddings.
+
+    Prompt vectors are normalized and kept in a ``(capacity, dim)`` float32
+    matrix, so a lookup is a single matrix-vector product. Each row can hold a
+    :class:`SelectorVote` and any number of provider responses. When ``path``
+    is given the matrix is a memory-mapped file and the entries are written
+    next to it by :meth:`save`, so a restarted worker starts warm. Entries
+    stored since the last :meth:`save` are lost on restart, so call it
+    periodically and at shutdown. Once full, the oldest rows are overwritten.
+
+    Exact repeats are answered from a hash lookup before any embedding is
+    computed.
+
+    Args:
+        encoder: Callable mapping a list of texts to a 2D array of vectors.
+            Defaults to :class:`SentenceEncoder`.
+        threshold: Minimum cosine similarity to reuse a cached vote.
+        response_threshold: Minimum similarity to reuse a cached response;
+            kept stricter than ``threshold`` because near-duplicates may still
+            need different answers.
+        capacity: Maximum number of prompts kept in the index.
+        path: Optional directory for the persistent index.
+    """
+
+    vectors_file = "vectors.f32"
+    entries_file = "entries.json"
+
+    def __init__(
+        self,
+        encoder: Encoder | None = None,
+        threshold: float = 0.92,
+        response_threshold: float = 0.98,
+        capacity: int = 100_000,
+        path: Path | str | None = None,
+    ) -> None:
+        self.encoder = encoder or SentenceEncoder()
+        self.threshold = threshold
+        self.response_threshold = response_threshold
+        self.capacity = capacity
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+
+        self.dim: Optional[int] = None
+        self.count = 0
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._exact: Dict[str, Tuple[int, str]] = {}
+        self._embeddings: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.RLock()
+
+        if self.path is not None and (self.path / self.entries_file).exists():
+            self._load()
+
+    # ------------------------------------------------------------------
+    # Index storage
+    # ------------------------------------------------------------------
+    def _allocate(self, dim: int) -> None:
+        self.dim = dim
+        if self.path is None:
+            self._vectors = np.zeros((self.capacity, dim), dtype=np.float32)
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._vectors = np.memmap(
+            self.path / self.vectors_file,
+            dtype=np.float32,
+            mode="w+",
+            shape=(self.capacity, dim),
+        )
+
+    def _load(self) -> None:
+        meta = json.loads((self.path / self.entries_file).read_text())
+        if meta["capacity"] != self.capacity:
+            logger.warning(
+                "Ignoring semantic index at %s built with capacity %s",
+                self.path,
+                meta["capacity"],
+            )
+            return
+        self.dim = meta["dim"]
+        self.count = meta["count"]
+        self._vectors = np.memmap(
+            self.path / self.vectors_file,
+            dtype=np.float32,
+            mode="r+",
+            shape=(self.capacity, self.dim),
+        )
+        for row, entry in enumerate(meta["entries"]):
+            self._entries[row] = entry
+            if entry is None:
+                continue
+            for slot, cached in entry["responses"].items():
+                self._exact[cached["key"]] = (row, slot)
+            if entry.get("vote_key"):
+                self._exact[entry["vote_key"]] = (row, "vote")
+
+    def save(self) -> None:
+        """Flush vectors and entries so the index survives a restart."""
+        if self.path is None or self._vectors is None:
+            return
+        with self._lock:
+            self._vectors.flush()
+            meta = {
+                "dim": self.dim,
+                "capacity": self.capacity,
+                "count": self.count,
+                "entries": self._entries,
+            }
+            tmp = self.path / (self.entries_file + ".tmp")
+            tmp.write_text(json.dumps(meta))
+            tmp.replace(self.path / self.entries_file)
+
+    # ------------------------------------------------------------------
+    # Similarity search
+    # ------------------------------------------------------------------
+    def embed(self, prompt: str) -> np.ndarray:
+        """Return the unit vector for ``prompt``, reusing recent embeddings."""
+        text = normalize_prompt(prompt)
+        with self._lock:
+            vector = self._embeddings.get(text)
+            if vector is not None:
+                self._embeddings.move_to_end(text)
+                return vector
+        vector = normalize_rows(self.encoder([text]))[0]
+        with self._lock:
+            self._embeddings[text] = vector
+            while len(self._embeddings) > 256:
+                self._embeddings.popitem(last=False)
+        return vector
+
+    def nearest(self, prompt: str) -> Tuple[Optional[int], float]:
+        """Return the most similar row and its cosine similarity."""
+        vector = self.embed(prompt)
+        with self._lock:
+            filled = min(self.count, self.capacity)
+            if self._vectors is None or filled == 0:
+                return None, 0.0
+            scores = self._vectors[:filled] @ vector
+            row = int(np.argmax(scores))
+            return row, float(scores[row])
+
+    def _row_for(self, prompt: str) -> int:
+        """Return the row for ``prompt``, adding a new one if nothing matches exactly."""
+        vector = self.embed(prompt)
+        with self._lock:
+            if self._vectors is None:
+                self._allocate(vector.shape[0])
+            filled = min(self.count, self.capacity)
+            if filled:
+                scores = self._vectors[:filled] @ vector
+                row = int(np.argmax(scores))
+                if scores[row] >= 0.9999:
+                    return row
+            row = self.count % self.capacity
+            self._evict_row(row)
+            self._vectors[row] = vector
+            self._entries[row] = {"vote": None, "vote_key": None, "responses": {}}
+            self.count += 1
+            return row
+
+    def _evict_row(self, row: int) -> None:
+        entry = self._entries[row]
+        if entry is None:
+            return
+        for cached in entry["responses"].values():
+            self._exact.pop(cached["key"], None)
+        if entry.get("vote_key"):
+            self._exact.pop(entry["vote_key"], None)
+        self._entries[row] = None
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    # ------------------------------------------------------------------
+    # Routing decisions
+    # ------------------------------------------------------------------
+    def lookup_vote(self, prompt: str) -> Optional[SelectorVote]:
+        exact = self._exact.get(make_cache_key("", "", prompt))
+        if exact is not None:
+            entry = self._entries[exact[0]]
+            if entry is not None and entry["vote"] is not None:
+                self._record(True)
+                return RoutingVote.model_validate(entry["vote"])
+
+        row, score = self.nearest(prompt)
+        entry = self._entries[row] if row is not None else None
+        if entry is None or entry["vote"] is None or score < self.threshold:
+            self._record(False)
+            return None
+        self._record(True)
+        return RoutingVote.model_validate(entry["vote"])
+
+    def store_vote(self, prompt: str, vote: SelectorVote) -> None:
+        row = self._row_for(prompt)
+        key = make_cache_key("", "", prompt)
+        with self._lock:
+            entry = self._entries[row]
+            if entry["vote_key"]:
+                self._exact.pop(entry["vote_key"], None)
+            entry["vote"] = vote.model_dump()
+            entry["vote_key"] = key
+            self._exact[key] = (row, "vote")
+
+    # ------------------------------------------------------------------
+    # ResponseCache interface
+    # ------------------------------------------------------------------
+    def lookup(self, provider: str, model: str, prompt: str) -> Optional[ProviderResponse]:
+        response = self.get(make_cache_key(provider, model, prompt))
+        if response is not None:
+            self._record(True)
+            return response
+
+        slot = f"{provider}/{model}"
+        row, score = self.nearest(prompt)
+        entry = self._entries[row] if row is not None else None
+        if entry is None or slot not in entry["responses"] or score < self.response_threshold:
+            self._record(False)
+            return None
+        self._record(True)
+        return ProviderResponse.model_validate(entry["responses"][slot]["response"])
+
+    def store(self, provider: str, model: str, prompt: str, response: ProviderResponse) -> None:
+        row = self._row_for(prompt)
+        key = make_cache_key(provider, model, prompt)
+        slot = f"{provider}/{model}"
+        with self._lock:
+            entry = self._entries[row]
+            previous = entry["responses"].get(slot)
+            if previous is not None:
+                self._exact.pop(previous["key"], None)
+            entry["responses"][slot] = {"key": key, "response": response.model_dump()}
+            self._exact[key] = (row, slot)
+
+    def get(self, key: str) -> Optional[ProviderResponse]:
+        """Return the response stored under a :func:`make_cache_key` key, if any."""
+        with self._lock:
+            location = self._exact.get(key)
+            if location is None or location[1] == "vote":
+                return None
+            row, slot = location
+            entry = self._entries[row]
+            if entry is None or slot not in entry["responses"]:
+                return None
+            return ProviderResponse.model_validate(entry["responses"][slot]["response"])
+
+    def clear(self) -> None:
+        with self._lock:
+            self.count = 0
+            self._entries = [None] * self.capacity
+            self._exact.clear()
+            self._embeddings.clear()
+            if self._vectors is not None:
+                self._vectors[:] = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
@@ -0,0 +1,184 @@
+"""On-disk response cache backed by SQLite."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from llm_router.providers.base import ProviderResponse
+from .base import KeyedResponseCache
+
+
+class SQLiteResponseCache(KeyedResponseCache):
+    """Persistent LRU cache stored in a SQLite database.
+
+    Entries survive process restarts and can be shared by several workers on
+    the same host. Eviction removes the least recently accessed rows once the
+    entry or byte limit is exceeded. The entry count and byte total are kept
+    in a one-row table that triggers update in the same transaction as each
+    insert, replace and delete, so a store doesn't scan the table to check
+    the limits.
+
+    Hits don't write to the database: their access times are kept in memory
+    and written in one transaction once ``access_batch`` keys have been hit,
+    and before each store or close. Other processes sharing the file see
+    them only then.
+
+    Args:
+        path: Database file; created if missing.
+        max_entries: Maximum number of cached responses.
+        max_bytes: Optional cap on the summed size of the stored responses.
+        ttl: Optional time-to-live in seconds.
+        access_batch: Number of hit keys whose access times are buffered
+            before they are written.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_entries: int = 100_000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        access_batch: int = 100,
+    ) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.access_batch = access_batch
+        self._accessed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+        self._create_totals()
+
+    def _create_totals(self) -> None:
+        """Create the totals row and its triggers, counting existing rows once."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses_totals ("
+            " id INTEGER PRIMARY KEY CHECK (id = 0),"
+            " entries INTEGER NOT NULL,"
+            " bytes INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO responses_totals (id, entries, bytes)"
+            " SELECT 0, COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN"
+            " UPDATE responses_totals SET entries = entries + 1, bytes = bytes + new.size;"
+            " END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN"
+            " UPDATE responses_totals SET entries = entries - 1, bytes = bytes - old.size;"
+            " END"
+        )
+        self._conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS responses_resize AFTER UPDATE OF size ON responses BEGIN"
+            " UPDATE responses_totals SET bytes = bytes + new.size - old.size;"
+            " END"
+        )
+        self._conn.commit()
+
+    def _totals(self) -> Tuple[int, int]:
+        return self._conn.execute("SELECT entries, bytes FROM responses_totals").fetchone()
+
+    def get(self, key: str) -> Optional[ProviderResponse]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created = row
+            if self.ttl is not None and now - created > self.ttl:
+                self._accessed.pop(key, None)
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._accessed[key] = now
+            if len(self._accessed) >= self.access_batch:
+                self._flush_accessed()
+                self._conn.commit()
+        return ProviderResponse.model_validate_json(value)
+
+    def set(self, key: str, response: ProviderResponse) -> None:
+        value = response.model_dump_json()
+        size = len(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._flush_accessed()
+            # An upsert rather than INSERT OR REPLACE: REPLACE's implicit
+            # delete doesn't fire the totals trigger.
+            self._conn.execute(
+                "INSERT INTO responses (key, value, size, created, accessed)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value,"
+                " size = excluded.size, created = excluded.created, accessed = excluded.accessed",
+                (key, value, size, now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _flush_accessed(self) -> None:
+        """Write the buffered access times; the caller commits."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _evict(self) -> None:
+        count, total = self._totals()
+        if count <= self.max_entries and (self.max_bytes is None or total <= self.max_bytes):
+            return
+        # Walk the oldest rows lazily; only as many as need evicting are read.
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        )
+        stale = []
+        for key, size in rows:
+            if count <= self.max_entries and (self.max_bytes is None or total <= self.max_bytes):
+                break
+            stale.append((key,))
+            count -= 1
+            total -= size
+        rows.close()
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._totals()[0]
@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING
+
+from llm_router.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import BaseCouncil
+    from .iterative import IterativeCouncil
+    from .parallel import ParallelCouncil
+    from .random import RandomCouncil
+    from .weighted import UnanimousCouncil, WeightedCouncil
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BaseCouncil': '.base',
+    'RandomCouncil': '.random',
+    'WeightedCouncil': '.weighted',
+    'UnanimousCouncil': '.weighted',
+    'ParallelCouncil': '.parallel',
+    'IterativeCouncil': '.iterative',
+})
+
+__all__ = [
+    'BaseCouncil',
+    'RandomCouncil',
+    'WeightedCouncil',
+    'UnanimousCouncil',
+    'ParallelCouncil',
+    'IterativeCouncil',
+]
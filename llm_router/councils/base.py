@@ -0,0 +1,183 @@
+"""Shared fan-out and vote tallying for councils."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from fyras_models import CouncilDecision, SelectorVote
+from llm_router.exceptions.exceptions import CouncilError
+from llm_router.schemas.abstractions import Selector
+
+logger = logging.getLogger(__name__)
+
+
+def _name(selector: Selector) -> str:
+    return type(selector).__name__
+
+
+class BaseCouncil(ABC):
+    """Ask several selectors for a vote and aggregate their answers.
+
+    :meth:`collect` submits ``select_model`` to every selector at once, so
+    the decision takes as long as the slowest selector instead of the sum of
+    all of them. A selector that hasn't answered within ``timeout`` seconds,
+    or that raises, is left out of the decision and listed in
+    ``metadata["timed_out"]`` or ``metadata["failed"]``.
+    :class:`CouncilError` is raised only when no selector voted.
+
+    Each selector runs on its own pool of ``max_workers`` threads, so a hung
+    selector can't hold the threads of the others. A timed-out call keeps
+    its thread until it returns; while all of a selector's threads are held
+    by such calls, the selector is reported as timed out without being
+    asked.
+
+    Subclasses implement :meth:`choose`, which picks the final model from the
+    collected votes and their summed weights.
+
+    Args:
+        selectors: Selectors to consult.
+        weights: Optional per-selector multipliers of each vote's own
+            ``weight``, aligned with ``selectors``. Defaults to 1.0 each.
+        timeout: Optional seconds to wait for the selectors.
+        max_workers: Threads per selector, i.e. how many decisions can ask
+            one selector concurrently.
+    """
+
+    def __init__(
+        self,
+        selectors: Sequence[Selector],
+        weights: Optional[Sequence[float]] = None,
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if not selectors:
+            raise CouncilError("A council needs at least one selector")
+        if weights is not None and len(weights) != len(selectors):
+            raise CouncilError(
+                f"Got {len(weights)} weights for {len(selectors)} selectors"
+            )
+        self.selectors = list(selectors)
+        self.weights = list(weights) if weights is not None else [1.0] * len(self.selectors)
+        self.timeout = timeout
+        self.max_workers = max_workers or 4
+        self._pools: List[Optional[ThreadPoolExecutor]] = [None] * len(self.selectors)
+        # Timed-out calls still running, per selector.
+        self._stuck: List[Set[Future]] = [set() for _ in self.selectors]
+        self._pool_lock = threading.Lock()
+
+    def _executor(self, index: int) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            pool = self._pools[index]
+            if pool is None:
+                pool = self._pools[index] = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"llm-router-council-{_name(self.selectors[index])}",
+                )
+            return pool
+
+    def _submit(self, index: int, prompt: str) -> Optional[Future]:
+        """Ask one selector, or return ``None`` if all its threads are stuck."""
+        with self._pool_lock:
+            stuck = self._stuck[index]
+            stuck.difference_update([future for future in stuck if future.done()])
+            if len(stuck) >= self.max_workers:
+                return None
+        return self._executor(index).submit(self._vote, index, prompt)
+
+    def _vote(self, index: int, prompt: str) -> SelectorVote:
+        vote = self.selectors[index].select_model(prompt)
+        weight = self.weights[index]
+        return vote if weight == 1.0 else vote.model_copy(update={"weight": vote.weight * weight})
+
+    def collect(
+        self, prompt: str, indices: Optional[Sequence[int]] = None
+    ) -> Tuple[List[SelectorVote], Dict[str, List[str]]]:
+        """Query the selectors at ``indices`` (all by default) concurrently.
+
+        Returns the votes in selector order and the names of the selectors
+        that ``timed_out`` or ``failed``.
+        """
+        indices = range(len(self.selectors)) if indices is None else indices
+        futures: List[Tuple[int, Optional[Future]]] = [(i, self._submit(i, prompt)) for i in indices]
+        wait([future for _, future in futures if future is not None], timeout=self.timeout)
+
+        votes: List[SelectorVote] = []
+        missing: Dict[str, List[str]] = {"timed_out": [], "failed": []}
+        for i, future in futures:
+            name = _name(self.selectors[i])
+            if future is None:
+                missing["timed_out"].append(name)
+            elif not future.done():
+                if not future.cancel():
+                    with self._pool_lock:
+                        self._stuck[i].add(future)
+                logger.warning("Selector %s timed out after %ss", name, self.timeout)
+                missing["timed_out"].append(name)
+            elif future.exception() is not None:
+                logger.warning("Selector %s failed: %s", name, future.exception())
+                missing["failed"].append(name)
+            else:
+                votes.append(future.result())
+        return votes, missing
+
+    @staticmethod
+    def tally(votes: Sequence[SelectorVote]) -> Dict[str, float]:
+        """Sum the vote weights per model."""
+        totals: Dict[str, float] = defaultdict(float)
+        for vote in votes:
+            totals[vote.model] += vote.weight
+        return dict(totals)
+
+    @abstractmethod
+    def choose(self, votes: List[SelectorVote], weighted_results: Dict[str, float]) -> str:
+        """Return the final model for non-empty ``votes``."""
+
+    def decide(self, prompt: str) -> CouncilDecision:
+        start = time.perf_counter()
+        votes, missing = self.collect(prompt)
+        return self._decision(prompt, votes, missing, start)
+
+    def _decision(
+        self,
+        prompt: str,
+        votes: List[SelectorVote],
+        missing: Dict[str, List[str]],
+        start: float,
+        **extra: str,
+    ) -> CouncilDecision:
+        if not votes:
+            raise CouncilError(
+                f"No selector voted ({len(missing['timed_out'])} timed out, "
+                f"{len(missing['failed'])} failed)",
+                votes=[],
+            )
+        weighted_results = self.tally(votes)
+        metadata = {
+            "council": type(self).__name__,
+            "prompt_length": str(len(prompt)),
+            "decision_time": f"{time.perf_counter() - start:.6f}",
+            **extra,
+        }
+        for key, names in missing.items():
+            if names:
+                metadata[key] = ",".join(names)
+        return CouncilDecision(
+            final_model=self.choose(votes, weighted_results),
+            votes=votes,
+            weighted_results=weighted_results,
+            metadata=metadata,
+        )
+
+    def close(self) -> None:
+        """Shut the fan-out pools down without waiting for stuck selectors."""
+        with self._pool_lock:
+            for pool in self._pools:
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._pools = [None] * len(self.selectors)
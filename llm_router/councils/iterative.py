@@ -0,0 +1,68 @@
+"""Council that consults selectors in rounds until a model has a clear lead."""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence
+
+from fyras_models import CouncilDecision, SelectorVote
+from llm_router.councils.base import BaseCouncil
+from llm_router.schemas.abstractions import Selector
+
+
+class IterativeCouncil(BaseCouncil):
+    """Query selectors in rounds and stop once a model has enough weight.
+
+    Selectors are consulted in the given order, ``round_size`` at a time
+    (each round fans out concurrently), so cheap selectors should come
+    first. After every round the decision is final if one model holds at
+    least ``threshold`` of the weight of every selector (each assumed to
+    vote with weight 1.0 times its multiplier); above one half the remaining
+    selectors can no longer outvote it. Otherwise the weighted leader after the last
+    round wins. ``metadata["rounds"]`` records how many rounds ran.
+
+    Args:
+        selectors: Selectors in the order they are consulted.
+        threshold: Share of the total weight that ends the vote early.
+        round_size: Selectors queried concurrently per round.
+        **kwargs: ``weights``, ``timeout`` and ``max_workers`` as for
+            :class:`BaseCouncil`; ``timeout`` applies to each round.
+    """
+
+    def __init__(
+        self,
+        selectors: Sequence[Selector],
+        threshold: float = 0.5,
+        round_size: int = 1,
+        **kwargs,
+    ) -> None:
+        super().__init__(selectors, **kwargs)
+        self.threshold = threshold
+        self.round_size = max(1, round_size)
+
+    def _leader(self, weighted_results: Dict[str, float]) -> Optional[str]:
+        if not weighted_results:
+            return None
+        return max(weighted_results, key=weighted_results.__getitem__)
+
+    def choose(self, votes: List[SelectorVote], weighted_results: Dict[str, float]) -> str:
+        return self._leader(weighted_results)
+
+    def decide(self, prompt: str) -> CouncilDecision:
+        start = time.perf_counter()
+        total = sum(self.weights)
+        votes: List[SelectorVote] = []
+        missing: Dict[str, List[str]] = {"timed_out": [], "failed": []}
+        rounds = 0
+        for first in range(0, len(self.selectors), self.round_size):
+            rounds += 1
+            indices = range(first, min(first + self.round_size, len(self.selectors)))
+            round_votes, round_missing = self.collect(prompt, indices)
+            votes.extend(round_votes)
+            for key, names in round_missing.items():
+                missing[key].extend(names)
+            weighted_results = self.tally(votes)
+            leader = self._leader(weighted_results)
+            if leader is not None and weighted_results[leader] >= self.threshold * total:
+                break
+        return self._decision(prompt, votes, missing, start, rounds=str(rounds))
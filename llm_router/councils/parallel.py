@@ -0,0 +1,21 @@
+"""Council that queries every selector at once and takes the majority."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, List
+
+from fyras_models import SelectorVote
+from llm_router.councils.base import BaseCouncil
+
+
+class ParallelCouncil(BaseCouncil):
+    """Choose the model named by the most votes.
+
+    Every vote counts once regardless of its weight; ties are broken by the
+    summed weight, then by selector order.
+    """
+
+    def choose(self, votes: List[SelectorVote], weighted_results: Dict[str, float]) -> str:
+        counts = Counter(vote.model for vote in votes)
+        return max(weighted_results, key=lambda model: (counts[model], weighted_results[model]))
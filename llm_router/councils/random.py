@@ -0,0 +1,38 @@
+"""Council that draws the final model at random, weighted by the votes."""
+
+from __future__ import annotations
+
+import random
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from fyras_models import SelectorVote
+from llm_router.councils.base import BaseCouncil
+from llm_router.schemas.abstractions import Selector
+
+
+class RandomCouncil(BaseCouncil):
+    """Pick a voted model with probability proportional to its total weight.
+
+    Useful to spread traffic over the models the selectors consider suitable,
+    e.g. to collect latency and cost figures for all of them.
+
+    Args:
+        selectors: Selectors to consult.
+        seed: Optional seed for reproducible draws.
+        **kwargs: ``weights``, ``timeout`` and ``max_workers`` as for
+            :class:`BaseCouncil`.
+    """
+
+    def __init__(self, selectors: Sequence[Selector], seed: Optional[int] = None, **kwargs) -> None:
+        super().__init__(selectors, **kwargs)
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def choose(self, votes: List[SelectorVote], weighted_results: Dict[str, float]) -> str:
+        models = list(weighted_results)
+        weights = [max(weight, 0.0) for weight in weighted_results.values()]
+        with self._random_lock:
+            if sum(weights) <= 0:
+                return self._random.choice(models)
+            return self._random.choices(models, weights=weights)[0]
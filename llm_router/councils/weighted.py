@@ -0,0 +1,49 @@
+"""Councils deciding by summed vote weight or by unanimity."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from fyras_models import SelectorVote
+from llm_router.councils.base import BaseCouncil
+from llm_router.exceptions.exceptions import CouncilError
+from llm_router.schemas.abstractions import Selector
+
+
+class WeightedCouncil(BaseCouncil):
+    """Choose the model with the highest summed weight.
+
+    Each vote counts with its own ``weight`` (e.g. the classifier's score)
+    times its selector's entry in ``weights``. Ties go to the model voted
+    first in selector order.
+    """
+
+    def choose(self, votes: List[SelectorVote], weighted_results: Dict[str, float]) -> str:
+        return max(weighted_results, key=weighted_results.__getitem__)
+
+
+class UnanimousCouncil(BaseCouncil):
+    """Choose a model only when every selector that voted agrees on it.
+
+    Args:
+        selectors: Selectors to consult.
+        fallback_model: Model used when the votes disagree. Without it the
+            council raises :class:`CouncilError`.
+        **kwargs: ``weights``, ``timeout`` and ``max_workers`` as for
+            :class:`BaseCouncil`.
+    """
+
+    def __init__(
+        self, selectors: Sequence[Selector], fallback_model: Optional[str] = None, **kwargs
+    ) -> None:
+        super().__init__(selectors, **kwargs)
+        self.fallback_model = fallback_model
+
+    def choose(self, votes: List[SelectorVote], weighted_results: Dict[str, float]) -> str:
+        if len(weighted_results) == 1:
+            return next(iter(weighted_results))
+        if self.fallback_model is None:
+            raise CouncilError(
+                f"Selectors disagree: {sorted(weighted_results)}", votes=list(votes)
+            )
+        return self.fallback_model
@@ -58,3 +58,17 @@ class ProviderCostError(ProviderError):
 
     def __init__(self, message: str, model: str | None = None, **kwargs):
         super().__init__(message, model=model, **kwargs)
+
+
+class RateLimitExceededError(ProviderError):
+    """Raised when a request would wait longer than allowed for its rate limit."""
+
+    def __init__(self, message: str, model: str | None = None, **kwargs):
+        super().__init__(message, model=model, **kwargs)
+
+
+class CircuitOpenError(ProviderError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+
+    def __init__(self, message: str, model: str | None = None, **kwargs):
+        super().__init__(message, model=model, **kwargs)
@@ -1,13 +1,43 @@
-from .base import Provider, ProviderResponse
-from .anthropic import AnthropicProvider
-from .openai import OpenAIProvider
-from .google import GoogleProvider
+from typing import TYPE_CHECKING
+
+from llm_router.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import Provider, ProviderResponse, ProviderStreamSummary
+    from .anthropic import AnthropicProvider
+    from .openai import OpenAIProvider
+    from .google import GoogleProvider
+    from .pricing import ModelPrice, PriceTier, PricingTable
+    from .ratelimit import ModelLimits, RateLimiter, TokenBucket
+
+# Providers pull in LiteLLM, so they are imported on first access.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Provider": ".base",
+    "ProviderResponse": ".base",
+    "ProviderStreamSummary": ".base",
+    "AnthropicProvider": ".anthropic",
+    "OpenAIProvider": ".openai",
+    "GoogleProvider": ".google",
+    "ModelLimits": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "TokenBucket": ".ratelimit",
+    "ModelPrice": ".pricing",
+    "PriceTier": ".pricing",
+    "PricingTable": ".pricing",
+})
 
 
 __all__ = [
     "Provider",
     "ProviderResponse",
+    "ProviderStreamSummary",
     "AnthropicProvider",
     "OpenAIProvider",
     "GoogleProvider",
+    "ModelLimits",
+    "RateLimiter",
+    "TokenBucket",
+    "ModelPrice",
+    "PriceTier",
+    "PricingTable",
 ]
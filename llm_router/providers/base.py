@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
 
+import httpx
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
+from llm_router.exceptions.exceptions import (
+    ProviderCompletionError,
+    ProviderCostError,
+    ProviderError,
+)
 from llm_router.schemas.env_validator import EnvVarError
+from llm_router.schemas.config import TOPIC_TO_MODEL
+from .pricing import PricingTable
+from .ratelimit import RateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -22,6 +37,68 @@ class ProviderResponse(BaseModel):
     completion_tokens: int
 
 
+class ProviderStreamSummary(ProviderResponse):
+    """Final record yielded by :meth:`Provider.stream` once the stream ends."""
+
+    cost: float
+    time_to_first_token: Optional[float] = None
+    latency: float
+
+
+# LiteLLM takes seconds to import, so it is loaded on the first request
+# rather than with this module.
+def completion(*args: Any, **kwargs: Any) -> Any:
+    import litellm
+
+    return litellm.completion(*args, **kwargs)
+
+
+async def acompletion(*args: Any, **kwargs: Any) -> Any:
+    import litellm
+
+    return await litellm.acompletion(*args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _pooled_async_handler() -> type:
+    """Return LiteLLM's async HTTP handler, made to wrap a given client.
+
+    ``AsyncHTTPHandler`` builds its own httpx client in ``__init__`` and
+    takes no client argument; replacing it afterwards would leave that
+    client unclosed. The subclass hands ``create_client`` the pooled client
+    instead, so the handler owns it and closes it on ``close()``.
+    """
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
+
+    class PooledAsyncHTTPHandler(AsyncHTTPHandler):
+        def __init__(self, client: httpx.AsyncClient, **kwargs: Any) -> None:
+            self._pooled_client = client
+            super().__init__(**kwargs)
+
+        def create_client(self, *args: Any, **kwargs: Any) -> httpx.AsyncClient:
+            return self._pooled_client
+
+    return PooledAsyncHTTPHandler
+
+
+def stream_chunk_builder(*args: Any, **kwargs: Any) -> Any:
+    import litellm
+
+    return litellm.stream_chunk_builder(*args, **kwargs)
+
+
+@lru_cache(maxsize=None)
+def _model_info(model: str) -> Optional[Dict[str, Any]]:
+    """Return LiteLLM's model-map entry for ``model``, looked up once."""
+    import litellm
+
+    try:
+        return dict(litellm.get_model_info(model))
+    except Exception:
+        logger.debug("No model info for %s", model)
+        return None
+
+
 class Provider(ABC):
     """Abstract base class for LLM providers.
 
@@ -29,12 +106,47 @@ class Provider(ABC):
     the environment variable LiteLLM expects for authentication. During
     initialization we optionally load variables from a ``.env`` file and ensure
     the required key is present, raising a detailed :class:`EnvVarError` if not.
+
+    Completion, streaming and cost calculation are implemented here on top of
+    LiteLLM. Each provider instance owns persistent keep-alive HTTP clients
+    (one sync client, plus one async client per event loop) that are handed to
+    LiteLLM on every call, so connections and TLS sessions are reused instead
+    of being set up per request.
+
+    Args:
+        env_path: Optional ``.env`` file to load.
+        pool_size: Maximum number of pooled connections per client.
+        timeout: Overall request timeout in seconds.
+        connect_timeout: Timeout for establishing a connection.
+        keepalive_expiry: Seconds an idle pooled connection is kept open.
+        pooled: When ``False`` a fresh client is built and closed for every
+            call. Only useful as a baseline for benchmarks.
+        api_base: Optional override of the provider endpoint, e.g. a proxy.
+        rate_limiter: Optional :class:`RateLimiter` with this provider's
+            RPM/TPM limits. Every call waits for its reservation first.
+        pricing: Optional :class:`PricingTable`. By default the prices of
+            this provider's models in ``TOPIC_TO_MODEL`` are resolved once at
+            initialization.
     """
 
     #: Name of the environment variable used for the provider API key
     api_key_env: str
 
-    def __init__(self, env_path: Path | None = None) -> None:
+    #: Default endpoint, used for connection warmup
+    default_api_base: Optional[str] = None
+
+    def __init__(
+        self,
+        env_path: Path | None = None,
+        pool_size: int = 20,
+        timeout: float = 60.0,
+        connect_timeout: float = 5.0,
+        keepalive_expiry: float = 60.0,
+        pooled: bool = True,
+        api_base: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        pricing: Optional[PricingTable] = None,
+    ) -> None:
         self.env_path = env_path
         if env_path:
             if not env_path.exists():
@@ -51,18 +163,342 @@ class Provider(ABC):
                 f" file at {env_path}."
             )
 
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.keepalive_expiry = keepalive_expiry
+        self.pooled = pooled
+        self.api_base = api_base
+        self.rate_limiter = rate_limiter
+        self.pricing = pricing or PricingTable.for_models(
+            {models[self.name] for models in TOPIC_TO_MODEL.values() if self.name in models}
+        )
+        self._sync_client: Any = None
+        # httpx async connections are bound to the loop that opened them.
+        # Not a WeakKeyDictionary: open connections reference their loop, so
+        # the entries would never be collected. Closed loops are pruned.
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+        self._client_lock = threading.Lock()
+        self._last_used = float("-inf")
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Human readable provider name."""
         raise NotImplementedError
 
-    @abstractmethod
+    # ------------------------------------------------------------------
+    # HTTP clients
+    # ------------------------------------------------------------------
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def http_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout)
+
+    def _build_client(self, asynchronous: bool) -> Any:
+        """Return the object LiteLLM accepts as ``client`` for this provider.
+
+        The default wraps a pooled httpx client in LiteLLM's HTTP handler, which
+        is what the Anthropic and Gemini integrations use. Providers whose
+        LiteLLM integration expects an SDK client override this.
+        """
+        from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+        if asynchronous:
+            return _pooled_async_handler()(
+                httpx.AsyncClient(limits=self.limits, timeout=self.http_timeout),
+                timeout=self.http_timeout,
+            )
+        return HTTPHandler(
+            timeout=self.http_timeout,
+            client=httpx.Client(limits=self.limits, timeout=self.http_timeout),
+        )
+
+    def _client(self, asynchronous: bool) -> Any:
+        if asynchronous:
+            loop = asyncio.get_running_loop()
+            client = self._async_clients.get(loop)
+            if client is None:
+                with self._client_lock:
+                    self._prune_async_clients()
+                    client = self._async_clients[loop] = self._build_client(asynchronous=True)
+            return client
+
+        if self._sync_client is None:
+            with self._client_lock:
+                if self._sync_client is None:
+                    self._sync_client = self._build_client(asynchronous=False)
+        return self._sync_client
+
+    @contextmanager
+    def _call_kwargs(self, model: str) -> Iterator[Dict[str, Any]]:
+        """Yield the keyword arguments shared by every LiteLLM call."""
+        kwargs: Dict[str, Any] = {
+            "model": self.completion_model(model),
+            "timeout": self.timeout,
+        }
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
+        if self.pooled:
+            kwargs["client"] = self._client(asynchronous=False)
+            self._last_used = time.monotonic()
+            yield kwargs
+            return
+        client = self._build_client(asynchronous=False)
+        kwargs["client"] = client
+        try:
+            yield kwargs
+        finally:
+            self._close_client(client)
+
+    def _async_call_kwargs(self, model: str) -> Dict[str, Any]:
+        kwargs: Dict[str, Any] = {
+            "model": self.completion_model(model),
+            "timeout": self.timeout,
+            "client": self._client(asynchronous=True),
+        }
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
+        return kwargs
+
+    @staticmethod
+    def _transport(client: Any) -> httpx.Client:
+        """Return the httpx client underneath a client built by :meth:`_build_client`."""
+        return client.client
+
+    def warmup(self) -> bool:
+        """Open a pooled connection to the provider endpoint ahead of a call.
+
+        Sends a ``HEAD`` request to the API base so DNS, TCP and TLS setup are
+        done before the completion request needs them. Does nothing when the
+        pooled client was used recently enough that its connection is still
+        alive. Returns whether a request was made; failures are only logged.
+        """
+        base = self.api_base or self.default_api_base
+        if not self.pooled or not base:
+            return False
+        if time.monotonic() - self._last_used < self.keepalive_expiry / 2:
+            return False
+        try:
+            self._transport(self._client(asynchronous=False)).head(
+                base, timeout=self.connect_timeout
+            )
+        except httpx.HTTPError as exc:
+            logger.debug("Warmup of %s failed: %s", self.name, exc)
+            return False
+        self._last_used = time.monotonic()
+        return True
+
+    @staticmethod
+    def _close_client(client: Any) -> None:
+        close = getattr(client, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:  # pragma: no cover - best effort cleanup
+                pass
+        inner = getattr(client, "client", None)
+        if isinstance(inner, httpx.Client):
+            inner.close()
+
+    def _prune_async_clients(self) -> None:
+        """Drop the async clients of closed loops; the caller holds the lock.
+
+        Their connections can't be closed any more, only released for
+        garbage collection.
+        """
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            del self._async_clients[loop]
+
+    def close(self) -> None:
+        """Close the pooled sync client; it is rebuilt on next use.
+
+        Async clients of event loops that have closed are released too; call
+        :meth:`aclose` before a loop ends to close its client cleanly.
+        """
+        with self._client_lock:
+            if self._sync_client is not None:
+                self._close_client(self._sync_client)
+                self._sync_client = None
+            self._prune_async_clients()
+
+    async def aclose(self) -> None:
+        """Close the pooled async client of the running event loop."""
+        with self._client_lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is None:
+            return
+        close = getattr(client, "close", None)
+        if close is not None:
+            result = close()
+            if asyncio.iscoroutine(result):
+                await result
+
+    # ------------------------------------------------------------------
+    # Completions
+    # ------------------------------------------------------------------
+    def _reserve(self, model: str, prompt: str) -> int:
+        """Wait for the rate limiter and return the tokens reserved."""
+        if self.rate_limiter is None:
+            return 0
+        tokens = self.rate_limiter.estimate_tokens(prompt)
+        self.rate_limiter.acquire(model, tokens)
+        return tokens
+
+    async def _areserve(self, model: str, prompt: str) -> int:
+        if self.rate_limiter is None:
+            return 0
+        tokens = self.rate_limiter.estimate_tokens(prompt)
+        await self.rate_limiter.aacquire(model, tokens)
+        return tokens
+
+    def _reconcile(self, model: str, reserved: int, used: int) -> None:
+        """Settle a reservation; failed or abandoned calls report ``used=0``."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.reconcile(model, reserved, used)
+
     def complete(self, model: str, prompt: str) -> ProviderResponse:
         """Execute a completion request against the provider."""
-        raise NotImplementedError
+        reserved = self._reserve(model, prompt)
+        used = 0
+        try:
+            try:
+                with self._call_kwargs(model) as kwargs:
+                    resp: Any = completion(
+                        messages=[{"role": "user", "content": prompt}], **kwargs
+                    )
+                result = self._parse_completion(resp)
+            except Exception as exc:
+                raise ProviderCompletionError(str(exc), provider=self.name, model=model) from exc
+            used = result.prompt_tokens + result.completion_tokens
+            return result
+        finally:
+            self._reconcile(model, reserved, used)
+
+    async def acomplete(self, model: str, prompt: str) -> ProviderResponse:
+        """Execute a completion request on the event loop via LiteLLM.
+
+        Uses ``litellm.acompletion`` so many requests can be in flight from a
+        single thread.
+        """
+        reserved = await self._areserve(model, prompt)
+        used = 0
+        try:
+            try:
+                resp: Any = await acompletion(
+                    messages=[{"role": "user", "content": prompt}],
+                    **self._async_call_kwargs(model),
+                )
+                result = self._parse_completion(resp)
+            except Exception as exc:
+                raise ProviderCompletionError(str(exc), provider=self.name, model=model) from exc
+            used = result.prompt_tokens + result.completion_tokens
+            return result
+        finally:
+            # Also runs when the call is cancelled, e.g. a losing hedge leg.
+            self._reconcile(model, reserved, used)
+
+    def stream(self, model: str, prompt: str) -> Iterator[str | ProviderStreamSummary]:
+        """Stream a completion, yielding text chunks as they arrive.
+
+        After the last chunk a :class:`ProviderStreamSummary` is yielded with the
+        full text, token usage, cost, time-to-first-token and total latency.
+        """
+        reserved = self._reserve(model, prompt)
+        settled = False
+        messages = [{"role": "user", "content": prompt}]
+        chunks: list[Any] = []
+        parts: list[str] = []
+        first_token: Optional[float] = None
+        start = time.perf_counter()
+        try:
+            try:
+                with self._call_kwargs(model) as kwargs:
+                    for chunk in completion(
+                        messages=messages,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        **kwargs,
+                    ):
+                        chunks.append(chunk)
+                        text = self._chunk_text(chunk)
+                        if text:
+                            if first_token is None:
+                                first_token = time.perf_counter() - start
+                            parts.append(text)
+                            yield text
+                latency = time.perf_counter() - start
+                usage = next(
+                    (c.usage for c in reversed(chunks) if getattr(c, "usage", None)), None
+                )
+                if usage is None:
+                    # Provider didn't report usage; let LiteLLM count the tokens.
+                    usage = stream_chunk_builder(chunks, messages=messages).usage
+            except Exception as exc:
+                raise ProviderCompletionError(str(exc), provider=self.name, model=model) from exc
+
+            prompt_tokens = getattr(usage, "prompt_tokens", 0)
+            completion_tokens = getattr(usage, "completion_tokens", 0)
+            self._reconcile(model, reserved, prompt_tokens + completion_tokens)
+            settled = True
+        finally:
+            if not settled:
+                # Failed, or abandoned by the consumer mid-stream.
+                self._reconcile(model, reserved, 0)
+        try:
+            cost = self.get_cost(model, prompt_tokens, completion_tokens)
+        except ProviderError as exc:
+            logger.warning("Cost calculation failed: %s", exc)
+            cost = 0.0
+
+        yield ProviderStreamSummary(
+            text="".join(parts),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost=cost,
+            time_to_first_token=first_token,
+            latency=latency,
+        )
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            return ""
+        delta = getattr(choices[0], "delta", None)
+        return getattr(delta, "content", None) or ""
+
+    def completion_model(self, model: str) -> str:
+        """Return the model identifier LiteLLM expects for ``model``."""
+        return model
+
+    def context_window(self, model: str) -> Optional[int]:
+        """Return the maximum prompt tokens of ``model``, or ``None`` if unknown."""
+        info = _model_info(self.completion_model(model))
+        if not info:
+            return None
+        return info.get("max_input_tokens") or info.get("max_tokens")
+
+    @staticmethod
+    def _parse_completion(resp: Any) -> ProviderResponse:
+        text = resp["choices"][0]["message"]["content"]
+        usage = getattr(resp, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0)
+        completion_tokens = getattr(usage, "completion_tokens", 0)
+        return ProviderResponse(
+            text=text, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+        )
 
-    @abstractmethod
     def get_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
-        """Return the cost for the request based on token usage."""
-        raise NotImplementedError
+        """Return the prompt plus completion cost of the request."""
+        try:
+            return self.pricing.cost(model, prompt_tokens, completion_tokens)
+        except KeyError as exc:
+            raise ProviderCostError(str(exc), provider=self.name, model=model) from exc
@@ -3,15 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Any
 
-from litellm import completion, cost_per_token
+import httpx
 
-from llm_router.exceptions.exceptions import (
-    ProviderCompletionError,
-    ProviderCostError,
-)
-from .base import Provider, ProviderResponse
+from .base import Provider
 
 logger = logging.getLogger(__name__)
 
@@ -20,32 +17,25 @@ class OpenAIProvider(Provider):
     """Provider implementation for OpenAI's GPT family."""
 
     api_key_env = "OPENAI_API_KEY"
+    default_api_base = "https://api.openai.com/v1"
 
     @property
     def name(self) -> str:  # pragma: no cover - simple property
         return "openai"
 
-    def complete(self, model: str, prompt: str) -> ProviderResponse:
-        try:
-            resp: Any = completion(model=model, messages=[{"role": "user", "content": prompt}])
-            text = resp["choices"][0]["message"]["content"]
-            usage = getattr(resp, "usage", None)
-            prompt_tokens = getattr(usage, "prompt_tokens", 0)
-            completion_tokens = getattr(usage, "completion_tokens", 0)
-        except Exception as exc:
-            raise ProviderCompletionError(str(exc), provider=self.name, model=model) from exc
-        return ProviderResponse(text=text, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
-
-    def get_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
-        try:
-            cost = cost_per_token(
-                model=model,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-            )
-            if isinstance(cost, tuple) and cost:
-                cost = cost[0]
-            return float(cost)
-        except Exception as exc:
-            raise ProviderCostError(str(exc), provider=self.name, model=model) from exc
-
+    def _build_client(self, asynchronous: bool) -> Any:
+        # LiteLLM's OpenAI integration takes an SDK client rather than an
+        # HTTP handler; give it one backed by our pooled httpx client.
+        from openai import AsyncOpenAI, OpenAI
+
+        sdk, http = (AsyncOpenAI, httpx.AsyncClient) if asynchronous else (OpenAI, httpx.Client)
+        return sdk(
+            api_key=os.getenv(self.api_key_env),
+            base_url=self.api_base or self.default_api_base,
+            http_client=http(limits=self.limits, timeout=self.http_timeout),
+            timeout=self.http_timeout,
+        )
+
+    @staticmethod
+    def _transport(client: Any) -> httpx.Client:
+        return client._client
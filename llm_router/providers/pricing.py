@@ -0,0 +1,213 @@
+"""Per-token prices resolved once and applied with plain arithmetic."""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def cost_per_token(**kwargs: Any) -> Tuple[float, float]:
+    """``litellm.cost_per_token``, importing LiteLLM on first use."""
+    import litellm
+
+    return litellm.cost_per_token(**kwargs)
+
+
+def get_model_info(model: str) -> Dict[str, Any]:
+    """``litellm.get_model_info``, importing LiteLLM on first use."""
+    import litellm
+
+    return litellm.get_model_info(model)
+
+
+_TIER_KEY = re.compile(r"^input_cost_per_token_above_(\d+)(k?)_tokens$")
+
+
+class PriceTier(BaseModel):
+    """Prices that apply to a whole request once its prompt exceeds ``above_tokens``."""
+
+    above_tokens: int
+    input_cost_per_token: float
+    output_cost_per_token: float
+
+
+class ModelPrice(BaseModel):
+    """USD per prompt token and per completion token.
+
+    Long-context models can be billed at higher ``tiers``: as in LiteLLM, a
+    prompt longer than a tier's ``above_tokens`` prices every prompt and
+    completion token of the request at that tier's rates.
+    """
+
+    input_cost_per_token: float
+    output_cost_per_token: float
+    tiers: List[PriceTier] = []
+
+    def rates(self, prompt_tokens: int) -> Tuple[float, float]:
+        """Return the (prompt, completion) rates for a ``prompt_tokens`` prompt."""
+        rates = (self.input_cost_per_token, self.output_cost_per_token)
+        for tier in sorted(self.tiers, key=lambda tier: tier.above_tokens):
+            if prompt_tokens > tier.above_tokens:
+                rates = (tier.input_cost_per_token, tier.output_cost_per_token)
+        return rates
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        input_rate, output_rate = self.rates(prompt_tokens)
+        return prompt_tokens * input_rate + completion_tokens * output_rate
+
+
+def _tiers(model: str, output_cost: float) -> List[PriceTier]:
+    """Read the ``*_above_<n>k_tokens`` rates of ``model`` from LiteLLM's model map."""
+    try:
+        info = get_model_info(model)
+    except Exception:
+        return []
+    tiers = []
+    for key, value in info.items():
+        match = _TIER_KEY.match(key)
+        if match is None or value is None:
+            continue
+        number, thousands = match.groups()
+        output = info.get(f"output_cost_per_token_above_{number}{thousands}_tokens")
+        tiers.append(
+            PriceTier(
+                above_tokens=int(number) * (1000 if thousands else 1),
+                input_cost_per_token=float(value),
+                output_cost_per_token=float(output) if output is not None else output_cost,
+            )
+        )
+    return sorted(tiers, key=lambda tier: tier.above_tokens)
+
+
+@lru_cache(maxsize=None)
+def resolve_price(model: str) -> Optional[ModelPrice]:
+    """Return LiteLLM's price for ``model``, or ``None`` if it isn't mapped.
+
+    ``litellm.cost_per_token`` normalises the model name and searches the
+    model map on every call, so it is asked once per model and process for
+    the price of a single prompt and completion token. The long-context
+    tiers are read from the model map at the same time.
+    """
+    try:
+        prompt_cost, completion_cost = cost_per_token(
+            model=model, prompt_tokens=1, completion_tokens=1
+        )
+    except Exception as exc:
+        logger.debug("No LiteLLM price for %s: %s", model, exc)
+        return None
+    return ModelPrice(
+        input_cost_per_token=float(prompt_cost),
+        output_cost_per_token=float(completion_cost),
+        tiers=_tiers(model, float(completion_cost)),
+    )
+
+
+class PricingTable:
+    """Prices keyed by model, with optional overrides from a JSON file.
+
+    The overrides file maps model names to prices, e.g.
+    ``{"gpt-4o": {"input_cost_per_token": 2.5e-06, "output_cost_per_token": 1e-05}}``,
+    and takes precedence over LiteLLM's prices. Models missing from the table
+    are resolved on first use.
+
+    Args:
+        prices: Initial prices keyed by model.
+        overrides: Optional path of a JSON overrides file.
+    """
+
+    def __init__(
+        self,
+        prices: Optional[Dict[str, ModelPrice]] = None,
+        overrides: Optional[Path | str] = None,
+    ) -> None:
+        self._prices: Dict[str, ModelPrice] = dict(prices or {})
+        self._lock = threading.Lock()
+        if overrides is not None:
+            self.load_overrides(overrides)
+
+    @classmethod
+    def for_models(
+        cls, models: Iterable[str], overrides: Optional[Path | str] = None
+    ) -> "PricingTable":
+        """Resolve the LiteLLM price of every model in ``models`` up front."""
+        prices = {}
+        for model in models:
+            price = resolve_price(model)
+            if price is not None:
+                prices[model] = price
+        return cls(prices, overrides=overrides)
+
+    def load_overrides(self, path: Path | str) -> None:
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        with self._lock:
+            for model, price in data.items():
+                self._prices[model] = ModelPrice.model_validate(price)
+
+    def set(self, model: str, price: ModelPrice) -> None:
+        with self._lock:
+            self._prices[model] = price
+
+    def get(self, model: str) -> Optional[ModelPrice]:
+        """Return the price of ``model``, resolving it via LiteLLM if needed."""
+        price = self._prices.get(model)
+        if price is None:
+            price = resolve_price(model)
+            if price is not None:
+                self.set(model, price)
+        return price
+
+    def __contains__(self, model: str) -> bool:
+        return model in self._prices
+
+    def cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        """Return the cost of a request; raises ``KeyError`` for unknown models."""
+        price = self.get(model)
+        if price is None:
+            raise KeyError(f"No price for model {model!r}")
+        return price.cost(prompt_tokens, completion_tokens)
+
+    def cost_many(
+        self,
+        models: Sequence[str],
+        prompt_tokens: Sequence[int],
+        completion_tokens: Sequence[int],
+    ) -> np.ndarray:
+        """Return the cost of many requests at once, e.g. from usage logs.
+
+        The three sequences are aligned per request. Requests for models
+        without a price cost ``nan``.
+        """
+        import numpy as np
+
+        models = np.asarray(models)
+        prompt_tokens = np.asarray(prompt_tokens, dtype=float)
+        unique, index = np.unique(models, return_inverse=True)
+        index = index.reshape(-1)
+        rates = np.full((len(unique), 2), np.nan)
+        tiered = []
+        for i, model in enumerate(unique):
+            price = self.get(str(model))
+            if price is not None:
+                rates[i] = (price.input_cost_per_token, price.output_cost_per_token)
+                if price.tiers:
+                    tiered.append((i, price.tiers))
+        rates = rates[index]
+        for i, tiers in tiered:
+            rows = index == i
+            for tier in sorted(tiers, key=lambda tier: tier.above_tokens):
+                above = rows & (prompt_tokens > tier.above_tokens)
+                rates[above] = (tier.input_cost_per_token, tier.output_cost_per_token)
+        return prompt_tokens * rates[:, 0] + np.asarray(completion_tokens, dtype=float) * rates[:, 1]
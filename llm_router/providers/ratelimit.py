@@ -0,0 +1,197 @@
+"""Token-bucket rate limiting for provider requests and tokens."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from llm_router.exceptions.exceptions import RateLimitExceededError
+from llm_router.utils.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Bucket refilled continuously at ``rate`` units per second.
+
+    The level may go negative when a reservation is corrected upwards after
+    the fact (see :meth:`RateLimiter.reconcile`); later callers then wait for
+    the debt to be refilled. Not thread-safe on its own; :class:`RateLimiter`
+    serializes access.
+
+    Args:
+        rate: Refill rate in units per second.
+        capacity: Maximum burst size.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.level = capacity
+        self._updated = time.monotonic()
+
+    @classmethod
+    def per_minute(cls, limit: float) -> "TokenBucket":
+        return cls(rate=limit / 60.0, capacity=limit)
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` units are available."""
+        self._refill(now)
+        # Requests larger than the bucket would never fit; let them through
+        # once the bucket is full.
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / self.rate
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+
+class ModelLimits(BaseModel):
+    """Requests-per-minute and tokens-per-minute limits; ``None`` is unlimited."""
+
+    rpm: Optional[float] = None
+    tpm: Optional[float] = None
+
+
+class RateLimiter:
+    """Per-provider and per-model RPM/TPM limits for one provider.
+
+    Before each request :meth:`acquire` reserves one request and the
+    estimated token count (prompt tokens counted with tiktoken plus
+    ``completion_tokens_estimate``) from the provider buckets and from the
+    buckets of the model, blocking until all of them have room. After the
+    response, :meth:`reconcile` corrects the token buckets with the real usage.
+
+    Args:
+        rpm: Requests per minute across all models of the provider.
+        tpm: Tokens per minute across all models of the provider.
+        models: Optional per-model limits, keyed by model name.
+        completion_tokens_estimate: Completion tokens assumed when reserving.
+        max_wait: Optional longest wait in seconds; a request that would have
+            to wait longer raises :class:`RateLimitExceededError` instead.
+    """
+
+    def __init__(
+        self,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+        models: Optional[Dict[str, ModelLimits]] = None,
+        completion_tokens_estimate: int = 256,
+        max_wait: Optional[float] = None,
+    ) -> None:
+        self.limits = ModelLimits(rpm=rpm, tpm=tpm)
+        self.model_limits = dict(models or {})
+        self.completion_tokens_estimate = completion_tokens_estimate
+        self.max_wait = max_wait
+        self.waits = 0
+        self.wait_time = 0.0
+        self._provider_buckets = self._buckets(self.limits)
+        self._model_buckets: Dict[str, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _buckets(limits: ModelLimits) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        return (
+            TokenBucket.per_minute(limits.rpm) if limits.rpm else None,
+            TokenBucket.per_minute(limits.tpm) if limits.tpm else None,
+        )
+
+    def _buckets_for(self, model: str) -> List[Tuple[TokenBucket, bool]]:
+        """Return ``(bucket, counts_tokens)`` pairs that apply to ``model``."""
+        if model not in self._model_buckets:
+            limits = self.model_limits.get(model)
+            self._model_buckets[model] = self._buckets(limits) if limits else (None, None)
+        pairs = []
+        for requests, tokens in (self._provider_buckets, self._model_buckets[model]):
+            if requests is not None:
+                pairs.append((requests, False))
+            if tokens is not None:
+                pairs.append((tokens, True))
+        return pairs
+
+    def estimate_tokens(self, prompt: str) -> int:
+        """Return the tokens reserved for ``prompt``."""
+        return count_tokens(prompt) + self.completion_tokens_estimate
+
+    def _reserve(self, model: str, tokens: int) -> float:
+        """Take the reservation if possible; otherwise return the wait needed."""
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._buckets_for(model)
+            wait = max(
+                (bucket.wait_time(tokens if counts else 1, now) for bucket, counts in buckets),
+                default=0.0,
+            )
+            if wait <= 0:
+                for bucket, counts in buckets:
+                    bucket.take(tokens if counts else 1)
+            return wait
+
+    def _check_wait(self, model: str, waited: float, wait: float) -> None:
+        if self.max_wait is not None and waited + wait > self.max_wait:
+            raise RateLimitExceededError(
+                f"Rate limit for {model} would need a {waited + wait:.2f}s wait",
+                model=model,
+            )
+
+    def _record(self, waited: float) -> None:
+        if waited > 0:
+            with self._lock:
+                self.waits += 1
+                self.wait_time += waited
+
+    def acquire(self, model: str, tokens: int) -> float:
+        """Block until ``model`` may send a request of ``tokens`` tokens.
+
+        Returns the number of seconds spent waiting.
+        """
+        start = time.monotonic()
+        waited = 0.0
+        while True:
+            wait = self._reserve(model, tokens)
+            if wait <= 0:
+                break
+            self._check_wait(model, waited, wait)
+            time.sleep(wait)
+            waited = time.monotonic() - start
+        self._record(waited)
+        return waited
+
+    async def aacquire(self, model: str, tokens: int) -> float:
+        """Async counterpart of :meth:`acquire` that doesn't block the loop."""
+        start = time.monotonic()
+        waited = 0.0
+        while True:
+            wait = self._reserve(model, tokens)
+            if wait <= 0:
+                break
+            self._check_wait(model, waited, wait)
+            await asyncio.sleep(wait)
+            waited = time.monotonic() - start
+        self._record(waited)
+        return waited
+
+    def reconcile(self, model: str, reserved: int, used: int) -> None:
+        """Return unused tokens to, or take extra tokens from, the buckets."""
+        delta = used - reserved
+        if not delta:
+            return
+        with self._lock:
+            for bucket, counts in self._buckets_for(model):
+                if counts:
+                    bucket.level = min(bucket.capacity, bucket.level - delta)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {"waits": self.waits, "wait_time": self.wait_time}
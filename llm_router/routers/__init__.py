@@ -1,6 +1,44 @@
-from .router import LLMRouterResponse,LLMRouterService
+from typing import TYPE_CHECKING
+
+from llm_router.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .router import LLMRouterResponse, LLMRouterService
+    from .hedging import HedgePolicy
+    from .executor import ConcurrentExecutor
+    from .resilience import RetryPolicy
+    from .circuit import CircuitBreaker, CircuitBreakers, CircuitState
+    from .policy import AdaptivePolicy, LatencyCostPolicy, SelectionPolicy
+    from .stats import PairStats, RouterStats
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'LLMRouterService': '.router',
+    'LLMRouterResponse': '.router',
+    'HedgePolicy': '.hedging',
+    'ConcurrentExecutor': '.executor',
+    'RetryPolicy': '.resilience',
+    'CircuitBreaker': '.circuit',
+    'CircuitBreakers': '.circuit',
+    'CircuitState': '.circuit',
+    'SelectionPolicy': '.policy',
+    'LatencyCostPolicy': '.policy',
+    'AdaptivePolicy': '.policy',
+    'RouterStats': '.stats',
+    'PairStats': '.stats',
+})
 
 __all__ = [
     'LLMRouterService',
-    'LLMRouterResponse'
-]
\ No newline at end of file
+    'LLMRouterResponse',
+    'HedgePolicy',
+    'ConcurrentExecutor',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CircuitBreakers',
+    'CircuitState',
+    'SelectionPolicy',
+    'LatencyCostPolicy',
+    'AdaptivePolicy',
+    'RouterStats',
+    'PairStats',
+]
@@ -0,0 +1,207 @@
+"""Circuit breakers per (provider, model) pair."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+#: Called as ``callback((provider, model), old_state, new_state)``.
+StateChangeCallback = Callable[[Tuple[str, str], CircuitState, CircuitState], None]
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by a sliding window of calls.
+
+    The breaker opens when, over the calls of the last ``window`` seconds
+    (and at least ``min_calls`` of them), the share of failed calls reaches
+    ``error_rate`` or the share of calls slower than ``slow_call_latency``
+    reaches ``slow_call_rate``. After ``open_duration`` seconds it lets
+    ``half_open_calls`` probe calls through: if they all succeed it closes,
+    any failure opens it again.
+
+    Args:
+        key: The ``(provider, model)`` pair guarded by this breaker.
+        window: Length of the sliding window in seconds.
+        min_calls: Calls needed in the window before the breaker can open.
+        error_rate: Failure share that opens the breaker.
+        slow_call_latency: Latency in seconds above which a call is slow.
+            ``None`` disables the latency check.
+        slow_call_rate: Slow-call share that opens the breaker.
+        open_duration: Seconds the breaker stays open before probing.
+        half_open_calls: Number of probe calls in the half-open state.
+        on_state_change: Optional callback invoked on every transition.
+    """
+
+    def __init__(
+        self,
+        key: Tuple[str, str],
+        window: float = 60.0,
+        min_calls: int = 10,
+        error_rate: float = 0.5,
+        slow_call_latency: Optional[float] = None,
+        slow_call_rate: float = 0.8,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        on_state_change: Optional[StateChangeCallback] = None,
+    ) -> None:
+        self.key = key
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call_latency = slow_call_latency
+        self.slow_call_rate = slow_call_rate
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.on_state_change = on_state_change
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        # (timestamp, failed, slow)
+        self._calls: Deque[Tuple[float, bool, bool]] = deque()
+        # Reentrant so state-change callbacks can read the breaker.
+        self._lock = threading.RLock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        old, self._state = self._state, state
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if state is not CircuitState.CLOSED:
+            self._probes = self._probe_successes = 0
+        if state is CircuitState.CLOSED:
+            self._calls.clear()
+        logger.info("Circuit %s/%s: %s -> %s", *self.key, old.value, state.value)
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(self.key, old, state)
+            except Exception:  # pragma: no cover - observers must not break routing
+                logger.exception("Circuit state callback failed")
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self.open_duration:
+            self._transition(CircuitState.HALF_OPEN)
+
+    def available(self) -> bool:
+        """Return whether :meth:`allow` would let a call through, without reserving."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state is CircuitState.HALF_OPEN:
+                return self._probes < self.half_open_calls
+            return self._state is CircuitState.CLOSED
+
+    def allow(self) -> bool:
+        """Return whether a call may go through, reserving a probe if half-open."""
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and self._probes < self.half_open_calls:
+                self._probes += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """Give back the probe of a call that ended without an outcome.
+
+        Used for calls that were cancelled, e.g. the losing leg of a hedged
+        request, so the half-open breaker can admit another probe.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes > self._probe_successes:
+                self._probes -= 1
+
+    def record(self, success: bool, latency: float) -> None:
+        """Record the outcome of a call let through by :meth:`allow`."""
+        slow = self.slow_call_latency is not None and latency >= self.slow_call_latency
+        with self._lock:
+            now = time.monotonic()
+            if self._state is CircuitState.HALF_OPEN:
+                if not success or slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_calls:
+                        self._transition(CircuitState.CLOSED)
+                return
+            if self._state is CircuitState.OPEN:
+                return
+
+            self._calls.append((now, not success, slow))
+            while self._calls and now - self._calls[0][0] > self.window:
+                self._calls.popleft()
+            total = len(self._calls)
+            if total < self.min_calls:
+                return
+            failures = sum(1 for _, failed, _ in self._calls if failed)
+            slow_calls = sum(1 for _, _, is_slow in self._calls if is_slow)
+            if failures / total >= self.error_rate or (
+                self.slow_call_latency is not None and slow_calls / total >= self.slow_call_rate
+            ):
+                self._transition(CircuitState.OPEN)
+
+
+class CircuitBreakers:
+    """Lazily created :class:`CircuitBreaker` per (provider, model).
+
+    Keyword arguments are passed to every breaker; see
+    :class:`CircuitBreaker` for the thresholds.
+
+    Args:
+        on_state_change: Optional callback invoked on every transition of
+            any breaker.
+    """
+
+    def __init__(self, on_state_change: Optional[StateChangeCallback] = None, **options) -> None:
+        self.on_state_change = on_state_change
+        self.options = options
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, model: str) -> CircuitBreaker:
+        key = (provider, model)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(key)
+                if breaker is None:
+                    breaker = self._breakers[key] = CircuitBreaker(
+                        key, on_state_change=self.on_state_change, **self.options
+                    )
+        return breaker
+
+    def allow(self, provider: str, model: str) -> bool:
+        return self.get(provider, model).allow()
+
+    def is_open(self, provider: str, model: str) -> bool:
+        """Return whether calls to the pair are currently rejected."""
+        return not self.get(provider, model).available()
+
+    def release(self, provider: str, model: str) -> None:
+        self.get(provider, model).release()
+
+    def record(self, provider: str, model: str, success: bool, latency: float) -> None:
+        self.get(provider, model).record(success, latency)
+
+    def states(self) -> Dict[Tuple[str, str], CircuitState]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.key: breaker.state for breaker in breakers}
@@ -0,0 +1,194 @@
+"""Bounded concurrent execution of router requests."""
+
+from __future__ import annotations
+
+import logging
+import math
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional
+
+from fyras_models import LLMRouterResponse
+from llm_router.exceptions.exceptions import RouterError
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ConcurrentExecutor:
+    """Drive :meth:`LLMRouterService.invoke` from a fixed pool of workers.
+
+    Requests wait in a bounded queue and at most ``max_in_flight`` of them run
+    at once. When the queue is full :meth:`submit` blocks, so producers are
+    slowed down to the rate the providers can sustain instead of piling up
+    work in memory. Per-provider RPM/TPM limits are enforced by each
+    provider's :class:`~llm_router.providers.RateLimiter`; the time spent
+    waiting on them is included in :meth:`stats`.
+
+    Args:
+        router: The router whose ``invoke`` runs each request.
+        max_in_flight: Maximum number of concurrent provider requests.
+        max_queue: Maximum number of requests waiting for a worker.
+        submit_timeout: Optional seconds :meth:`submit` waits for a queue
+            slot before raising :class:`RouterError`. Waits forever if
+            ``None``.
+    """
+
+    def __init__(
+        self,
+        router: Any,
+        max_in_flight: int = 16,
+        max_queue: int = 256,
+        submit_timeout: Optional[float] = None,
+    ) -> None:
+        self.router = router
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.submit_timeout = submit_timeout
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self._queue_waits: deque[float] = deque(maxlen=1000)
+        # The queue itself is unbounded so shutdown can always enqueue the
+        # stop signals; queue slots are counted by ``_slots`` instead.
+        self._queue: queue.Queue = queue.Queue()
+        self._slots = threading.Semaphore(max_queue)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"llm-router-exec-{i}", daemon=True)
+            for i in range(max_in_flight)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, prompt: str) -> "Future[LLMRouterResponse]":
+        """Queue ``prompt`` and return a future for its response.
+
+        Blocks while the queue is full.
+
+        Raises:
+            RouterError: If the executor is shut down, or no queue slot
+                freed up within ``submit_timeout``.
+        """
+        if self._closed:
+            raise RouterError("Executor is shut down")
+        if not self._slots.acquire(timeout=self.submit_timeout):
+            raise RouterError(f"Request queue is full ({self.max_queue} waiting)")
+        future: Future = Future()
+        with self._lock:
+            # Checked again under the lock: shutdown may have run while this
+            # call waited for a slot, and nothing may follow its stop signals.
+            if self._closed:
+                self._slots.release()
+                raise RouterError("Executor is shut down")
+            self._queue.put_nowait((future, prompt, time.perf_counter()))
+            self.submitted += 1
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return future
+
+    def map(self, prompts: Iterable[str]) -> List[LLMRouterResponse]:
+        """Run every prompt and return the responses in input order."""
+        futures = [self.submit(prompt) for prompt in prompts]
+        return [future.result() for future in futures]
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._slots.release()
+            future, prompt, enqueued = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._queue_waits.append(time.perf_counter() - enqueued)
+                self.in_flight += 1
+            try:
+                result = self.router.invoke(prompt)
+            except BaseException as exc:
+                with self._lock:
+                    self.in_flight -= 1
+                    self.failed += 1
+                future.set_exception(exc)
+            else:
+                with self._lock:
+                    self.in_flight -= 1
+                    self.completed += 1
+                future.set_result(result)
+
+    def stats(self) -> Dict[str, float]:
+        """Return queue depth, throughput counters and wait-time metrics.
+
+        ``queue_wait_*`` cover the most recent 1000 requests;
+        ``rate_limit_wait`` is the total seconds requests spent waiting on
+        provider rate limiters.
+        """
+        with self._lock:
+            waits = sorted(self._queue_waits)
+            stats: Dict[str, float] = {
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self.in_flight,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+        stats["queue_wait_mean"] = sum(waits) / len(waits) if waits else 0.0
+        stats["queue_wait_p95"] = waits[max(0, math.ceil(0.95 * len(waits)) - 1)] if waits else 0.0
+        providers = getattr(self.router, "providers", None) or {}
+        stats["rate_limit_wait"] = sum(
+            provider.rate_limiter.wait_time
+            for provider in providers.values()
+            if getattr(provider, "rate_limiter", None) is not None
+        )
+        return stats
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop accepting requests.
+
+        Queued requests still run unless ``cancel_futures`` is set, in which
+        case their futures fail with :class:`RouterError`. Submits blocked on
+        a full queue are rejected once a slot frees up.
+
+        Args:
+            wait: Wait for the workers to finish.
+            cancel_futures: Fail the requests that haven't started yet.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if cancel_futures:
+                self._fail_queued()
+            for _ in self._workers:
+                self._queue.put_nowait(_STOP)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _fail_queued(self) -> None:
+        while True:
+            try:
+                future, _, _ = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._slots.release()
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RouterError("Executor is shut down"))
+
+    def __enter__(self) -> "ConcurrentExecutor":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,99 @@
+"""Hedged requests: race a second model when the first one is slow."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from llm_router.schemas.config import topic_alternatives
+
+
+class HedgePolicy:
+    """Decide when to hedge a provider call and which model to hedge with.
+
+    If the primary model hasn't answered after :meth:`delay_for` seconds, the
+    router sends the same prompt to the model returned by :meth:`secondary`
+    and keeps whichever response arrives first.
+
+    Args:
+        delay: Fixed hedge delay in seconds. When ``None`` the delay is the
+            ``percentile`` of the latencies recently observed for the primary
+            (provider, model) pair.
+        percentile: Latency percentile used as the adaptive delay.
+        min_samples: Observations needed before the adaptive delay is used;
+            until then ``initial_delay`` applies.
+        initial_delay: Delay used while too few latencies are known.
+        window: Number of recent latencies kept per (provider, model).
+        prefer_other_provider: Hedge with the same topic's model on another
+            registered provider first, so an outage or slowdown of one
+            provider doesn't affect both legs.
+        fallback_topic: Topic whose model is used on the primary provider
+            when no other provider is registered.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        initial_delay: float = 2.0,
+        window: int = 200,
+        prefer_other_provider: bool = True,
+        fallback_topic: str = "GENERAL",
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.window = window
+        self.prefer_other_provider = prefer_other_provider
+        self.fallback_topic = fallback_topic
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, model: str, latency: float) -> None:
+        """Record the latency of a completed call."""
+        with self._lock:
+            samples = self._latencies.get((provider, model))
+            if samples is None:
+                samples = self._latencies[(provider, model)] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def delay_for(self, provider: str, model: str) -> float:
+        """Return how long to wait for ``model`` before hedging."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            samples = sorted(self._latencies.get((provider, model), ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(len(samples) - 1, math.ceil(self.percentile / 100 * len(samples)) - 1)
+        return samples[max(index, 0)]
+
+    def secondary(
+        self,
+        topic: Optional[str],
+        provider: str,
+        model: str,
+        available: Iterable[str],
+        usable: Optional[Callable[[str, str], bool]] = None,
+    ) -> Optional[Tuple[str, str]]:
+        """Return the (provider, model) to hedge with, or ``None``.
+
+        Args:
+            topic: Topic the prompt was classified as.
+            provider: Name of the primary provider.
+            model: Primary model.
+            available: Names of the providers registered with the router.
+            usable: Optional filter, e.g. rejecting pairs whose circuit is open.
+        """
+        candidates = topic_alternatives(
+            topic, provider, model, available, fallback_topic=self.fallback_topic
+        )
+        if usable is not None:
+            candidates = [pair for pair in candidates if usable(*pair)]
+        if not self.prefer_other_provider:
+            candidates.sort(key=lambda candidate: candidate[0] != provider)
+        return candidates[0] if candidates else None
@@ -0,0 +1,151 @@
+"""Policies choosing a (provider, model) pair among a vote's candidates."""
+
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Tuple, Union
+
+from llm_router.routers.stats import PairStats, RouterStats
+
+
+class SelectionPolicy(ABC):
+    """Choose which (provider, model) pair serves a request.
+
+    The router passes the candidates in preference order: the voted pair
+    first, then the same topic's model on every other registered provider
+    whose circuit isn't open.
+    """
+
+    @abstractmethod
+    def choose(self, candidates: List[Tuple[str, str]], stats: RouterStats) -> Tuple[str, str]:
+        """Return one of ``candidates``."""
+
+
+class LatencyCostPolicy(SelectionPolicy):
+    """Pick the candidate with the lowest weighted latency and cost.
+
+    Each candidate is scored as ``latency_weight * latency / best_latency +
+    cost_weight * cost / best_cost`` using the moving averages in
+    :class:`RouterStats`, so both terms are relative to the best candidate
+    and the weights express how much a slower or more expensive pair is
+    penalised. The score is divided by the pair's success rate (one minus
+    its error rate), the expected number of calls per answer, so failing
+    pairs lose. A pair that has never succeeded is charged the worst
+    latency and cost among the candidates. Candidates that were never
+    called are tried first, in preference order, so every provider gets
+    measured.
+
+    Args:
+        latency_weight: Weight of the latency term.
+        cost_weight: Weight of the cost-per-token term.
+    """
+
+    def __init__(self, latency_weight: float = 1.0, cost_weight: float = 1.0) -> None:
+        self.latency_weight = latency_weight
+        self.cost_weight = cost_weight
+
+    def choose(self, candidates: List[Tuple[str, str]], stats: RouterStats) -> Tuple[str, str]:
+        pairs = []
+        for candidate in candidates:
+            pair = stats.get(*candidate)
+            if pair.calls == 0:
+                return candidate
+            pairs.append((candidate, pair))
+
+        latencies = [pair.latency for _, pair in pairs if pair.latency is not None]
+        costs = [pair.cost_per_token for _, pair in pairs if pair.cost_per_token is not None]
+        best_latency = min(latencies, default=1.0) or 1e-9
+        worst_latency = max(latencies, default=1.0)
+        best_cost = min(costs, default=1.0) or 1e-9
+        worst_cost = max(costs, default=1.0)
+
+        def score(item) -> float:
+            _, pair = item
+            latency = pair.latency if pair.latency is not None else worst_latency
+            cost = pair.cost_per_token if pair.cost_per_token is not None else worst_cost
+            weighted = (
+                self.latency_weight * latency / best_latency
+                + self.cost_weight * cost / best_cost
+            )
+            return weighted / max(1.0 - (pair.error_rate or 0.0), 1e-3)
+
+        return min(pairs, key=score)[0]
+
+
+#: Built-in objectives of :class:`AdaptivePolicy`, lower is better.
+OBJECTIVES = {
+    "cost": lambda pair: pair.cost_per_token,
+    "latency": lambda pair: pair.latency,
+    "p95": lambda pair: pair.p95_latency,
+}
+
+
+class AdaptivePolicy(SelectionPolicy):
+    """Minimise an objective among the candidates that meet a latency SLO.
+
+    A candidate meets the SLO when its p95 latency is at most ``slo_p95``
+    and its error rate at most ``max_error_rate``; among those the one with
+    the lowest ``objective`` wins, e.g. the cheapest model whose p95 is under
+    2s with the defaults. When no candidate meets the SLO the one with the
+    lowest p95 is used. Candidates with fewer than ``min_samples`` calls are
+    tried first, and with probability ``epsilon`` a random candidate is
+    chosen instead, so the estimates of pairs that lost keep getting
+    refreshed.
+
+    Args:
+        objective: ``"cost"`` (cost per token), ``"latency"`` (moving
+            average), ``"p95"``, or a callable scoring a :class:`PairStats`.
+        slo_p95: Maximum p95 latency in seconds, or ``None`` for no limit.
+        max_error_rate: Maximum error rate, or ``None`` for no limit.
+        epsilon: Exploration probability.
+        min_samples: Calls needed before a candidate's figures are trusted.
+        seed: Optional seed for the exploration draws.
+    """
+
+    def __init__(
+        self,
+        objective: Union[str, Callable[[PairStats], Optional[float]]] = "cost",
+        slo_p95: Optional[float] = 2.0,
+        max_error_rate: Optional[float] = 0.2,
+        epsilon: float = 0.05,
+        min_samples: int = 5,
+        seed: Optional[int] = None,
+    ) -> None:
+        if isinstance(objective, str):
+            if objective not in OBJECTIVES:
+                raise ValueError(f"Unknown objective {objective!r}; expected one of {sorted(OBJECTIVES)}")
+            objective = OBJECTIVES[objective]
+        self.objective = objective
+        self.slo_p95 = slo_p95
+        self.max_error_rate = max_error_rate
+        self.epsilon = epsilon
+        self.min_samples = min_samples
+        self._random = random.Random(seed)
+
+    def _meets_slo(self, pair: PairStats) -> bool:
+        if self.slo_p95 is not None and (pair.p95_latency is None or pair.p95_latency > self.slo_p95):
+            return False
+        if self.max_error_rate is not None and (pair.error_rate or 0.0) > self.max_error_rate:
+            return False
+        return True
+
+    def choose(self, candidates: List[Tuple[str, str]], stats: RouterStats) -> Tuple[str, str]:
+        if len(candidates) > 1 and self._random.random() < self.epsilon:
+            return self._random.choice(candidates)
+
+        measured = []
+        for candidate in candidates:
+            pair = stats.get(*candidate)
+            if pair.calls < self.min_samples:
+                return candidate
+            measured.append((candidate, pair))
+
+        feasible = [(candidate, pair) for candidate, pair in measured if self._meets_slo(pair)]
+        if not feasible:
+            return min(measured, key=lambda item: _or_inf(item[1].p95_latency))[0]
+        return min(feasible, key=lambda item: _or_inf(self.objective(item[1])))[0]
+
+
+def _or_inf(value: Optional[float]) -> float:
+    return float("inf") if value is None else value
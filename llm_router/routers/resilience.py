@@ -0,0 +1,142 @@
+"""Retry with jittered exponential backoff for provider calls."""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from typing import Iterator, Optional
+
+#: HTTP status codes worth retrying: timeouts, conflicts, rate limits, 5xx.
+TRANSIENT_STATUS = frozenset({408, 409, 425, 429})
+
+
+def _causes(exc: BaseException) -> Iterator[BaseException]:
+    """Yield ``exc`` and the exceptions it was raised from."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        yield exc
+        exc = exc.__cause__ or exc.__context__
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """Retry transient provider errors, then fail over to another provider.
+
+    A call is retried when any exception in its cause chain is a timeout or
+    connection error, or carries an HTTP 408/409/425/429 or 5xx status. The
+    delay before attempt ``n`` is drawn uniformly from
+    ``[0, min(max_delay, base_delay * multiplier**n)]`` ("full jitter") so
+    clients that failed together don't retry together; a ``Retry-After``
+    header on the error takes precedence. Once ``max_attempts`` is used up,
+    the next delay would exceed ``budget``, or the error isn't transient, the
+    router moves on to the same topic's model on the next registered
+    provider (if ``failover`` is set).
+
+    Args:
+        max_attempts: Attempts per (provider, model) target.
+        base_delay: Backoff delay before the first retry, in seconds.
+        multiplier: Backoff growth factor.
+        max_delay: Upper bound of a single backoff delay.
+        budget: Maximum total seconds spent sleeping between attempts.
+        failover: Whether to try other registered providers.
+
+    Raises:
+        ValueError: If ``max_attempts`` is below 1 or a delay or the budget
+            is negative.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        multiplier: float = 2.0,
+        max_delay: float = 20.0,
+        budget: float = 30.0,
+        failover: bool = True,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+        for name, value in (("base_delay", base_delay), ("max_delay", max_delay), ("budget", budget)):
+            if value < 0:
+                raise ValueError(f"{name} must not be negative, got {value}")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.budget = budget
+        self.failover = failover
+
+    def is_transient(self, exc: BaseException) -> bool:
+        """Return whether ``exc`` is worth retrying."""
+        for cause in _causes(exc):
+            if isinstance(cause, (TimeoutError, ConnectionError)):
+                return True
+            name = type(cause).__name__
+            if "Timeout" in name or "Connection" in name:
+                return True
+            status = _status_code(cause)
+            if status is not None:
+                return status in TRANSIENT_STATUS or status >= 500
+        return False
+
+    def retry_after(self, exc: BaseException) -> Optional[float]:
+        """Return the delay requested by a ``Retry-After`` header, if any."""
+        for cause in _causes(exc):
+            headers = getattr(getattr(cause, "response", None), "headers", None)
+            if headers is None:
+                headers = getattr(cause, "headers", None)
+            if not headers:
+                continue
+            value = headers.get("retry-after-ms")
+            if value is not None:
+                try:
+                    return float(value) / 1000
+                except ValueError:
+                    pass
+            value = headers.get("retry-after")
+            if value is None:
+                continue
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+            try:
+                parsed = email.utils.parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                continue
+            return max(0.0, parsed.timestamp() - time.time())
+        return None
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retry number ``attempt`` (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier**attempt)
+        return random.uniform(0, ceiling)
+
+    def next_delay(self, attempt: int, exc: BaseException, spent: float) -> Optional[float]:
+        """Return the delay before the next attempt, or ``None`` to stop retrying.
+
+        Args:
+            attempt: Number of attempts already made on the current target,
+                minus one.
+            exc: The error of the last attempt.
+            spent: Seconds already spent sleeping between attempts.
+        """
+        if attempt + 1 >= self.max_attempts or not self.is_transient(exc):
+            return None
+        delay = self.retry_after(exc)
+        if delay is None:
+            delay = self.backoff(attempt)
+        if spent + delay > self.budget:
+            return None
+        return delay
@@ -1,51 +1,142 @@
 from __future__ import annotations
+import asyncio
 import json
 import logging
 import time
-import promptlayer
 import threading
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from llm_router.schemas.abstractions import Selector
+from llm_router.schemas.abstractions import Council, Selector
 from fyras_models import (
+    CouncilDecision,
     SelectorVote,
-    LLMRouterResponse
+    LLMRouterResponse,
+    RouterMetadata,
+)
+from llm_router.cache import ResponseCache
+from llm_router.routers.circuit import CircuitBreakers
+from llm_router.routers.hedging import HedgePolicy
+from llm_router.routers.policy import SelectionPolicy
+from llm_router.routers.resilience import RetryPolicy
+from llm_router.routers.stats import RouterStats
+from llm_router.schemas.config import TOPIC_TO_MODEL, topic_alternatives, topic_for_model
+from llm_router.schemas.responses import (
+    CouncilVote,
+    ExecutionMetadata,
+    HedgeOutcome,
+    LLMRouterStreamResponse,
 )
 
 from llm_router.exceptions.exceptions import (
+    CircuitOpenError,
     ModelExecutionError,
     RouterError,
     ProviderError,
+    UsableModelForPromptError,
 )
 from llm_router.schemas.env_validator import validate_env_vars, get_env_var
-from llm_router.providers import Provider, AnthropicProvider
-from typing import Optional
+from llm_router.utils.tokens import count_tokens
+from llm_router.providers import (
+    Provider,
+    ProviderResponse,
+    ProviderStreamSummary,
+    AnthropicProvider,
+)
+from typing import Callable, Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+#: Completion tokens assumed when estimating cost, unless the provider's
+#: rate limiter configures its own estimate.
+EXPECTED_COMPLETION_TOKENS = 256
+#: Topics whose models a request is downgraded to when over its ``max_cost``.
+DOWNGRADE_TOPICS = ("GENERAL", "SIMPLE")
+
 
 class LLMRouterService:
     def __init__(
         self,
-        Selector: Selector,
+        Selector: Selector | None = None,
         api_key: str | None = None,
         env_path: Optional[Path] = None,
         provider: Provider | None = None,
+        executor: Executor | None = None,
+        cache: ResponseCache | None = None,
+        providers: Dict[str, Provider] | None = None,
+        hedge: HedgePolicy | None = None,
+        retry: RetryPolicy | None = None,
+        circuit: CircuitBreakers | None = None,
+        policy: SelectionPolicy | None = None,
+        council: Council | None = None,
+        hedge_workers: int | None = None,
     ):
         """Initialize the LLM Router Service.
 
         Args:
-            council: The council implementation to use for decision making.
+            Selector: Selector voting for the model of each prompt. Either
+                it or ``council`` is required.
             api_key: Optional PromptLayer API key. If not provided, will look for
                 ``PROMPTLAYER_API_KEY`` in the environment.
             env_path: Optional path to a ``.env`` file to load required variables.
-            provider: Optional provider implementation. Defaults to
-                :class:`AnthropicProvider`.
+            provider: Optional default provider. Defaults to the first of
+                ``providers``, or :class:`AnthropicProvider` if there are none.
+            executor: Optional executor used by :meth:`ainvoke` to run the
+                CPU-bound selector off the event loop. Defaults to the loop's
+                default executor.
+            cache: Optional response cache consulted before each provider call.
+                Hits are returned with zero cost, the lookup time as latency
+                and a ``cache-hit`` tag.
+            providers: Optional registry of providers keyed by name. Votes
+                naming a provider, the selection ``policy``, hedging, retries
+                and circuit fallbacks choose among them. ``provider`` is always
+                registered under its own name.
+            hedge: Optional :class:`HedgePolicy`. When set, a call that hasn't
+                answered within the policy's delay is raced against a second
+                model for the same topic and the first response wins.
+            retry: Optional :class:`RetryPolicy`. Transient provider errors
+                are retried with jittered backoff, then the same topic's model
+                on the other registered providers is tried. Ignored for
+                hedged calls, whose two legs already cover for each other.
+            circuit: Optional :class:`CircuitBreakers`. Every call's outcome
+                and latency feed the breaker of its (provider, model); while a
+                breaker is open the router goes straight to a fallback from
+                ``TOPIC_TO_MODEL`` instead of calling the failing model.
+            policy: Optional :class:`SelectionPolicy` choosing among the
+                (provider, model) candidates of a vote using the live
+                latency and cost figures in ``self.stats``. Without it the
+                voted provider and model are used.
+            council: Optional :class:`Council` deciding instead of
+                ``Selector``. The decision's votes and weighted results are
+                reported in the response metadata.
+            hedge_workers: Optional size of the thread pool running hedged
+                legs. Defaults to :class:`ThreadPoolExecutor`'s default; size
+                it for the number of concurrent hedged calls.
 
         Raises:
             EnvVarError: If required environment variables are missing.
+            RouterError: If neither a selector nor a council is given.
         """
+        if Selector is None and council is None:
+            raise RouterError("LLMRouterService needs a Selector or a council")
         self.Selector = Selector
-        self.provider = provider or AnthropicProvider(env_path=env_path)
+        self.council = council
+        if provider is None:
+            provider = next(iter(providers.values())) if providers else AnthropicProvider(env_path=env_path)
+        self.provider = provider
+        self.executor = executor
+        self.cache = cache
+        self.providers: Dict[str, Provider] = {**(providers or {}), self.provider.name: self.provider}
+        self.policy = policy
+        self.stats = RouterStats()
+        self.hedge = hedge
+        self.retry = retry
+        self.circuit = circuit
+        self.hedge_workers = hedge_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+        self._recent_routes: deque[Tuple[str, str]] = deque(maxlen=100)
 
         # Validate all required environment variables
         validate_env_vars(env_path)
@@ -54,48 +145,939 @@ class LLMRouterService:
         if not api_key:
             api_key = get_env_var("PROMPTLAYER_API_KEY", env_path)
 
+        import promptlayer
+
         self.pl_client = promptlayer.PromptLayer(api_key=api_key)
 
-    def _execute(self, Selector: SelectorVote, prompt: str) -> LLMRouterResponse:
-        """Execute call through provider and log with PromptLayer."""
-        model = Selector.model
+    def _check_circuit(self, provider: Provider, model: str) -> None:
+        if self.circuit is not None and not self.circuit.allow(provider.name, model):
+            error = CircuitOpenError(
+                f"Circuit open for {provider.name}/{model}", provider=provider.name, model=model
+            )
+            raise ModelExecutionError(str(error), model=model) from error
+
+    def _record_call(self, provider: Provider, model: str, success: bool, latency: float) -> None:
+        self.stats.record_call(provider.name, model, success, latency)
+        if success and self.hedge is not None:
+            self.hedge.record(provider.name, model, latency)
+        if self.circuit is not None:
+            self.circuit.record(provider.name, model, success, latency)
+
+    def _call(self, provider: Provider, model: str, prompt: str) -> Tuple[ProviderResponse, float]:
+        """Run one provider call and return the response with its latency."""
+        self._check_circuit(provider, model)
+        start = time.time()
+        try:
+            resp = provider.complete(model=model, prompt=prompt)
+        except ProviderError as exc:  # pragma: no cover - network issues
+            self._record_call(provider, model, False, time.time() - start)
+            logger.exception("Model execution failed")
+            raise ModelExecutionError(str(exc)) from exc
+        except Exception:
+            self._record_call(provider, model, False, time.time() - start)
+            raise
+        except BaseException:
+            # Cancelled, e.g. a losing hedge leg: free the half-open probe.
+            if self.circuit is not None:
+                self.circuit.release(provider.name, model)
+            raise
+        latency = time.time() - start
+        self._record_call(provider, model, True, latency)
+        return resp, latency
 
+    async def _acall(
+        self, provider: Provider, model: str, prompt: str
+    ) -> Tuple[ProviderResponse, float]:
+        self._check_circuit(provider, model)
+        start = time.time()
         try:
-            start = time.time()
-            resp = self.provider.complete(model=model, prompt=prompt)
-            end = time.time()
+            resp = await provider.acomplete(model=model, prompt=prompt)
         except ProviderError as exc:  # pragma: no cover - network issues
+            self._record_call(provider, model, False, time.time() - start)
             logger.exception("Model execution failed")
             raise ModelExecutionError(str(exc)) from exc
+        except Exception:
+            self._record_call(provider, model, False, time.time() - start)
+            raise
+        except BaseException:
+            # Cancelled, e.g. a losing hedge leg: free the half-open probe.
+            if self.circuit is not None:
+                self.circuit.release(provider.name, model)
+            raise
+        latency = time.time() - start
+        self._record_call(provider, model, True, latency)
+        return resp, latency
+
+    def _usable(self, provider: str, model: str) -> bool:
+        """Return whether the breaker of the pair would admit a call now."""
+        return self.circuit is None or not self.circuit.is_open(provider, model)
+
+    def _voted(self, vote: SelectorVote) -> Tuple[Provider, str]:
+        """Return the provider and model named by the vote."""
+        return self.providers.get(getattr(vote, "provider", None) or "", self.provider), vote.model
+
+    def _candidates(self, vote: SelectorVote) -> list[Tuple[str, str]]:
+        """Return the voted pair and the same topic's model on every other provider."""
+        provider, model = self._voted(vote)
+        models = TOPIC_TO_MODEL.get(self._topic(vote) or "", {})
+        pairs = [(provider.name, model)] + list(models.items())
+        seen, candidates = set(), []
+        for name, model in pairs:
+            if name in self.providers and (name, model) not in seen and self._usable(name, model):
+                seen.add((name, model))
+                candidates.append((name, model))
+        return candidates
+
+    def _route(self, vote: SelectorVote) -> Tuple[Provider, str]:
+        """Pick the (provider, model) for a vote, consulting ``self.policy``."""
+        provider, model = self._voted(vote)
+        if self.policy is None:
+            return provider, model
+        candidates = self._candidates(vote)
+        if not candidates:
+            return provider, model
+        name, model = self.policy.choose(candidates, self.stats)
+        return self.providers[name], model
+
+    def _target(
+        self, vote: SelectorVote, provider: Provider, model: str, usable: Callable[[str, str], bool]
+    ) -> Tuple[Provider, str]:
+        """Return the routed model, or a ``usable`` fallback if its circuit is open."""
+        if self._usable(provider.name, model):
+            return provider, model
+        for name, alternative in topic_alternatives(
+            self._topic(vote), provider.name, model, self.providers
+        ):
+            if usable(name, alternative):
+                logger.warning(
+                    "Circuit open for %s/%s, routing to %s/%s",
+                    provider.name, model, name, alternative,
+                )
+                return self.providers[name], alternative
+        raise ModelExecutionError(
+            f"Circuit open for {provider.name}/{model} and every fallback that fits",
+            model=model,
+        )
+
+    def _routed_metadata(
+        self, provider: Provider, model: str, routed: Tuple[Provider, str]
+    ) -> Optional[ExecutionMetadata]:
+        failover = (provider, model) != routed
+        if not failover and len(self.providers) == 1:
+            return None
+        return ExecutionMetadata(provider=provider.name, failover=failover)
+
+    def _execute(
+        self, Selector: SelectorVote, prompt: str, max_cost: Optional[float] = None
+    ) -> LLMRouterResponse:
+        """Execute call through provider and log with PromptLayer."""
+        routed, budget = self._fit(Selector, *self._route(Selector), prompt, max_cost)
+
+        cached = self._lookup_cache(routed[1], prompt, routed[0])
+        if cached is not None:
+            return self._with_votes(self._with_budget(cached, budget), Selector)
+
+        usable = self._usable_for(prompt, max_cost)
+        if self.hedge is not None:
+            response = self._execute_hedged(Selector, *routed, prompt, usable)
+        elif self.retry is not None:
+            response = self._execute_resilient(Selector, *routed, prompt, usable)
+        else:
+            provider, model = self._target(Selector, *routed, usable)
+            resp, latency = self._call(provider, model, prompt)
+            self._store_cache(model, prompt, resp, provider)
+            response = self._build_response(model, prompt, resp, latency, provider)
+            response.metadata = self._routed_metadata(provider, model, routed)
+        return self._with_votes(self._with_budget(response, budget), Selector)
+
+    async def _aexecute(
+        self, Selector: SelectorVote, prompt: str, max_cost: Optional[float] = None
+    ) -> LLMRouterResponse:
+        """Async counterpart of :meth:`_execute` using ``provider.acomplete``."""
+        routed, budget = self._fit(Selector, *self._route(Selector), prompt, max_cost)
+
+        cached = self._lookup_cache(routed[1], prompt, routed[0])
+        if cached is not None:
+            return self._with_votes(self._with_budget(cached, budget), Selector)
+
+        usable = self._usable_for(prompt, max_cost)
+        if self.hedge is not None:
+            response = await self._aexecute_hedged(Selector, *routed, prompt, usable)
+        elif self.retry is not None:
+            response = await self._aexecute_resilient(Selector, *routed, prompt, usable)
+        else:
+            provider, model = self._target(Selector, *routed, usable)
+            resp, latency = await self._acall(provider, model, prompt)
+            self._store_cache(model, prompt, resp, provider)
+            response = self._build_response(model, prompt, resp, latency, provider)
+            response.metadata = self._routed_metadata(provider, model, routed)
+        return self._with_votes(self._with_budget(response, budget), Selector)
+
+    # ------------------------------------------------------------------
+    # Token budget
+    # ------------------------------------------------------------------
+    def _expected_completion_tokens(self, provider: Provider) -> int:
+        limiter = provider.rate_limiter
+        return limiter.completion_tokens_estimate if limiter is not None else EXPECTED_COMPLETION_TOKENS
+
+    def _estimate_cost(self, provider: Provider, model: str, prompt_tokens: int) -> Optional[float]:
+        try:
+            return provider.get_cost(
+                model=model,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=self._expected_completion_tokens(provider),
+            )
+        except ProviderError:
+            return None
+
+    def _budget_candidates(
+        self, vote: SelectorVote, provider: Provider, model: str
+    ) -> list[Tuple[Provider, str]]:
+        """Return the routed pair, its topic alternatives, then cheaper topics' models."""
+        pairs = [(provider.name, model)]
+        pairs += topic_alternatives(
+            self._topic(vote), provider.name, model, self.providers, fallback_topic=None
+        )
+        names = [provider.name] + [name for name in self.providers if name != provider.name]
+        for topic in DOWNGRADE_TOPICS:
+            pairs += [(name, TOPIC_TO_MODEL[topic][name]) for name in names if name in TOPIC_TO_MODEL[topic]]
+        seen, candidates = set(), []
+        for pair in pairs:
+            if pair not in seen and self._usable(*pair):
+                seen.add(pair)
+                candidates.append((self.providers[pair[0]], pair[1]))
+        return candidates
+
+    def _fit(
+        self,
+        vote: SelectorVote,
+        provider: Provider,
+        model: str,
+        prompt: str,
+        max_cost: Optional[float],
+    ) -> Tuple[Tuple[Provider, str], Optional[ExecutionMetadata]]:
+        """Return the pair to call given the prompt size and ``max_cost``.
+
+        The routed pair is kept when the prompt fits its context window and,
+        with ``max_cost``, its estimated cost is within the cap. Otherwise the
+        first of :meth:`_budget_candidates` that satisfies both is used. The
+        prompt is counted once; the count is cached for the rate limiter.
+        """
+        tokens = count_tokens(prompt)
+        window = provider.context_window(model)
+        if max_cost is None and (window is None or tokens <= window):
+            return (provider, model), None
+
+        for candidate, candidate_model in self._budget_candidates(vote, provider, model):
+            if not self._fits(candidate, candidate_model, tokens, max_cost):
+                continue
+            estimate = self._estimate_cost(candidate, candidate_model, tokens)
+            downgraded = (candidate, candidate_model) != (provider, model)
+            if downgraded:
+                logger.info(
+                    "Routing %d-token prompt from %s/%s to %s/%s",
+                    tokens, provider.name, model, candidate.name, candidate_model,
+                )
+            budget = ExecutionMetadata(
+                provider=candidate.name, estimated_cost=estimate, downgraded=downgraded
+            )
+            return (candidate, candidate_model), budget
 
+        limit = f" within a cost of {max_cost}" if max_cost is not None else ""
+        raise UsableModelForPromptError(
+            f"No model fits a {tokens}-token prompt{limit}", prompt_tokens=tokens, max_cost=max_cost
+        )
+
+    def _fits(
+        self, provider: Provider, model: str, tokens: int, max_cost: Optional[float]
+    ) -> bool:
+        """Return whether a ``tokens``-token prompt fits the model and ``max_cost``."""
+        window = provider.context_window(model)
+        if window is not None and tokens > window:
+            return False
+        if max_cost is None:
+            return True
+        estimate = self._estimate_cost(provider, model, tokens)
+        return estimate is not None and estimate <= max_cost
+
+    def _usable_for(self, prompt: str, max_cost: Optional[float]) -> Callable[[str, str], bool]:
+        """Return the filter for the fallbacks of a request.
+
+        A fallback taken by failover, hedging or an open circuit must pass
+        the same checks as the pair chosen by :meth:`_fit`: its circuit
+        admits calls, the prompt fits its context window and its estimate
+        is within ``max_cost``.
+        """
+        tokens = count_tokens(prompt)
+
+        def usable(name: str, model: str) -> bool:
+            return self._usable(name, model) and self._fits(
+                self.providers[name], model, tokens, max_cost
+            )
+
+        return usable
+
+    @staticmethod
+    def _with_budget(
+        response: LLMRouterResponse, budget: Optional[ExecutionMetadata]
+    ) -> LLMRouterResponse:
+        if budget is None:
+            return response
+        metadata = response.metadata.model_dump() if response.metadata is not None else {}
+        metadata.update(estimated_cost=budget.estimated_cost, downgraded=budget.downgraded)
+        metadata.setdefault("provider", budget.provider)
+        response.metadata = ExecutionMetadata(**metadata)
+        return response
+
+    def _topic(self, vote: SelectorVote) -> Optional[str]:
+        return getattr(vote, "topic", None) or topic_for_model(self._voted(vote)[0].name, vote.model)
+
+    # ------------------------------------------------------------------
+    # Retries and failover
+    # ------------------------------------------------------------------
+    def _retry_targets(
+        self,
+        vote: SelectorVote,
+        provider: Provider,
+        model: str,
+        usable: Callable[[str, str], bool],
+    ) -> list[Tuple[Provider, str]]:
+        targets = [(provider, model)] if self._usable(provider.name, model) else []
+        if self.retry.failover:
+            alternatives = topic_alternatives(
+                self._topic(vote), provider.name, model, self.providers, fallback_topic=None
+            )
+            targets += [(self.providers[name], alt) for name, alt in alternatives if usable(name, alt)]
+        if not targets:
+            raise ModelExecutionError(
+                f"Circuit open for {provider.name}/{model} and every fallback that fits",
+                model=model,
+            )
+        return targets
+
+    def _execute_resilient(
+        self,
+        vote: SelectorVote,
+        primary: Provider,
+        primary_model: str,
+        prompt: str,
+        usable: Callable[[str, str], bool],
+    ) -> LLMRouterResponse:
+        """Call the chosen model, retrying and failing over per ``self.retry``."""
+        start = time.perf_counter()
+        attempts, slept = 0, 0.0
+        error: ModelExecutionError | None = None
+        for provider, model in self._retry_targets(vote, primary, primary_model, usable):
+            for attempt in range(self.retry.max_attempts):
+                attempts += 1
+                attempt_start = time.perf_counter()
+                try:
+                    resp, latency = self._call(provider, model, prompt)
+                except ModelExecutionError as exc:
+                    error = exc
+                    delay = self.retry.next_delay(attempt, exc, slept)
+                    if delay is None:
+                        break
+                    logger.warning("Retrying %s/%s in %.2fs: %s", provider.name, model, delay, exc)
+                    time.sleep(delay)
+                    slept += delay
+                    continue
+                return self._resilient_response(
+                    provider, model, prompt, resp, latency, attempts,
+                    attempt_start - start, failover=(provider, model) != (primary, primary_model),
+                )
+            logger.warning("Giving up on %s/%s after %d attempt(s)", provider.name, model, attempt + 1)
+        raise error
+
+    async def _aexecute_resilient(
+        self,
+        vote: SelectorVote,
+        primary: Provider,
+        primary_model: str,
+        prompt: str,
+        usable: Callable[[str, str], bool],
+    ) -> LLMRouterResponse:
+        start = time.perf_counter()
+        attempts, slept = 0, 0.0
+        error: ModelExecutionError | None = None
+        for provider, model in self._retry_targets(vote, primary, primary_model, usable):
+            for attempt in range(self.retry.max_attempts):
+                attempts += 1
+                attempt_start = time.perf_counter()
+                try:
+                    resp, latency = await self._acall(provider, model, prompt)
+                except ModelExecutionError as exc:
+                    error = exc
+                    delay = self.retry.next_delay(attempt, exc, slept)
+                    if delay is None:
+                        break
+                    logger.warning("Retrying %s/%s in %.2fs: %s", provider.name, model, delay, exc)
+                    await asyncio.sleep(delay)
+                    slept += delay
+                    continue
+                return self._resilient_response(
+                    provider, model, prompt, resp, latency, attempts,
+                    attempt_start - start, failover=(provider, model) != (primary, primary_model),
+                )
+            logger.warning("Giving up on %s/%s after %d attempt(s)", provider.name, model, attempt + 1)
+        raise error
+
+    def _resilient_response(
+        self,
+        provider: Provider,
+        model: str,
+        prompt: str,
+        resp: ProviderResponse,
+        latency: float,
+        attempts: int,
+        retry_time: float,
+        failover: bool,
+    ) -> LLMRouterResponse:
+        self._store_cache(model, prompt, resp, provider)
+        response = self._build_response(model, prompt, resp, latency, provider)
+        response.metadata = ExecutionMetadata(
+            provider=provider.name,
+            attempts=attempts,
+            retry_time=retry_time,
+            failover=failover,
+        )
+        return response
+
+    # ------------------------------------------------------------------
+    # Hedging
+    # ------------------------------------------------------------------
+    def _hedge_plan(
+        self, vote: SelectorVote, provider: Provider, model: str, usable: Callable[[str, str], bool]
+    ) -> Tuple[HedgeOutcome, Optional[Tuple[str, str]]]:
+        secondary = self.hedge.secondary(
+            self._topic(vote), provider.name, model, self.providers, usable=usable
+        )
+        outcome = HedgeOutcome(
+            primary_provider=provider.name,
+            primary_model=model,
+            delay=self.hedge.delay_for(provider.name, model),
+        )
+        if secondary is not None:
+            outcome.secondary_provider, outcome.secondary_model = secondary
+        return outcome, secondary
+
+    def _background_executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(thread_name_prefix="llm-router")
+        return self._pool
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        """Pool of the hedged legs, kept apart from warmups and speculation."""
+        if self._hedge_pool is None:
+            with self._pool_lock:
+                if self._hedge_pool is None:
+                    self._hedge_pool = ThreadPoolExecutor(
+                        max_workers=self.hedge_workers, thread_name_prefix="llm-router-hedge"
+                    )
+        return self._hedge_pool
+
+    def _execute_hedged(
+        self,
+        vote: SelectorVote,
+        primary: Provider,
+        primary_model: str,
+        prompt: str,
+        usable: Callable[[str, str], bool],
+    ) -> LLMRouterResponse:
+        """Run the primary call and hedge it if it's slower than the policy delay.
+
+        A thread can't be interrupted, so a losing leg that is already in
+        flight runs to completion in the background; its response is
+        dropped but its cost is billed once it finishes (see
+        :meth:`_bill_late_leg`). The delay counts from when the primary
+        starts, so time queued behind a busy pool doesn't trigger hedges.
+        """
+        outcome, secondary = self._hedge_plan(vote, primary, primary_model, usable)
+        pool = self._hedge_executor()
+        started = threading.Event()
+
+        def primary_leg() -> Tuple[ProviderResponse, float]:
+            started.set()
+            return self._call(primary, primary_model, prompt)
+
+        start = time.perf_counter()
+        legs: Dict[Future, Tuple[str, Provider, str]] = {
+            pool.submit(primary_leg): ("primary", primary, primary_model)
+        }
+        started.wait()
+        done, pending = wait(legs, timeout=outcome.delay)
+        failed_fast = any(future.exception() is not None for future in done)
+        if (not done or failed_fast) and secondary is not None:
+            outcome.hedged = True
+            provider = self.providers[secondary[0]]
+            future = pool.submit(self._call, provider, secondary[1], prompt)
+            legs[future] = ("secondary", provider, secondary[1])
+            pending = set(pending) | {future}
+
+        results: Dict[str, Tuple[Provider, str, ProviderResponse]] = {}
+        errors: Dict[str, BaseException] = {}
+        while not results and (done or pending):
+            if not done:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                label, provider, model = legs[future]
+                if future.exception() is not None:
+                    errors[label] = future.exception()
+                else:
+                    results[label] = (provider, model, future.result()[0])
+            done = set()
+        late = [future for future in pending if not future.cancel()]
+
+        if not results:
+            raise errors.get("primary") or next(iter(errors.values()))
+        if late:
+            outcome.pending = legs[late[0]][0]
+        response = self._hedge_response(prompt, outcome, results, time.perf_counter() - start)
+        for future in late:
+            self._bill_late_leg(response, legs[future], future)
+        return response
+
+    def _bill_late_leg(
+        self, response: LLMRouterResponse, leg: Tuple[str, Provider, str], future: Future
+    ) -> None:
+        """Add the cost of a losing leg to ``response`` when the leg finishes."""
+        label, provider, model = leg
+
+        def bill(done: Future) -> None:
+            if done.cancelled() or done.exception() is not None:
+                response.metadata.hedge.pending = None
+                return
+            cost = self._cost(provider, model, done.result()[0])
+            # Read the metadata now: it may have been rebuilt since.
+            hedge = response.metadata.hedge
+            setattr(hedge, f"{label}_cost", cost)
+            hedge.pending = None
+            response.cost += cost
+
+        future.add_done_callback(bill)
+
+    async def _aexecute_hedged(
+        self,
+        vote: SelectorVote,
+        primary: Provider,
+        primary_model: str,
+        prompt: str,
+        usable: Callable[[str, str], bool],
+    ) -> LLMRouterResponse:
+        """Async hedging; the losing leg is cancelled."""
+        outcome, secondary = self._hedge_plan(vote, primary, primary_model, usable)
+        start = time.perf_counter()
+        legs: Dict[asyncio.Future, Tuple[str, Provider, str]] = {
+            asyncio.ensure_future(self._acall(primary, primary_model, prompt)): (
+                "primary", primary, primary_model,
+            )
+        }
+        done, pending = await asyncio.wait(legs, timeout=outcome.delay)
+        failed_fast = any(task.exception() is not None for task in done)
+        if (not done or failed_fast) and secondary is not None:
+            outcome.hedged = True
+            provider = self.providers[secondary[0]]
+            task = asyncio.ensure_future(self._acall(provider, secondary[1], prompt))
+            legs[task] = ("secondary", provider, secondary[1])
+            pending = set(pending) | {task}
+
+        results: Dict[str, Tuple[Provider, str, ProviderResponse]] = {}
+        errors: Dict[str, BaseException] = {}
+        try:
+            while not results and (done or pending):
+                if not done:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    label, provider, model = legs[task]
+                    if task.exception() is not None:
+                        errors[label] = task.exception()
+                    else:
+                        results[label] = (provider, model, task.result()[0])
+                done = set()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if not results:
+            raise errors.get("primary") or next(iter(errors.values()))
+        return self._hedge_response(prompt, outcome, results, time.perf_counter() - start)
+
+    def _hedge_response(
+        self,
+        prompt: str,
+        outcome: HedgeOutcome,
+        results: Dict[str, Tuple[Provider, str, ProviderResponse]],
+        latency: float,
+    ) -> LLMRouterResponse:
+        """Build the response from the winning leg and record every billed cost."""
+        # Both legs can finish in the same wait; the primary wins a tie.
+        outcome.winner = "primary" if "primary" in results else "secondary"
+        costs = {
+            label: self._cost(provider, model, resp)
+            for label, (provider, model, resp) in results.items()
+        }
+        outcome.primary_cost = costs.get("primary")
+        outcome.secondary_cost = costs.get("secondary")
+
+        provider, model, resp = results[outcome.winner]
+        self._store_cache(model, prompt, resp, provider)
+        return LLMRouterResponse(
+            model=model,
+            prompt=prompt,
+            response=resp.text,
+            cost=sum(costs.values()),
+            latency=latency,
+            metadata=ExecutionMetadata(provider=provider.name, hedge=outcome),
+        )
+
+    def _lookup_cache(
+        self, model: str, prompt: str, provider: Provider | None = None
+    ) -> LLMRouterResponse | None:
+        if self.cache is None:
+            return None
+        provider = provider or self.provider
+        start = time.perf_counter()
+        try:
+            resp = self.cache.lookup(provider.name, model, prompt)
+        except Exception as exc:  # pragma: no cover - cache issues shouldn't block
+            logger.warning("Cache lookup failed: %s", exc)
+            return None
+        if resp is None:
+            return None
+        return LLMRouterResponse(
+            model=model,
+            prompt=prompt,
+            response=resp.text,
+            cost=0.0,
+            latency=time.perf_counter() - start,
+            metadata=RouterMetadata(tags=["cache-hit"]),
+        )
+
+    def _store_cache(
+        self,
+        model: str,
+        prompt: str,
+        resp: ProviderResponse,
+        provider: Provider | None = None,
+    ) -> None:
+        if self.cache is None:
+            return
+        provider = provider or self.provider
+        try:
+            self.cache.store(provider.name, model, prompt, resp)
+        except Exception as exc:  # pragma: no cover - cache issues shouldn't block
+            logger.warning("Cache store failed: %s", exc)
+
+    def _cost(self, provider: Provider, model: str, resp: ProviderResponse) -> float:
         # Cost tracking handled by provider
         try:
-            cost = self.provider.get_cost(
+            cost = provider.get_cost(
                 model=model,
                 prompt_tokens=resp.prompt_tokens,
                 completion_tokens=resp.completion_tokens,
             )
         except ProviderError as exc:  # pragma: no cover - cost issues shouldn't block
             logger.warning("Cost calculation failed: %s", exc)
-            cost = 0.0
-
-        response_text = resp.text
+            return 0.0
+        self.stats.record_cost(
+            provider.name, model, cost, resp.prompt_tokens + resp.completion_tokens
+        )
+        return cost
 
+    def _build_response(
+        self,
+        model: str,
+        prompt: str,
+        resp: ProviderResponse,
+        latency: float,
+        provider: Provider | None = None,
+    ) -> LLMRouterResponse:
         return LLMRouterResponse(
             model=model,
             prompt=prompt,
-            response=response_text,
-            cost=cost,
-            latency=end - start,
+            response=resp.text,
+            cost=self._cost(provider or self.provider, model, resp),
+            latency=latency,
+        )
+
+    def _council_vote(self, decision: CouncilDecision) -> CouncilVote:
+        """Turn a council decision into the vote it is routed on.
+
+        Only votes whose provider is registered and serves ``final_model``
+        are considered; plain votes count for the default provider.
+        """
+        chosen = [
+            vote
+            for vote in decision.votes
+            if vote.model == decision.final_model
+            and self._serves(getattr(vote, "provider", None) or self.provider.name, vote.model)
+        ]
+        if chosen:
+            fields = max(chosen, key=lambda vote: vote.weight).model_dump()
+        else:
+            # No usable vote for it, e.g. a council's fallback model.
+            fields = {"selector_name": type(self.council).__name__, "model": decision.final_model}
+            fields.update(self._serving(decision.final_model))
+        fields.update(votes=decision.votes, weighted_results=decision.weighted_results)
+        return CouncilVote(**fields)
+
+    def _serving(self, model: str) -> Dict[str, str]:
+        """Return the provider and topic of a registered provider serving ``model``.
+
+        Raises:
+            RouterError: If no registered provider serves ``model``.
+        """
+        for name in [self.provider.name, *self.providers]:
+            if self._serves(name, model):
+                return {"provider": name, "topic": topic_for_model(name, model)}
+        raise RouterError(f"No registered provider serves {model!r}")
+
+    def _serves(self, name: str, model: str) -> bool:
+        """Return whether the registered provider ``name`` serves ``model``."""
+        return name in self.providers and topic_for_model(name, model) is not None
+
+    def _with_votes(self, response: LLMRouterResponse, vote: SelectorVote) -> LLMRouterResponse:
+        """Report the votes behind a council decision in the metadata."""
+        if not isinstance(vote, CouncilVote):
+            return response
+        metadata = response.metadata.model_dump() if response.metadata is not None else {}
+        metadata.update(
+            votes=[v.model_dump() for v in vote.votes],
+            weighted_results=dict(vote.weighted_results),
+            tags=[*(metadata.get("tags") or []), "council-router"],
         )
+        response.metadata = ExecutionMetadata(**metadata)
+        return response
+
+    def _decide(self, prompt: str) -> SelectorVote:
+        """Return the council's vote, or the selector's without a council."""
+        if self.council is not None:
+            return self._council_vote(self.council.decide(prompt))
+        return self.Selector.select_model(prompt)
 
-    def invoke(self, prompt: str) -> LLMRouterResponse:
-        """Main entry point: ask council to decide, then execute."""
+    def _select(self, prompt: str) -> SelectorVote:
         try:
-            decision = self.Selector.select_model(prompt)
+            decision = self._decide(prompt)
         except Exception as exc:  # pragma: no cover - protective
             logger.exception("Council decision failed")
             raise RouterError(str(exc)) from exc
+        self._remember(decision)
+        return decision
+
+    def _remember(self, vote: SelectorVote) -> None:
+        provider, model = self._voted(vote)
+        self._recent_routes.append((provider.name, model))
 
-        return self._execute(decision, prompt)
+    def invoke(self, prompt: str, max_cost: Optional[float] = None) -> LLMRouterResponse:
+        """Main entry point: ask council to decide, then execute.
+
+        Args:
+            prompt: The prompt to route.
+            max_cost: Optional cap on the estimated cost of the request. If
+                the chosen model's estimate exceeds it, the request is
+                downgraded to the topic's model on another provider or to a
+                cheaper topic's model.
+        """
+        return self._execute(self._select(prompt), prompt, max_cost=max_cost)
+
+    def predicted_route(self) -> Optional[Tuple[str, str]]:
+        """Return the (provider, model) voted most often by recent decisions."""
+        if not self._recent_routes:
+            return None
+        return Counter(self._recent_routes.copy()).most_common(1)[0][0]
+
+    def predicted_model(self) -> Optional[str]:
+        """Return the model voted most often by recent routing decisions."""
+        route = self.predicted_route()
+        return route[1] if route is not None else None
+
+    def invoke_pipelined(self, prompt: str, speculative: bool = False) -> LLMRouterResponse:
+        """Like :meth:`invoke`, but use the classification time on the network.
+
+        By default the provider connection is warmed up (see
+        :meth:`Provider.warmup`) while the selector runs. With ``speculative``
+        the completion request to :meth:`predicted_route` is started instead;
+        if the selector picks a different route the speculative request is
+        abandoned and the chosen model is called as usual. Note that an
+        abandoned request may still be billed by the provider. No request is
+        started when the prediction is cached or the prompt doesn't fit its
+        context window, and speculation is skipped when hedging, a selection
+        policy, retries or circuit breakers are enabled, since those choose
+        the model per call. A speculative request that fails is replaced by
+        a regular :meth:`invoke` call.
+
+        ``metadata.overlap_saved`` reports how many seconds of network work
+        ran concurrently with classification, i.e. how much faster the
+        response was than running the two steps in sequence.
+        """
+        pool = self._background_executor()
+        predicted = cached = None
+        if speculative and all(
+            option is None for option in (self.hedge, self.policy, self.retry, self.circuit)
+        ):
+            predicted = self.predicted_route()
+        start = time.perf_counter()
+        if predicted is not None:
+            provider = self.providers[predicted[0]]
+            cached = self._lookup_cache(predicted[1], prompt, provider)
+            window = provider.context_window(predicted[1])
+            if window is not None and count_tokens(prompt) > window:
+                predicted = None
+        if predicted is not None and cached is None:
+            background = pool.submit(self._call, provider, predicted[1], prompt)
+        elif predicted is None:
+            route = self.predicted_route()
+            provider = self.providers.get(route[0], self.provider) if route else self.provider
+            background = pool.submit(self._timed_warmup, provider)
+
+        decision = self._select(prompt)
+        classify_time = time.perf_counter() - start
+
+        speculation = None
+        saved = 0.0
+        if predicted is None:
+            # Wait for the warmup so the call below reuses its connection.
+            saved = min(classify_time, background.result())
+            response = self._execute(decision, prompt)
+        elif (self._voted(decision)[0].name, decision.model) != predicted:
+            speculation = "miss"
+            if cached is None and not background.cancel():
+                logger.info("Abandoning speculative request to %s/%s", *predicted)
+            response = self._execute(decision, prompt)
+        elif cached is not None:
+            speculation = "hit"
+            response = self._with_votes(cached, decision)
+        else:
+            try:
+                resp, latency = background.result()
+            except ModelExecutionError:
+                logger.warning("Speculative request to %s/%s failed", *predicted)
+                speculation = "failed"
+                response = self._execute(decision, prompt)
+            else:
+                speculation = "hit"
+                saved = min(classify_time, latency)
+                self._store_cache(decision.model, prompt, resp, provider)
+                response = self._build_response(decision.model, prompt, resp, latency, provider)
+                response = self._with_votes(response, decision)
+
+        metadata = response.metadata.model_dump() if response.metadata is not None else {}
+        metadata.update(overlap_saved=saved, speculation=speculation)
+        response.metadata = ExecutionMetadata(**metadata)
+        return response
+
+    def _timed_warmup(self, provider: Provider) -> float:
+        start = time.perf_counter()
+        if not provider.warmup():
+            return 0.0
+        return time.perf_counter() - start
+
+    async def ainvoke(self, prompt: str, max_cost: Optional[float] = None) -> LLMRouterResponse:
+        """Async entry point mirroring :meth:`invoke`.
+
+        Selection is CPU-bound, so it runs in ``self.executor`` to keep the event
+        loop free; the provider call is awaited natively.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            decision = await loop.run_in_executor(self.executor, self._decide, prompt)
+        except Exception as exc:  # pragma: no cover - protective
+            logger.exception("Council decision failed")
+            raise RouterError(str(exc)) from exc
+        self._remember(decision)
+
+        return await self._aexecute(decision, prompt, max_cost=max_cost)
+
+    def invoke_stream(self, prompt: str) -> Iterator[str | LLMRouterStreamResponse]:
+        """Streaming entry point: yield text chunks as the model produces them.
+
+        The last item is an :class:`LLMRouterStreamResponse` with the full text,
+        token counts, cost, time-to-first-token and total latency. Like
+        :meth:`invoke`, the stream goes to a fallback while the routed model's
+        circuit is open, and its outcome, latency and cost feed ``self.stats``
+        and the circuit breakers. A stream abandoned by the caller counts as
+        neither a success nor a failure.
+        """
+        decision = self._select(prompt)
+        routed, _ = self._fit(decision, *self._route(decision), prompt, None)
+        provider, model = self._target(decision, *routed, self._usable_for(prompt, None))
+        self._check_circuit(provider, model)
+        start = time.time()
+        summary: Optional[ProviderStreamSummary] = None
+        try:
+            for item in provider.stream(model=model, prompt=prompt):
+                if isinstance(item, ProviderStreamSummary):
+                    summary = item
+                    break
+                yield item
+        except ProviderError as exc:
+            self._record_call(provider, model, False, time.time() - start)
+            logger.exception("Model streaming failed")
+            raise ModelExecutionError(str(exc)) from exc
+        except Exception:
+            self._record_call(provider, model, False, time.time() - start)
+            raise
+        except BaseException:
+            # The caller closed the stream early: free the half-open probe.
+            if self.circuit is not None:
+                self.circuit.release(provider.name, model)
+            raise
+        self._record_call(provider, model, True, time.time() - start)
+        if summary is None:
+            return
+        self.stats.record_cost(
+            provider.name, model, summary.cost, summary.prompt_tokens + summary.completion_tokens
+        )
+        yield LLMRouterStreamResponse(
+            model=model,
+            prompt=prompt,
+            response=summary.text,
+            cost=summary.cost,
+            latency=summary.latency,
+            prompt_tokens=summary.prompt_tokens,
+            completion_tokens=summary.completion_tokens,
+            time_to_first_token=summary.time_to_first_token,
+        )
+
+    def _select_batch(self, prompts: list[str], batch_size: int) -> list[SelectorVote]:
+        """Use the selector's batched API when it has one."""
+        if self.council is not None:
+            return [self._decide(prompt) for prompt in prompts]
+        select_models = getattr(self.Selector, "select_models", None)
+        if select_models is not None:
+            return select_models(prompts, batch_size=batch_size)
+        return [self.Selector.select_model(prompt) for prompt in prompts]
+
+    def invoke_batch(
+        self,
+        prompts: list[str],
+        batch_size: int = 8,
+        max_workers: int = 8,
+    ) -> list[LLMRouterResponse]:
+        """Route many prompts at once.
+
+        All prompts are classified together so the selector can batch its
+        forward passes, then the provider calls run on ``max_workers`` threads.
+        With a council, each prompt is decided separately. Responses are returned in the same order as ``prompts``.
+        """
+        prompts = list(prompts)
+        if not prompts:
+            return []
+
+        try:
+            decisions = self._select_batch(prompts, batch_size)
+        except Exception as exc:  # pragma: no cover - protective
+            logger.exception("Batch selection failed")
+            raise RouterError(str(exc)) from exc
+
+        if len(decisions) != len(prompts):
+            raise RouterError(
+                f"Selector returned {len(decisions)} votes for {len(prompts)} prompts"
+            )
+        for decision in decisions:
+            self._remember(decision)
 
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self._execute, decisions, prompts))
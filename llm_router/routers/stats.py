@@ -0,0 +1,107 @@
+"""Live latency and cost statistics per (provider, model) pair."""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class PairStats(BaseModel):
+    """Smoothed figures for one (provider, model) pair.
+
+    ``latency``, ``cost_per_token`` and ``error_rate`` are exponentially
+    weighted moving averages; ``p95_latency`` is taken over the most recent
+    successful calls. Each is ``None`` until its first observation.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    latency: Optional[float] = None
+    p95_latency: Optional[float] = None
+    error_rate: Optional[float] = None
+    cost_per_token: Optional[float] = None
+
+    @property
+    def cost_per_1k(self) -> Optional[float]:
+        return self.cost_per_token * 1000 if self.cost_per_token is not None else None
+
+
+class RouterStats:
+    """Exponentially weighted latency, cost and error rate per pair.
+
+    :class:`LLMRouterService` records every provider call here; selection
+    policies read the figures to choose among candidate pairs. Recording is
+    O(1): the moving averages are updated in place and latencies are appended
+    to a ring buffer of ``window`` samples, whose p95 is only computed when a
+    policy reads it after new samples arrived.
+
+    Args:
+        alpha: Weight of the newest observation in the moving averages.
+        window: Number of recent latencies kept per pair for the p95.
+    """
+
+    def __init__(self, alpha: float = 0.2, window: int = 100) -> None:
+        self.alpha = alpha
+        self.window = window
+        self._pairs: Dict[Tuple[str, str], PairStats] = {}
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+        self._stale: set = set()
+        self._lock = threading.Lock()
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        return value if current is None else current + self.alpha * (value - current)
+
+    def _pair(self, provider: str, model: str) -> PairStats:
+        pair = self._pairs.get((provider, model))
+        if pair is None:
+            pair = self._pairs[(provider, model)] = PairStats()
+            self._latencies[(provider, model)] = deque(maxlen=self.window)
+        return pair
+
+    def record_call(self, provider: str, model: str, success: bool, latency: float) -> None:
+        """Record one provider call; only successful calls update the latency."""
+        with self._lock:
+            pair = self._pair(provider, model)
+            pair.calls += 1
+            pair.error_rate = self._ewma(pair.error_rate, 0.0 if success else 1.0)
+            if success:
+                pair.latency = self._ewma(pair.latency, latency)
+                self._latencies[(provider, model)].append(latency)
+                self._stale.add((provider, model))
+            else:
+                pair.errors += 1
+
+    def _refresh(self, key: Tuple[str, str]) -> None:
+        if key not in self._stale:
+            return
+        self._stale.discard(key)
+        samples = sorted(self._latencies[key])
+        index = max(0, math.ceil(0.95 * len(samples)) - 1)
+        self._pairs[key].p95_latency = samples[index]
+
+    def record_cost(self, provider: str, model: str, cost: float, tokens: int) -> None:
+        """Record the cost of a call that used ``tokens`` tokens."""
+        if tokens <= 0:
+            return
+        with self._lock:
+            pair = self._pair(provider, model)
+            pair.cost_per_token = self._ewma(pair.cost_per_token, cost / tokens)
+
+    def get(self, provider: str, model: str) -> PairStats:
+        """Return a snapshot of the pair's figures."""
+        with self._lock:
+            pair = self._pairs.get((provider, model))
+            if pair is None:
+                return PairStats()
+            self._refresh((provider, model))
+            return pair.model_copy()
+
+    def snapshot(self) -> Dict[Tuple[str, str], PairStats]:
+        with self._lock:
+            for key in list(self._stale):
+                self._refresh(key)
+            return {key: pair.model_copy() for key, pair in self._pairs.items()}
@@ -2,13 +2,26 @@
 from __future__ import annotations
 import os
 
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 # Router configs
 CANDIDATE_LABELS = ["SIMPLE","COMPLEX","FINANCE","PROGRAMMING","TECHNOLOGY","ENTERTAINMENT","HEALTH"]
 
 
+# Keyword tables used by the heuristic pre-router, one per candidate label.
+# Matching is case-insensitive on word boundaries.
+TOPIC_KEYWORDS: Dict[str, tuple] = {
+    "SIMPLE": ("hi", "hello", "hey", "thanks", "thank you", "ok", "okay", "yes", "no", "bye", "good morning"),
+    "COMPLEX": ("analyze", "analyse", "compare", "derive", "prove", "step by step", "trade-off", "trade-offs", "architecture", "evaluate", "comprehensive", "in depth"),
+    "FINANCE": ("stock", "stocks", "bond", "bonds", "invest", "investment", "portfolio", "interest rate", "inflation", "tax", "taxes", "loan", "mortgage", "dividend", "revenue", "budget", "finance", "financial"),
+    "PROGRAMMING": ("python", "javascript", "typescript", "java", "rust", "function", "bug", "compile", "compiler", "stack trace", "exception", "regex", "sql", "debug", "refactor", "code", "api", "unit test"),
+    "TECHNOLOGY": ("software", "hardware", "cloud", "gpu", "cpu", "smartphone", "internet", "network", "laptop", "kubernetes", "technology", "ai", "5g"),
+    "ENTERTAINMENT": ("movie", "movies", "film", "song", "songs", "music", "game", "games", "tv show", "celebrity", "actor", "actress", "netflix", "album"),
+    "HEALTH": ("symptom", "symptoms", "diagnosis", "doctor", "medicine", "medication", "disease", "diet", "exercise", "blood pressure", "vaccine", "therapy", "health"),
+}
+
+
 # Mapping from topic to model names for each provider.
 #
 # These values should correspond to model identifiers accepted by the
@@ -56,3 +69,36 @@ TOPIC_TO_MODEL = {
     }
 }
 
+
+
+def topic_for_model(provider: str, model: str) -> Optional[str]:
+    """Return the first topic whose model for ``provider`` is ``model``."""
+    for topic, models in TOPIC_TO_MODEL.items():
+        if models.get(provider) == model:
+            return topic
+    return None
+
+
+def topic_alternatives(
+    topic: Optional[str],
+    provider: str,
+    model: str,
+    available: Iterable[str],
+    fallback_topic: Optional[str] = "GENERAL",
+) -> List[Tuple[str, str]]:
+    """Return ``(provider, model)`` pairs that can stand in for ``model``.
+
+    First the same topic's model on every other provider in ``available``,
+    in that order, then ``fallback_topic``'s model on ``provider`` if it
+    differs from ``model``. Unknown topics use ``fallback_topic``.
+    """
+    default = TOPIC_TO_MODEL.get(fallback_topic or "GENERAL", TOPIC_TO_MODEL["GENERAL"])
+    models = TOPIC_TO_MODEL.get(topic or "", default)
+    candidates = [
+        (name, models[name]) for name in available if name != provider and name in models
+    ]
+    if fallback_topic is not None:
+        fallback = TOPIC_TO_MODEL.get(fallback_topic, {}).get(provider)
+        if fallback and fallback != model:
+            candidates.append((provider, fallback))
+    return candidates
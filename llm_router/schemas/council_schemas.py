@@ -0,0 +1,17 @@
+"""Council and response schemas, re-exported from ``fyras_models``."""
+
+from fyras_models import (
+    CouncilDecision,
+    LLMResponse,
+    LLMRouterResponse,
+    RouterMetadata,
+    SelectorVote,
+)
+
+__all__ = [
+    "CouncilDecision",
+    "LLMResponse",
+    "LLMRouterResponse",
+    "RouterMetadata",
+    "SelectorVote",
+]
@@ -0,0 +1,100 @@
+"""Router-specific extensions of the shared response schemas."""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from fyras_models import LLMRouterResponse, RouterMetadata, SelectorVote
+
+
+class RoutingVote(SelectorVote):
+    """Selector vote for a (provider, model) pair and the prompt's topic.
+
+    The router sends the request to ``provider`` when it is registered and
+    uses ``topic`` to find equivalent models in ``TOPIC_TO_MODEL``, e.g. for
+    hedging or for a selection policy. Plain :class:`SelectorVote` instances
+    are still accepted everywhere; they go to the router's default provider
+    and their topic is looked up from the model name.
+
+    ``fallback`` marks a vote for a default model cast because the prompt
+    couldn't be classified, e.g. after a pipeline error. Caching selectors
+    don't store such votes, so the prompt is classified again next time.
+    """
+
+    topic: Optional[str] = None
+    provider: Optional[str] = None
+    fallback: bool = False
+
+
+class CouncilVote(RoutingVote):
+    """The vote a council decision is routed on, with the votes behind it.
+
+    :class:`LLMRouterService` builds it from a ``CouncilDecision``: the
+    fields of the heaviest vote for ``final_model`` (so its provider and
+    topic are kept), plus every vote and the summed weight per model, which
+    end up in ``RouterMetadata.votes`` and ``weighted_results``.
+    """
+
+    votes: List[SelectorVote] = []
+    weighted_results: Dict[str, float] = {}
+
+
+class HedgeOutcome(BaseModel):
+    """Result of a hedged provider call.
+
+    ``primary_cost`` and ``secondary_cost`` are set for each leg that
+    completed and was therefore billed; a leg that was cancelled before
+    answering has ``None``. A losing leg that was still running when the
+    response was returned is named in ``pending``; once it finishes its
+    cost is filled in here and added to the response's ``cost``, and
+    ``pending`` is cleared.
+    """
+
+    primary_provider: str
+    primary_model: str
+    secondary_provider: Optional[str] = None
+    secondary_model: Optional[str] = None
+    delay: float
+    hedged: bool = False
+    winner: str = "primary"
+    primary_cost: Optional[float] = None
+    secondary_cost: Optional[float] = None
+    pending: Optional[str] = None
+
+
+class ExecutionMetadata(RouterMetadata):
+    """Router metadata with details of how the provider call was executed.
+
+    ``overlap_saved`` is set by pipelined invocations: the seconds of network
+    work that overlapped with classification. ``speculation`` is ``"hit"`` or
+    ``"miss"`` when a speculative request was started. With a retry policy,
+    ``attempts`` counts every provider call made, ``retry_time`` is the time
+    from the first attempt until the successful one started, and
+    ``failover`` tells whether the answer came from another provider.
+    ``estimated_cost`` is the pre-call estimate when a ``max_cost`` was given
+    or the prompt didn't fit the routed model, and ``downgraded`` tells
+    whether another model was used because of it.
+    """
+
+    provider: Optional[str] = None
+    hedge: Optional[HedgeOutcome] = None
+    overlap_saved: Optional[float] = None
+    speculation: Optional[str] = None
+    attempts: Optional[int] = None
+    retry_time: Optional[float] = None
+    failover: Optional[bool] = None
+    estimated_cost: Optional[float] = None
+    downgraded: Optional[bool] = None
+
+
+class LLMRouterStreamResponse(LLMRouterResponse):
+    """Final record of :meth:`LLMRouterService.invoke_stream`.
+
+    ``latency`` is the total time until the stream finished; the time until the
+    first text chunk arrived is reported separately.
+    """
+
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    time_to_first_token: Optional[float] = None
@@ -0,0 +1,264 @@
+"""Inference backends for the zero-shot classifier.
+
+``torch`` is the default transformers pipeline running in PyTorch eager mode.
+``torch-packed`` runs the same PyTorch model through
+:class:`~llm_router.selectors.nli.PackedZeroShotClassifier`, which tokenizes
+the label hypotheses once and scores every label pair of a batch in one
+forward pass. ``onnx`` exports the model once to ONNX and runs it with
+onnxruntime, and ``onnx-int8`` additionally applies dynamic int8 quantization
+to the exported graph. ``torch-mmap`` runs the PyTorch pipeline with its
+weights memory-mapped read-only from a safetensors file, so every process on
+the host shares one copy through the page cache. Exported models are stored
+under ``cache_dir`` and reused on the next load. The ONNX backends need the
+``onnx`` extra (``optimum[onnxruntime]``).
+
+All backends return the same pipeline output format. Their label ranking must
+agree with ``torch`` as checked by :func:`rankings_match`: the top label must
+be identical and every label's score must be within
+``BACKEND_TOLERANCE[backend]`` (absolute) of the PyTorch score.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from llm_router.exceptions.exceptions import SelectorError
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("torch", "torch-packed", "torch-mmap", "onnx", "onnx-int8")
+
+#: Maximum absolute per-label score difference from the ``torch`` backend.
+BACKEND_TOLERANCE: Dict[str, float] = {
+    "torch": 0.0,
+    "torch-packed": 1e-3,
+    "torch-mmap": 0.0,
+    "onnx": 1e-3,
+    "onnx-int8": 0.05,
+}
+
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("LLM_ROUTER_MODEL_CACHE", Path.home() / ".cache" / "llm_router")
+)
+
+TASK = "zero-shot-classification"
+
+
+def _export_dir(model_name: str, variant: str, cache_dir: Path) -> Path:
+    return cache_dir / model_name.replace("/", "--") / variant
+
+
+def load_onnx_pipeline(
+    model_name: str,
+    quantize: bool = False,
+    cache_dir: Optional[Path] = None,
+) -> Any:
+    """Build a zero-shot pipeline backed by onnxruntime.
+
+    The first call exports ``model_name`` to ONNX (and quantizes it when
+    ``quantize`` is set); later calls load the stored graph directly.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer, pipeline
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise SelectorError(
+            "The ONNX backends require optimum[onnxruntime]; install the 'onnx' extra.",
+            selector="HFZeroShotSelector",
+        ) from exc
+
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+    fp32_dir = _export_dir(model_name, "onnx", cache_dir)
+    if not (fp32_dir / "model.onnx").exists():
+        logger.info("Exporting %s to ONNX at %s", model_name, fp32_dir)
+        model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+        model.save_pretrained(fp32_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(fp32_dir)
+
+    model_dir, file_name = fp32_dir, "model.onnx"
+    if quantize:
+        int8_dir = _export_dir(model_name, "onnx-int8", cache_dir)
+        if not (int8_dir / "model_quantized.onnx").exists():
+            logger.info("Quantizing %s to dynamic int8 at %s", model_name, int8_dir)
+            quantizer = ORTQuantizer.from_pretrained(fp32_dir)
+            config = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=int8_dir, quantization_config=config)
+            AutoTokenizer.from_pretrained(fp32_dir).save_pretrained(int8_dir)
+        model_dir, file_name = int8_dir, "model_quantized.onnx"
+
+    model = ORTModelForSequenceClassification.from_pretrained(model_dir, file_name=file_name)
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    return pipeline(TASK, model=model, tokenizer=tokenizer)
+
+
+def read_safetensors_header(path: Path) -> Tuple[int, Dict[str, Any]]:
+    """Return the byte offset of the data section and the tensor index.
+
+    A safetensors file is an 8-byte little-endian header length, a JSON
+    header mapping each tensor name to its ``dtype``, ``shape`` and
+    ``data_offsets`` (relative to the data section), then the raw data.
+    The free-form ``__metadata__`` entry is left out; see
+    :func:`read_safetensors_metadata`.
+    """
+    with open(path, "rb") as fh:
+        (length,) = struct.unpack("<Q", fh.read(8))
+        header = json.loads(fh.read(length))
+    header.pop("__metadata__", None)
+    return 8 + length, header
+
+
+def read_safetensors_metadata(path: Path) -> Dict[str, str]:
+    """Return the string-to-string ``__metadata__`` of a safetensors file."""
+    with open(path, "rb") as fh:
+        (length,) = struct.unpack("<Q", fh.read(8))
+        return json.loads(fh.read(length)).get("__metadata__", {})
+
+
+def mmap_state_dict(path: Path) -> Dict[str, Any]:
+    """Return the tensors of a safetensors file as views of a read-only mmap.
+
+    Unlike ``safetensors.torch.load_file`` nothing is copied: the tensors are
+    backed by the page cache, so every process mapping the same file shares
+    the memory and pages are only read from disk when first touched. Tied
+    weights dropped by :func:`save_mmap_model` are restored under each of
+    their names from the file's ``aliases`` metadata.
+    """
+    import torch
+
+    dtypes = {
+        "F64": torch.float64, "F32": torch.float32, "F16": torch.float16,
+        "BF16": torch.bfloat16, "I64": torch.int64, "I32": torch.int32,
+        "I16": torch.int16, "I8": torch.int8, "U8": torch.uint8, "BOOL": torch.bool,
+    }
+    data_start, header = read_safetensors_header(path)
+    with open(path, "rb") as fh:
+        buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    state = {}
+    with warnings.catch_warnings():
+        # The buffer is read-only; inference never writes to the weights.
+        warnings.filterwarnings("ignore", message=".*not writable.*")
+        for name, info in header.items():
+            dtype = dtypes[info["dtype"]]
+            begin, end = info["data_offsets"]
+            if begin == end:
+                state[name] = torch.empty(info["shape"], dtype=dtype)
+                continue
+            count = (end - begin) // torch.empty((), dtype=dtype).element_size()
+            tensor = torch.frombuffer(buffer, dtype=dtype, count=count, offset=data_start + begin)
+            state[name] = tensor.view(info["shape"])
+    aliases = json.loads(read_safetensors_metadata(path).get("aliases", "{}"))
+    for alias, name in aliases.items():
+        state[alias] = state[name]
+    return state
+
+
+def save_mmap_model(model: Any, path: Path) -> None:
+    """Save ``model``'s weights as one safetensors file for :func:`load_mmap_model`.
+
+    ``save_model`` stores each group of tied weights (e.g. BART's
+    ``shared.weight`` and the encoder and decoder token embeddings) under a
+    single name. The other names of every group are recorded in the
+    ``aliases`` metadata so :func:`mmap_state_dict` can restore them.
+    """
+    from safetensors.torch import save_model
+
+    # The first save tells which name of each tied group was kept.
+    save_model(model, str(path))
+    _, header = read_safetensors_header(path)
+    state = model.state_dict()
+    kept = {
+        (tensor.data_ptr(), tuple(tensor.shape)): name
+        for name, tensor in state.items()
+        if name in header
+    }
+    aliases = {
+        name: kept[(tensor.data_ptr(), tuple(tensor.shape))]
+        for name, tensor in state.items()
+        if name not in header and (tensor.data_ptr(), tuple(tensor.shape)) in kept
+    }
+    save_model(model, str(path), metadata={"aliases": json.dumps(aliases)})
+
+
+def load_mmap_model(model_dir: Path) -> Any:
+    """Build the model saved in ``model_dir`` around its memory-mapped weights.
+
+    Raises:
+        SelectorError: If the file doesn't provide exactly the model's weights.
+    """
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+
+    config = AutoConfig.from_pretrained(model_dir)
+    # The randomly initialised weights are freed again once the mapped
+    # tensors are assigned in their place.
+    model = AutoModelForSequenceClassification.from_config(config)
+    result = model.load_state_dict(
+        mmap_state_dict(Path(model_dir) / "model.safetensors"), strict=False, assign=True
+    )
+    if result.missing_keys or result.unexpected_keys:
+        raise SelectorError(
+            f"Memory-mapped weights in {model_dir} don't match the model: "
+            f"missing {result.missing_keys}, unexpected {result.unexpected_keys}",
+            selector="HFZeroShotSelector",
+        )
+    model.tie_weights()
+    return model.eval()
+
+
+def load_mmap_pipeline(model_name: str, cache_dir: Optional[Path] = None) -> Any:
+    """Build a zero-shot pipeline whose weights are memory-mapped.
+
+    The first call saves ``model_name`` as a single safetensors file with its
+    config and tokenizer; later calls map that file and assign its tensors
+    to a freshly configured model without copying them. Files saved without
+    the ``aliases`` metadata are saved again.
+    """
+    try:
+        import safetensors  # noqa: F401
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise SelectorError(
+            "The torch-mmap backend requires torch and safetensors.",
+            selector="HFZeroShotSelector",
+        ) from exc
+
+    cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+    model_dir = _export_dir(model_name, "safetensors", cache_dir)
+    weights = model_dir / "model.safetensors"
+    if not weights.exists() or "aliases" not in read_safetensors_metadata(weights):
+        logger.info("Saving %s as safetensors at %s", model_name, model_dir)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        model_dir.mkdir(parents=True, exist_ok=True)
+        model.config.save_pretrained(model_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(model_dir)
+        save_mmap_model(model, weights)
+        del model
+
+    model = load_mmap_model(model_dir)
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    return pipeline(TASK, model=model, tokenizer=tokenizer)
+
+
+def rankings_match(reference: dict, candidate: dict, tolerance: float) -> bool:
+    """Return whether two pipeline results agree within ``tolerance``.
+
+    The top label must be the same and each label's score may differ by at
+    most ``tolerance``. Lower-ranked labels with near-equal scores may swap
+    places, since that doesn't change the routing decision.
+    """
+    if not reference.get("labels") or not candidate.get("labels"):
+        return False
+    if reference["labels"][0] != candidate["labels"][0]:
+        return False
+    ref_scores = dict(zip(reference["labels"], reference["scores"]))
+    cand_scores = dict(zip(candidate["labels"], candidate["scores"]))
+    if ref_scores.keys() != cand_scores.keys():
+        return False
+    return all(abs(ref_scores[label] - cand_scores[label]) <= tolerance for label in ref_scores)
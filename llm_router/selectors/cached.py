@@ -0,0 +1,115 @@
+"""Memoizing wrapper that caches routing decisions per prompt."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from fyras_models import SelectorVote
+from llm_router.schemas.abstractions import Selector
+
+logger = logging.getLogger(__name__)
+
+
+def is_cacheable(vote: SelectorVote) -> bool:
+    """Return whether ``vote`` may be reused, i.e. isn't a fallback vote."""
+    return not getattr(vote, "fallback", False)
+
+
+class CachingSelector:
+    """Selector that remembers the vote of a wrapped selector for each prompt.
+
+    Classification is deterministic, so a repeated prompt can skip the
+    selector entirely. Decisions live in a bounded LRU keyed on a SHA-256 hash
+    of the prompt; when ``prefix_chars`` is set only that many leading
+    characters are hashed, so prompts sharing a long prefix share a decision.
+    Fallback votes (see :class:`RoutingVote`) are returned but not cached.
+
+    Args:
+        selector: The selector whose decisions are cached.
+        max_entries: Maximum number of cached decisions.
+        prefix_chars: Optional number of leading characters used for the key.
+    """
+
+    def __init__(
+        self,
+        selector: Selector,
+        max_entries: int = 10_000,
+        prefix_chars: Optional[int] = None,
+    ) -> None:
+        self.selector = selector
+        self.max_entries = max_entries
+        self.prefix_chars = prefix_chars
+        self.hits = 0
+        self.misses = 0
+        self._votes: OrderedDict[str, SelectorVote] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, prompt: str) -> str:
+        if self.prefix_chars is not None:
+            prompt = prompt[: self.prefix_chars]
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def _get(self, key: str) -> Optional[SelectorVote]:
+        with self._lock:
+            vote = self._votes.get(key)
+            if vote is None:
+                self.misses += 1
+                return None
+            self._votes.move_to_end(key)
+            self.hits += 1
+            return vote
+
+    def _put(self, key: str, vote: SelectorVote) -> None:
+        with self._lock:
+            self._votes[key] = vote
+            self._votes.move_to_end(key)
+            while len(self._votes) > self.max_entries:
+                self._votes.popitem(last=False)
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        key = self._key(prompt)
+        vote = self._get(key)
+        if vote is None:
+            vote = self.selector.select_model(prompt)
+            if is_cacheable(vote):
+                self._put(key, vote)
+        return vote
+
+    def select_models(self, prompts: list[str], batch_size: int = 8) -> list[SelectorVote]:
+        """Batch counterpart of :meth:`select_model`; only misses are classified."""
+        keys = [self._key(prompt) for prompt in prompts]
+        votes = [self._get(key) for key in keys]
+        missing = [i for i, vote in enumerate(votes) if vote is None]
+        if not missing:
+            return votes
+
+        miss_prompts = [prompts[i] for i in missing]
+        select_models = getattr(self.selector, "select_models", None)
+        if select_models is not None:
+            fresh = select_models(miss_prompts, batch_size=batch_size)
+        else:
+            fresh = [self.selector.select_model(prompt) for prompt in miss_prompts]
+
+        for i, vote in zip(missing, fresh):
+            votes[i] = vote
+            if is_cacheable(vote):
+                self._put(keys[i], vote)
+        return votes
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._votes.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._votes)
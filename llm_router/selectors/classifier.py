@@ -1,56 +1,165 @@
 import json
 import logging
-from transformers import pipeline
-from transformers.pipelines.base import PipelineException
 
 from fyras_models import SelectorVote
 from llm_router.schemas.config import CANDIDATE_LABELS, TOPIC_TO_MODEL
 from llm_router.exceptions.exceptions import SelectorError
+from llm_router.schemas.responses import RoutingVote
+from llm_router.selectors.backends import BACKENDS, load_mmap_pipeline, load_onnx_pipeline
+from llm_router.selectors.nli import PackedZeroShotClassifier
+from llm_router.selectors.registry import ModelRegistry, default_registry
 
 logger = logging.getLogger(__name__)
 
 
+# transformers is imported when the first pipeline is built, not on import.
+def pipeline(*args, **kwargs):
+    from transformers import pipeline as hf_pipeline
+
+    return hf_pipeline(*args, **kwargs)
+
+
+def _pipeline_errors() -> tuple:
+    from transformers.pipelines.base import PipelineException
+
+    return (PipelineException, ValueError, json.JSONDecodeError)
+
+
 class HFZeroShotSelector:
-    """Selector that uses HuggingFace zero-shot classification to choose a model."""
+    """Selector that uses HuggingFace zero-shot classification to choose a model.
+
+    The underlying pipeline is owned by a :class:`ModelRegistry` so it is
+    loaded once and shared by every selector using the same model, instead of
+    being rebuilt for each prompt. Call :meth:`warmup` to pay the load cost
+    eagerly, otherwise it is loaded on the first routing decision.
 
-    def __init__(self, provider_name: str = "anthropic") -> None:
+    ``backend`` picks the inference engine (see
+    :mod:`llm_router.selectors.backends`): ``"torch"`` (default),
+    ``"torch-packed"``, ``"torch-mmap"``, ``"onnx"`` or ``"onnx-int8"``. With ``torch-packed``,
+    ``max_premise_tokens`` truncates long prompts to bound worst-case latency.
+    """
+
+    task = "zero-shot-classification"
+
+    def __init__(
+        self,
+        provider_name: str = "anthropic",
+        model_name: str = "facebook/bart-large-mnli",
+        registry: ModelRegistry | None = None,
+        backend: str = "torch",
+        max_premise_tokens: int | None = None,
+    ) -> None:
+        if backend not in BACKENDS:
+            raise SelectorError(
+                f"Unknown backend {backend!r}; expected one of {BACKENDS}",
+                selector=self.__class__.__name__,
+            )
         self.provider_name = provider_name
-        self.model_name = "facebook/bart-large-mnli"
+        self.model_name = model_name
+        self.registry = registry or default_registry
+        self.backend = backend
+        self.max_premise_tokens = max_premise_tokens
 
-    def select_model(self, prompt: str) -> SelectorVote:
+    @property
+    def registry_key(self):
+        return self.registry.make_key(
+            self.task,
+            self.model_name,
+            backend=self.backend,
+            max_premise_tokens=self.max_premise_tokens,
+        )
+
+    def _load_pipeline(self):
+        if self.backend == "torch":
+            return pipeline(self.task, model=self.model_name)
+        if self.backend == "torch-packed":
+            classifier = PackedZeroShotClassifier.from_pretrained(
+                self.model_name, max_premise_tokens=self.max_premise_tokens
+            )
+            classifier.hypothesis_ids(CANDIDATE_LABELS)
+            return classifier
+        if self.backend == "torch-mmap":
+            return load_mmap_pipeline(self.model_name)
+        return load_onnx_pipeline(self.model_name, quantize=self.backend == "onnx-int8")
+
+    def _get_classifier(self):
         try:
-            classifier = pipeline("zero-shot-classification", model=self.model_name)
+            return self.registry.get(self.registry_key, self._load_pipeline)
         except Exception as exc:
             logger.exception("Failed to load HF zero-shot model")
-            raise SelectorError("Could not initialize zero-shot classifier") from exc
+            raise SelectorError(
+                "Could not initialize zero-shot classifier",
+                selector=self.__class__.__name__,
+            ) from exc
+
+    def warmup(self) -> None:
+        """Load the classifier now so the first request doesn't pay for it."""
+        self._get_classifier()
+
+    def unload(self) -> None:
+        """Release the shared classifier; it is reloaded on next use."""
+        self.registry.unload(self.registry_key)
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        classifier = self._get_classifier()
 
         try:
             result = classifier(prompt, CANDIDATE_LABELS)
-        except (PipelineException, ValueError, json.JSONDecodeError) as exc:
+        except _pipeline_errors() as exc:
             logger.exception("Error during zero-shot classification")
             return self._fallback_vote("Classification failed or returned invalid JSON")
 
+        return self._vote_from_result(result)
+
+    def select_models(self, prompts: list[str], batch_size: int = 8) -> list[SelectorVote]:
+        """Classify many prompts in batched forward passes.
+
+        The pipeline pads ``batch_size`` premise/hypothesis pairs into each
+        forward pass instead of running one pass per prompt. Votes are returned
+        in the same order as ``prompts``.
+        """
+        if not prompts:
+            return []
+
+        classifier = self._get_classifier()
+
+        try:
+            results = classifier(list(prompts), CANDIDATE_LABELS, batch_size=batch_size)
+        except _pipeline_errors() as exc:
+            logger.exception("Error during batched zero-shot classification")
+            return [
+                self._fallback_vote("Classification failed or returned invalid JSON")
+                for _ in prompts
+            ]
+
+        if isinstance(results, dict):
+            results = [results]
+        return [self._vote_from_result(result) for result in results]
+
+    def _vote_from_result(self, result: dict) -> SelectorVote:
         labels = result.get("labels")
         if not labels:
             logger.warning("Classifier returned no labels")
             return self._fallback_vote("No labels returned from classifier")
 
         top_label = labels[0]
-        selected_model = TOPIC_TO_MODEL.get(top_label, {}).get(
-            self.provider_name,
-            TOPIC_TO_MODEL["SIMPLE"][self.provider_name]
-        )
+        topic = top_label if self.provider_name in TOPIC_TO_MODEL.get(top_label, {}) else "SIMPLE"
 
-        return SelectorVote(
+        return RoutingVote(
             selector_name=self.__class__.__name__,
-            model=selected_model,
-            rationale=f"Classified as '{top_label}' by zero-shot model"
+            model=TOPIC_TO_MODEL[topic][self.provider_name],
+            rationale=f"Classified as '{top_label}' by zero-shot model",
+            topic=topic,
+            provider=self.provider_name,
         )
 
     def _fallback_vote(self, reason: str) -> SelectorVote:
         fallback_model = TOPIC_TO_MODEL["SIMPLE"][self.provider_name]
-        return SelectorVote(
+        return RoutingVote(
             selector_name=self.__class__.__name__,
             model=fallback_model,
-            rationale=reason
+            rationale=reason,
+            topic="SIMPLE",
+            provider=self.provider_name,
+            fallback=True,
         )
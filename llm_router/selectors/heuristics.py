@@ -0,0 +1,182 @@
+"""Cheap first-stage selector that short-circuits obvious prompts."""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import SelectorError
+from llm_router.schemas.abstractions import Selector
+from llm_router.schemas.config import TOPIC_KEYWORDS, TOPIC_TO_MODEL
+from llm_router.schemas.responses import RoutingVote
+from llm_router.utils.tokens import count_tokens
+
+logger = logging.getLogger(__name__)
+
+_CODE_FENCE = re.compile(r"```")
+# Case-sensitive source lines, so prose such as "Class action..." or
+# "Select the best..." isn't mistaken for code.
+_CODE_SYNTAX = re.compile(
+    r"^\s*(?:"
+    r"def \w+\s*\(|class \w+\s*[:(]|import \w[\w.]*\s*$|from [\w.]+ import \w|#include\s*[<\"]"
+    r"|SELECT\b.*\bFROM\b|for \w+(?:, \w+)* in \S[^\n]*:\s*$|(?:if|elif|while) [^\n]*[=<>()\[\]][^\n]*:\s*$"
+    r"|(?:else|try|finally):\s*$|except\b[^\n]*:\s*$"
+    r")",
+    re.MULTILINE,
+)
+
+# (label, confidence, rationale)
+Decision = Tuple[str, float, str]
+
+
+class HeuristicsSelector:
+    """Pre-router that votes immediately when a prompt is obviously routable.
+
+    The checks are ordered from cheapest to most expensive: code-fence and
+    source-line detection (a bare line of code is trusted less than a fence), keyword tables built from ``CANDIDATE_LABELS`` and tiktoken
+    token counts. A decision whose confidence reaches ``min_confidence`` is
+    returned straight away; anything else is delegated to ``fallback`` (usually
+    :class:`HFZeroShotSelector`). Without a fallback, the best heuristic guess
+    is returned, defaulting to ``GENERAL``.
+
+    Args:
+        fallback: Selector used when the heuristics aren't confident.
+        provider_name: Provider whose model is voted for.
+        short_max_tokens: Prompts up to this many tokens without topical
+            keywords are routed to ``SIMPLE``.
+        long_min_tokens: Prompts with at least this many tokens are routed to
+            ``COMPLEX``.
+        min_keyword_hits: Minimum keyword matches before a topic is considered.
+        min_confidence: Confidence required to short-circuit the fallback.
+        keywords: Optional replacement for ``TOPIC_KEYWORDS``.
+    """
+
+    def __init__(
+        self,
+        fallback: Selector | None = None,
+        provider_name: str = "anthropic",
+        short_max_tokens: int = 6,
+        long_min_tokens: int = 2000,
+        min_keyword_hits: int = 2,
+        min_confidence: float = 0.8,
+        keywords: Optional[Dict[str, Iterable[str]]] = None,
+    ) -> None:
+        self.fallback = fallback
+        self.provider_name = provider_name
+        self.short_max_tokens = short_max_tokens
+        self.long_min_tokens = long_min_tokens
+        self.min_keyword_hits = min_keyword_hits
+        self.min_confidence = min_confidence
+        self._patterns = {
+            label: re.compile(
+                r"\b(?:" + "|".join(re.escape(word) for word in words) + r")\b",
+                re.IGNORECASE,
+            )
+            for label, words in (keywords or TOPIC_KEYWORDS).items()
+            if words
+        }
+        self.total = 0
+        self.short_circuited = 0
+        self._lock = threading.Lock()
+
+    @property
+    def short_circuit_rate(self) -> float:
+        """Fraction of prompts answered without calling the fallback."""
+        return self.short_circuited / self.total if self.total else 0.0
+
+    def _keyword_hits(self, prompt: str) -> Dict[str, int]:
+        hits = {}
+        for label, pattern in self._patterns.items():
+            found = {match.lower() for match in pattern.findall(prompt)}
+            if found:
+                hits[label] = len(found)
+        return hits
+
+    def _classify(self, prompt: str) -> Optional[Decision]:
+        if _CODE_FENCE.search(prompt):
+            return "PROGRAMMING", 0.99, "Code block in prompt"
+        if _CODE_SYNTAX.search(prompt):
+            return "PROGRAMMING", 0.85, "Code detected in prompt"
+
+        hits = self._keyword_hits(prompt)
+        topical = {label: n for label, n in hits.items() if label != "SIMPLE"}
+        tokens = count_tokens(prompt)
+
+        if tokens <= self.short_max_tokens and not topical:
+            return "SIMPLE", 0.9, f"Short/simple prompt ({tokens} tokens)"
+        if tokens >= self.long_min_tokens:
+            return "COMPLEX", 0.8, f"Long/complex prompt ({tokens} tokens)"
+        if not topical:
+            return None
+
+        ranked = sorted(topical.items(), key=lambda item: item[1], reverse=True)
+        label, top = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        if top < self.min_keyword_hits:
+            return label, 0.5, f"Weak keyword match for {label}"
+        confidence = top / (top + runner_up + 0.5)
+        return label, confidence, f"{top} keyword matches for {label}"
+
+    def _vote(self, label: str, rationale: str) -> SelectorVote:
+        topic = label if label in TOPIC_TO_MODEL else "GENERAL"
+        return RoutingVote(
+            selector_name=self.__class__.__name__,
+            model=TOPIC_TO_MODEL[topic][self.provider_name],
+            rationale=rationale,
+            topic=topic,
+            provider=self.provider_name,
+        )
+
+    def _confident(self, prompt: str) -> Tuple[Optional[Decision], bool]:
+        try:
+            decision = self._classify(prompt)
+        except Exception as exc:
+            logger.exception("Heuristic classification failed")
+            raise SelectorError(str(exc), selector=self.__class__.__name__) from exc
+        confident = decision is not None and decision[1] >= self.min_confidence
+        with self._lock:
+            self.total += 1
+            if confident:
+                self.short_circuited += 1
+        return decision, confident
+
+    def _unconfident_vote(self, decision: Optional[Decision]) -> SelectorVote:
+        if decision is None:
+            return self._vote("GENERAL", "No heuristic matched")
+        return self._vote(decision[0], decision[2])
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        decision, confident = self._confident(prompt)
+        if confident:
+            return self._vote(decision[0], decision[2])
+        if self.fallback is not None:
+            return self.fallback.select_model(prompt)
+        return self._unconfident_vote(decision)
+
+    def select_models(self, prompts: list[str], batch_size: int = 8) -> list[SelectorVote]:
+        """Batch counterpart of :meth:`select_model`; only unsure prompts reach the fallback."""
+        votes: list[Optional[SelectorVote]] = []
+        pending = []
+        for i, prompt in enumerate(prompts):
+            decision, confident = self._confident(prompt)
+            if confident:
+                votes.append(self._vote(decision[0], decision[2]))
+            elif self.fallback is None:
+                votes.append(self._unconfident_vote(decision))
+            else:
+                votes.append(None)
+                pending.append(i)
+
+        if pending:
+            pending_prompts = [prompts[i] for i in pending]
+            select_models = getattr(self.fallback, "select_models", None)
+            if select_models is not None:
+                fresh = select_models(pending_prompts, batch_size=batch_size)
+            else:
+                fresh = [self.fallback.select_model(p) for p in pending_prompts]
+            for i, vote in zip(pending, fresh):
+                votes[i] = vote
+        return votes
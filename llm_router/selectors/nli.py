@@ -0,0 +1,144 @@
+"""Zero-shot NLI classifier with precomputed hypotheses and packed batches."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PackedZeroShotClassifier:
+    """Drop-in replacement for the transformers zero-shot pipeline.
+
+    The pipeline re-tokenizes ``"This example is {label}."`` for every prompt
+    and runs one premise/hypothesis pair per label. Here the hypothesis token
+    ids are computed once per label set and reused; each prompt is tokenized
+    once; and the pairs for ``batch_size`` prompts times every label are
+    padded into a single tensor and scored in one forward pass. Scores are
+    computed the same way as the pipeline (softmax over the entailment logits,
+    or entailment vs. contradiction per label with ``multi_label``).
+
+    Args:
+        tokenizer: Tokenizer of the NLI model.
+        model: Sequence-classification NLI model (e.g. BART-large-MNLI).
+        hypothesis_template: Template formatted with each candidate label.
+        max_premise_tokens: Optional token budget for the prompt. Longer
+            prompts are truncated to it, which bounds worst-case latency.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Any,
+        model: Any,
+        hypothesis_template: str = "This example is {}.",
+        max_premise_tokens: Optional[int] = None,
+    ) -> None:
+        self.tokenizer = tokenizer
+        self.model = model.eval() if hasattr(model, "eval") else model
+        self.hypothesis_template = hypothesis_template
+        self.max_premise_tokens = max_premise_tokens
+        self.entailment_id = self._label_id("entail", default=-1)
+        self.contradiction_id = self._label_id("contradiction", default=0)
+        self._hypotheses: Dict[Tuple[str, ...], List[List[int]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_pretrained(
+        cls, model_name: str, max_premise_tokens: Optional[int] = None, **kwargs: Any
+    ) -> "PackedZeroShotClassifier":
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        return cls(tokenizer, model, max_premise_tokens=max_premise_tokens, **kwargs)
+
+    def _label_id(self, prefix: str, default: int) -> int:
+        label2id = getattr(getattr(self.model, "config", None), "label2id", None) or {}
+        for label, index in label2id.items():
+            if label.lower().startswith(prefix):
+                return int(index)
+        return default
+
+    def hypothesis_ids(self, candidate_labels: Sequence[str]) -> List[List[int]]:
+        """Return the cached hypothesis token ids for ``candidate_labels``."""
+        key = tuple(candidate_labels)
+        cached = self._hypotheses.get(key)
+        if cached is None:
+            with self._lock:
+                cached = self._hypotheses.get(key)
+                if cached is None:
+                    hypotheses = [self.hypothesis_template.format(label) for label in key]
+                    cached = self.tokenizer(hypotheses, add_special_tokens=False)["input_ids"]
+                    self._hypotheses[key] = cached
+        return cached
+
+    def _premise_budget(self, hypotheses: List[List[int]]) -> int:
+        limit = getattr(self.tokenizer, "model_max_length", 1024)
+        if not limit or limit > 100_000:
+            limit = 1024
+        special = self.tokenizer.num_special_tokens_to_add(pair=True)
+        budget = limit - special - max(len(h) for h in hypotheses)
+        if self.max_premise_tokens is not None:
+            budget = min(budget, self.max_premise_tokens)
+        return budget
+
+    def _pack(self, premises: List[List[int]], hypotheses: List[List[int]]):
+        import torch
+
+        rows = [
+            self.tokenizer.build_inputs_with_special_tokens(premise, hypothesis)
+            for premise in premises
+            for hypothesis in hypotheses
+        ]
+        width = max(len(row) for row in rows)
+        pad_id = self.tokenizer.pad_token_id or 0
+        input_ids = torch.full((len(rows), width), pad_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(rows), width), dtype=torch.long)
+        for i, row in enumerate(rows):
+            input_ids[i, : len(row)] = torch.tensor(row, dtype=torch.long)
+            attention_mask[i, : len(row)] = 1
+        return input_ids, attention_mask
+
+    def __call__(
+        self,
+        sequences: str | Sequence[str],
+        candidate_labels: Sequence[str],
+        batch_size: int = 8,
+        multi_label: bool = False,
+    ):
+        import torch
+
+        single = isinstance(sequences, str)
+        texts = [sequences] if single else list(sequences)
+        labels = list(candidate_labels)
+        hypotheses = self.hypothesis_ids(labels)
+        budget = self._premise_budget(hypotheses)
+        premises = self.tokenizer(
+            texts, add_special_tokens=False, truncation=True, max_length=budget
+        )["input_ids"]
+
+        results = []
+        for start in range(0, len(texts), batch_size):
+            chunk = premises[start : start + batch_size]
+            input_ids, attention_mask = self._pack(chunk, hypotheses)
+            with torch.inference_mode():
+                logits = self.model(input_ids=input_ids, attention_mask=attention_mask).logits
+            logits = logits.view(len(chunk), len(labels), -1).float()
+            if multi_label:
+                pair = logits[..., [self.contradiction_id, self.entailment_id]]
+                scores = pair.softmax(dim=-1)[..., 1]
+            else:
+                scores = logits[..., self.entailment_id].softmax(dim=-1)
+
+            for offset, row in enumerate(scores.tolist()):
+                order = sorted(range(len(labels)), key=lambda i: row[i], reverse=True)
+                results.append(
+                    {
+                        "sequence": texts[start + offset],
+                        "labels": [labels[i] for i in order],
+                        "scores": [row[i] for i in order],
+                    }
+                )
+        return results[0] if single else results
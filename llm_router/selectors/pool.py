@@ -0,0 +1,196 @@
+"""Selector that spreads classification over a pool of worker processes."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import SelectorError
+from llm_router.schemas.abstractions import Selector
+
+logger = logging.getLogger(__name__)
+
+#: Selector owned by the current pool worker.
+_worker_selector: Optional[Selector] = None
+#: Why ``selector_factory`` failed in the current pool worker, if it did.
+_worker_error: Optional[str] = None
+
+_THREAD_ENV = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+
+def _init_worker(selector_factory: Callable[[], Selector], threads: int) -> None:
+    global _worker_selector, _worker_error
+    # Set before torch is imported by the factory so its thread pools are
+    # sized for this worker, not for the whole machine.
+    for name in _THREAD_ENV:
+        os.environ[name] = str(threads)
+    try:
+        import torch
+
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    # An exception escaping the initializer kills the worker and breaks the
+    # whole pool, so it is kept and reported by every task instead.
+    try:
+        _worker_selector = selector_factory()
+        warmup = getattr(_worker_selector, "warmup", None)
+        if warmup is not None:
+            warmup()
+    except Exception as exc:
+        _worker_selector = None
+        _worker_error = f"selector_factory failed in worker {os.getpid()}: {exc!r}"
+
+
+def _selector() -> Selector:
+    if _worker_selector is None:
+        raise RuntimeError(_worker_error)
+    return _worker_selector
+
+
+def _select(prompt: str) -> SelectorVote:
+    return _selector().select_model(prompt)
+
+
+def _select_many(prompts: List[str]) -> List[SelectorVote]:
+    selector = _selector()
+    select_models = getattr(selector, "select_models", None)
+    if select_models is not None:
+        return select_models(prompts, batch_size=len(prompts))
+    return [selector.select_model(prompt) for prompt in prompts]
+
+
+def _ping(delay: float) -> int:
+    _selector()
+    time.sleep(delay)
+    return os.getpid()
+
+
+class ProcessPoolSelector:
+    """Run ``select_model`` calls in a :class:`ProcessPoolExecutor`.
+
+    Each worker builds its own selector with ``selector_factory`` in the pool
+    initializer, loading the model once, so classification runs outside the
+    caller's GIL and uses one core group per worker. ``threads_per_worker``
+    caps PyTorch's intra-op threads in every worker; the default divides the
+    machine's cores evenly between the workers so the pool doesn't
+    oversubscribe them.
+
+    If ``selector_factory`` raises in a worker, every task that worker runs
+    fails with a :class:`SelectorError` carrying the factory's error. If a
+    worker dies (e.g. killed for running out of memory), the pending calls
+    fail with :class:`SelectorError` and the pool is replaced by a fresh one
+    for the next call.
+
+    A call that exceeds ``timeout`` raises, but a worker process can't be
+    interrupted: the task keeps running and occupies its worker until it
+    finishes, so repeated timeouts reduce the pool's capacity until then.
+
+    Args:
+        selector_factory: Picklable callable returning a selector, e.g. a
+            module-level function or :func:`functools.partial`.
+        workers: Number of worker processes. Defaults to the CPU count.
+        threads_per_worker: Intra-op threads per worker.
+        timeout: Optional seconds to wait for a vote before raising
+            :class:`SelectorError`. The task itself is not stopped.
+        mp_context: Multiprocessing start method. ``"spawn"`` avoids
+            inheriting the parent's threads and locks.
+    """
+
+    def __init__(
+        self,
+        selector_factory: Callable[[], Selector],
+        workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        timeout: Optional[float] = None,
+        mp_context: str = "spawn",
+    ) -> None:
+        cpus = os.cpu_count() or 1
+        self.workers = workers or cpus
+        self.threads_per_worker = threads_per_worker or max(1, cpus // self.workers)
+        self.timeout = timeout
+        self._selector_factory = selector_factory
+        self._mp_context = mp_context
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(self._mp_context),
+            initializer=_init_worker,
+            initargs=(self._selector_factory, self.threads_per_worker),
+        )
+
+    def _replace(self, broken: ProcessPoolExecutor) -> None:
+        """Swap a broken pool for a new one, unless another call already did."""
+        with self._lock:
+            if self._pool is broken:
+                logger.warning("Process pool broke; starting a new one")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._pool = self._new_pool()
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Tuple[ProcessPoolExecutor, Future]:
+        pool = self._pool
+        try:
+            return pool, pool.submit(fn, *args)
+        except BrokenProcessPool:
+            self._replace(pool)
+            pool = self._pool
+            return pool, pool.submit(fn, *args)
+
+    def _result(self, submitted: Tuple[ProcessPoolExecutor, Future]) -> Any:
+        pool, future = submitted
+        try:
+            return future.result(timeout=self.timeout)
+        except SelectorError:
+            raise
+        except BrokenProcessPool as exc:
+            self._replace(pool)
+            raise SelectorError(
+                f"A classification worker died: {exc}", selector=self.__class__.__name__
+            ) from exc
+        except Exception as exc:
+            logger.exception("Pooled classification failed")
+            raise SelectorError(str(exc), selector=self.__class__.__name__) from exc
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        return self._result(self._submit(_select, prompt))
+
+    def select_models(self, prompts: List[str], batch_size: int = 8) -> List[SelectorVote]:
+        """Classify ``prompts`` in chunks of ``batch_size`` spread over the workers."""
+        submitted = [
+            self._submit(_select_many, prompts[i : i + batch_size])
+            for i in range(0, len(prompts), batch_size)
+        ]
+        return [vote for item in submitted for vote in self._result(item)]
+
+    def warmup(self, delay: float = 0.1, timeout: float = 300.0) -> Set[int]:
+        """Start every worker and load its model; returns the worker pids.
+
+        Workers are started on demand, so rounds of ``workers`` overlapping
+        tasks are submitted until each worker has answered one.
+        """
+        pids: Set[int] = set()
+        deadline = time.monotonic() + timeout
+        while len(pids) < self.workers and time.monotonic() < deadline:
+            submitted = [self._submit(_ping, delay) for _ in range(self.workers)]
+            pids.update(self._result(item) for item in submitted)
+        return pids
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ProcessPoolSelector":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,86 @@
+"""Share classifier weights between the workers of a pre-fork server.
+
+A pre-fork server (gunicorn, uWSGI, ...) starts a parent process and forks
+``N`` workers from it. If each worker loads the zero-shot classifier itself,
+the host holds ``N`` copies of the weights. Loading them in the parent with
+:func:`preload` instead lets the workers share the parent's pages through
+copy-on-write, e.g. in ``gunicorn.conf.py``::
+
+    from llm_router.selectors.classifier import HFZeroShotSelector
+    from llm_router.selectors.prefork import after_fork, preload
+
+    preload_app = True
+
+    def on_starting(server):
+        preload(HFZeroShotSelector())
+
+    def post_fork(server, worker):
+        after_fork(num_threads=2)
+
+The weights are only loaded in the parent, never run: starting PyTorch's
+intra-op thread pool before ``fork`` can deadlock the children. The
+``torch-mmap`` backend (see :mod:`llm_router.selectors.backends`) is an
+alternative that also shares memory between unrelated processes.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+def preload(*selectors: Any, freeze: bool = True) -> None:
+    """Load the models of ``selectors`` in the current (parent) process.
+
+    Every selector with a ``warmup`` method loads its pipeline into its
+    :class:`~llm_router.selectors.registry.ModelRegistry`, which the forked
+    workers inherit. With ``freeze`` the garbage collector then moves every
+    object into its permanent generation (:func:`gc.freeze`), so collections
+    in the workers don't write to the inherited objects' headers and
+    un-share their pages.
+    """
+    for selector in selectors:
+        warmup = getattr(selector, "warmup", None)
+        if warmup is not None:
+            logger.info("Preloading %s before fork", type(selector).__name__)
+            warmup()
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+
+def after_fork(num_threads: Optional[int] = None) -> None:
+    """Per-worker setup to call right after ``fork``.
+
+    Args:
+        num_threads: Optional number of PyTorch intra-op threads per worker,
+            so ``N`` workers don't each start one thread per core.
+    """
+    torch = sys.modules.get("torch")
+    if num_threads is not None and torch is not None:
+        torch.set_num_threads(num_threads)
+
+
+def memory_usage(pid: Union[int, str] = "self") -> Dict[str, int]:
+    """Return the ``rss``, ``pss`` and ``uss`` of a process in bytes.
+
+    USS (unique set size) is the memory only this process uses, i.e. what
+    killing it would free; PSS (proportional set size) additionally charges
+    each shared page to its ``n`` users by ``1/n``. Read from
+    ``/proc/<pid>/smaps_rollup``, so Linux only.
+    """
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as fh:
+        for line in fh:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
@@ -0,0 +1,72 @@
+"""Process-wide registry for loaded classification pipelines."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Any]
+
+
+class ModelRegistry:
+    """Thread-safe cache of loaded pipelines keyed by task and model name.
+
+    Loading a HuggingFace pipeline is expensive (seconds of disk I/O and
+    hundreds of megabytes of weights), so selectors should never build one per
+    request. The registry loads each pipeline at most once, shares it between
+    every selector instance and thread in the process, and supports explicit
+    unloading when the memory is needed back.
+    """
+
+    def __init__(self) -> None:
+        self._pipelines: Dict[Hashable, Any] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @staticmethod
+    def make_key(task: str, model_name: str, **options: Any) -> Tuple:
+        """Build the registry key for a pipeline configuration."""
+        return (task, model_name, tuple(sorted(options.items())))
+
+    def _lock_for(self, key: Hashable) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def get(self, key: Hashable, loader: Loader) -> Any:
+        """Return the pipeline for ``key``, loading it with ``loader`` if needed.
+
+        Concurrent callers asking for the same key block on a per-key lock so the
+        weights are only loaded once; callers for other keys are not blocked.
+        """
+        pipeline = self._pipelines.get(key)
+        if pipeline is not None:
+            return pipeline
+
+        with self._lock_for(key):
+            pipeline = self._pipelines.get(key)
+            if pipeline is None:
+                logger.info("Loading pipeline %s", key)
+                pipeline = loader()
+                self._pipelines[key] = pipeline
+        return pipeline
+
+    def is_loaded(self, key: Hashable) -> bool:
+        return key in self._pipelines
+
+    def unload(self, key: Optional[Hashable] = None) -> None:
+        """Drop a loaded pipeline, or every pipeline when ``key`` is ``None``."""
+        with self._guard:
+            if key is None:
+                self._pipelines.clear()
+            else:
+                self._pipelines.pop(key, None)
+
+
+#: Default registry shared by all selectors in the process.
+default_registry = ModelRegistry()
@@ -0,0 +1,37 @@
+"""Selector wrapper that reuses decisions for near-duplicate prompts."""
+
+from __future__ import annotations
+
+import logging
+
+from fyras_models import SelectorVote
+from llm_router.cache.semantic import SemanticCache
+from llm_router.schemas.abstractions import Selector
+from llm_router.selectors.cached import is_cacheable
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCachingSelector:
+    """Selector that returns a cached vote when a similar prompt was seen.
+
+    Prompts whose embedding is within ``cache.threshold`` cosine similarity of a
+    cached prompt reuse its :class:`SelectorVote`; everything else goes to the
+    wrapped selector and is added to the index. Passing the same
+    :class:`SemanticCache` to ``LLMRouterService(cache=...)`` also reuses
+    responses, and the prompt is embedded only once per request. Fallback
+    votes aren't added to the index.
+    """
+
+    def __init__(self, selector: Selector, cache: SemanticCache | None = None) -> None:
+        self.selector = selector
+        self.cache = cache if cache is not None else SemanticCache()
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        vote = self.cache.lookup_vote(prompt)
+        if vote is not None:
+            return vote
+        vote = self.selector.select_model(prompt)
+        if is_cacheable(vote):
+            self.cache.store_vote(prompt, vote)
+        return vote
@@ -0,0 +1,364 @@
+"""Out-of-process classification with dynamic micro-batching.
+
+Running the zero-shot classifier inside every request-handling process means
+each process classifies its prompts one at a time. :class:`ClassificationServer`
+instead owns a single selector in one local process and serves any number of
+clients over a Unix socket. Prompts that arrive within ``max_wait`` seconds
+of each other are coalesced, up to ``max_batch_size``, into one
+``select_models`` call, i.e. one batched forward pass. :class:`RemoteSelector`
+is the client; it implements the ``Selector`` protocol, so it can be passed
+to :class:`LLMRouterService` in place of the classifier::
+
+    server = ClassificationServer.spawn("/tmp/llm-router.sock", make_selector)
+    router = LLMRouterService(Selector=RemoteSelector("/tmp/llm-router.sock"))
+
+The wire format is one JSON object per line: ``{"id": 1, "prompt": "..."}``
+requests and ``{"id": 1, "vote": {...}}`` or ``{"id": 1, "error": "..."}``
+responses. Responses on one connection may arrive out of order.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import SelectorError
+from llm_router.schemas.abstractions import Selector
+from llm_router.schemas.responses import RoutingVote
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Coalesce single prompts into batched ``select_models`` calls.
+
+    A worker thread takes the first waiting prompt, then keeps collecting
+    until ``max_batch_size`` prompts are gathered or ``max_wait`` seconds have
+    passed since the first one arrived, and classifies them together. Under
+    low load a prompt therefore waits at most ``max_wait`` longer than it
+    would alone; under high load batches fill up without waiting.
+
+    Args:
+        selector: Selector doing the work. Its ``select_models`` is used when
+            available, otherwise ``select_model`` is called per prompt.
+        max_batch_size: Maximum prompts per batch.
+        max_wait: Seconds to wait for more prompts after the first.
+    """
+
+    def __init__(self, selector: Selector, max_batch_size: int = 16, max_wait: float = 0.005) -> None:
+        self.selector = selector
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.requests = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="llm-router-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, prompt: str) -> "Future[SelectorVote]":
+        future: Future = Future()
+        self._queue.put((prompt, future))
+        return future
+
+    def _collect(self) -> Optional[List[tuple]]:
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _classify(self, prompts: List[str]) -> List[SelectorVote]:
+        select_models = getattr(self.selector, "select_models", None)
+        if select_models is not None:
+            return select_models(prompts, batch_size=len(prompts))
+        return [self.selector.select_model(prompt) for prompt in prompts]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            prompts = [prompt for prompt, _ in batch]
+            with self._lock:
+                self.batches += 1
+                self.requests += len(batch)
+            try:
+                votes = self._classify(prompts)
+            except Exception as exc:
+                logger.exception("Batched classification failed")
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            for (_, future), vote in zip(batch, votes):
+                future.set_result(vote)
+            if len(votes) != len(batch):
+                logger.error("Selector returned %d votes for %d prompts", len(votes), len(batch))
+                error = SelectorError(
+                    f"Selector returned {len(votes)} votes for {len(batch)} prompts",
+                    selector=type(self.selector).__name__,
+                )
+                for _, future in batch[len(votes):]:
+                    future.set_exception(error)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "requests": self.requests,
+                "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            }
+
+    def close(self) -> None:
+        self._queue.put(_STOP)
+        self._thread.join()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Read requests on the handler thread and write votes from a writer thread.
+
+    Votes are completed on the batcher thread, which must not block on a
+    slow client, so their done-callbacks only queue them for the writer.
+    """
+
+    def handle(self) -> None:
+        outbox: queue.Queue = queue.Queue()
+        writer = threading.Thread(
+            target=self._write, args=(outbox,), name="llm-router-classify-writer", daemon=True
+        )
+        writer.start()
+        pending: set = set()
+
+        def queued(request_id: Any, future: Future) -> None:
+            outbox.put((request_id, future))
+            pending.discard(future)
+
+        try:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    future = self.server.batcher.submit(request["prompt"])
+                except (ValueError, KeyError) as exc:
+                    outbox.put((None, _failed(exc)))
+                    continue
+                # Reply as soon as the vote is ready so pipelined requests from
+                # this connection can share batches with each other.
+                pending.add(future)
+                future.add_done_callback(lambda done, request_id=request.get("id"): queued(request_id, done))
+        finally:
+            wait(list(pending))
+            outbox.put(_STOP)
+            writer.join()
+
+    def _write(self, outbox: queue.Queue) -> None:
+        connected = True
+        while True:
+            item = outbox.get()
+            if item is _STOP:
+                return
+            if not connected:
+                continue
+            request_id, future = item
+            try:
+                message = {"id": request_id, "vote": future.result().model_dump()}
+            except Exception as exc:
+                message = {"id": request_id, "error": str(exc)}
+            try:
+                self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            except (OSError, ValueError):
+                logger.debug("Client went away before its vote was sent")
+                connected = False
+
+
+def _failed(exc: Exception) -> Future:
+    future: Future = Future()
+    future.set_exception(exc)
+    return future
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    # Every worker thread of every client process holds a connection.
+    request_queue_size = 1024
+
+
+class ClassificationServer:
+    """Serve one selector to many local clients over a Unix socket.
+
+    Args:
+        path: Filesystem path of the Unix socket. A stale socket file is
+            replaced.
+        selector: The selector owned by the server, typically an
+            :class:`HFZeroShotSelector`.
+        max_batch_size: Maximum prompts per forward pass.
+        max_wait: Seconds the first prompt of a batch waits for more.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        selector: Selector,
+        max_batch_size: int = 16,
+        max_wait: float = 0.005,
+    ) -> None:
+        self.path = str(path)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.batcher = MicroBatcher(selector, max_batch_size=max_batch_size, max_wait=max_wait)
+        self._server = _UnixServer(self.path, _Handler)
+        self._server.batcher = self.batcher
+        self._thread: Optional[threading.Thread] = None
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> "ClassificationServer":
+        """Serve from a background thread of the current process."""
+        self._thread = threading.Thread(target=self.serve_forever, name="llm-router-classify", daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self.batcher.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def stats(self) -> Dict[str, float]:
+        return self.batcher.stats()
+
+    @staticmethod
+    def spawn(
+        path: Path | str,
+        selector_factory: Callable[[], Selector],
+        timeout: float = 300.0,
+        **options: Any,
+    ) -> multiprocessing.Process:
+        """Run a server in a separate process and wait until it accepts clients.
+
+        ``selector_factory`` must be picklable (e.g. a module-level function);
+        it runs in the child, and the selector is warmed up before the socket
+        is opened so the first client doesn't pay for loading the model.
+        """
+        path = str(path)
+        if os.path.exists(path):
+            os.unlink(path)
+        process = multiprocessing.get_context("spawn").Process(
+            target=_serve, args=(path, selector_factory, options), daemon=True
+        )
+        process.start()
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            if not process.is_alive():
+                raise SelectorError(f"Classification server exited with code {process.exitcode}")
+            if time.monotonic() > deadline:
+                process.terminate()
+                raise SelectorError(f"Classification server did not start within {timeout}s")
+            time.sleep(0.05)
+        return process
+
+
+def _serve(path: str, selector_factory: Callable[[], Selector], options: Dict[str, Any]) -> None:
+    selector = selector_factory()
+    warmup = getattr(selector, "warmup", None)
+    if warmup is not None:
+        warmup()
+    ClassificationServer(path, selector, **options).serve_forever()
+
+
+class RemoteSelector:
+    """``Selector`` that classifies through a :class:`ClassificationServer`.
+
+    Each thread keeps its own connection, so concurrent router requests are
+    in flight together and the server can batch them. :meth:`select_models`
+    sends all prompts before reading any vote, so a batch from one caller
+    is coalesced as well.
+
+    Args:
+        path: Unix socket path of the server.
+        timeout: Seconds to wait for a vote before raising
+            :class:`SelectorError`.
+    """
+
+    def __init__(self, path: Path | str, timeout: float = 30.0) -> None:
+        self.path = str(path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            conn = self._local.conn = (sock, sock.makefile("rb"))
+        return conn
+
+    def _reset(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if conn is not None:
+            conn[1].close()
+            conn[0].close()
+
+    def select_models(self, prompts: List[str], batch_size: int = 8) -> List[SelectorVote]:
+        """Classify ``prompts`` remotely; votes are returned in input order."""
+        if not prompts:
+            return []
+        try:
+            sock, reader = self._connection()
+            payload = "".join(
+                json.dumps({"id": i, "prompt": prompt}) + "\n" for i, prompt in enumerate(prompts)
+            )
+            sock.sendall(payload.encode("utf-8"))
+            votes: Dict[int, SelectorVote] = {}
+            while len(votes) < len(prompts):
+                line = reader.readline()
+                if not line:
+                    raise ConnectionError("Classification server closed the connection")
+                message = json.loads(line)
+                if "error" in message:
+                    raise SelectorError(message["error"], selector=self.__class__.__name__)
+                votes[message["id"]] = RoutingVote.model_validate(message["vote"])
+        except SelectorError:
+            self._reset()
+            raise
+        except (OSError, ValueError) as exc:
+            self._reset()
+            raise SelectorError(
+                f"Classification server at {self.path} failed: {exc}",
+                selector=self.__class__.__name__,
+            ) from exc
+        return [votes[i] for i in range(len(prompts))]
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        return self.select_models([prompt])[0]
+
+    def close(self) -> None:
+        self._reset()
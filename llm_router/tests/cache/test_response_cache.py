@@ -0,0 +1,130 @@
+import sqlite3
+import time
+
+import pytest
+
+from llm_router.cache import (
+    InMemoryResponseCache,
+    SQLiteResponseCache,
+    make_cache_key,
+)
+from llm_router.providers import ProviderResponse
+
+
+def _resp(text: str = "answer") -> ProviderResponse:
+    return ProviderResponse(text=text, prompt_tokens=1, completion_tokens=2)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    def factory(**kwargs):
+        if request.param == "memory":
+            return InMemoryResponseCache(**kwargs)
+        return SQLiteResponseCache(tmp_path / "cache.db", **kwargs)
+
+    return factory
+
+
+def test_cache_key_normalizes_whitespace():
+    """Test that keys ignore surrounding whitespace and line-ending style"""
+    assert make_cache_key("openai", "gpt", "  hello world\n") == make_cache_key(
+        "openai", "gpt", "hello world"
+    )
+    assert make_cache_key("openai", "gpt", "a\r\n  b") == make_cache_key("openai", "gpt", "a\n  b")
+
+
+def test_cache_key_keeps_indentation():
+    """Test that inner whitespace, e.g. code indentation, changes the key"""
+    assert make_cache_key("openai", "gpt", "if x:\n    y") != make_cache_key(
+        "openai", "gpt", "if x:\n y"
+    )
+    assert make_cache_key("openai", "gpt", "hi") != make_cache_key("google", "gpt", "hi")
+
+
+def test_cache_roundtrip(make_cache):
+    cache = make_cache()
+    assert cache.lookup("openai", "gpt", "hi") is None
+    cache.store("openai", "gpt", "hi", _resp())
+    assert cache.lookup("openai", "gpt", " hi ") == _resp()
+
+
+def test_cache_evicts_lru_by_count(make_cache):
+    """Test that the least recently used entry is evicted first"""
+    cache = make_cache(max_entries=2)
+    cache.set("a", _resp("a"))
+    time.sleep(0.01)
+    cache.set("b", _resp("b"))
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.set("c", _resp("c"))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_cache_evicts_by_bytes(make_cache):
+    size = len(_resp("x" * 10).model_dump_json())
+    cache = make_cache(max_bytes=size * 2)
+    for key in "abc":
+        cache.set(key, _resp("x" * 10))
+        time.sleep(0.01)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+
+
+def test_cache_ttl(make_cache):
+    cache = make_cache(ttl=0.01)
+    cache.set("a", _resp())
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = SQLiteResponseCache(path)
+    cache.set("a", _resp())
+    cache.close()
+    assert SQLiteResponseCache(path).get("a") == _resp()
+
+
+def test_sqlite_cache_batches_access_times(tmp_path):
+    """Test that hits update access times in batches rather than per hit"""
+    path = tmp_path / "cache.db"
+    cache = SQLiteResponseCache(path, access_batch=2)
+    cache.set("a", _resp())
+    cache.set("b", _resp())
+    written = cache._conn.total_changes
+    cache.get("a")
+    cache.get("a")
+    assert cache._conn.total_changes == written
+    cache.get("b")
+    assert cache._conn.total_changes == written + 2
+
+
+def test_sqlite_cache_tracks_totals(tmp_path):
+    """Test that the stored entry and byte totals follow every write"""
+    path = tmp_path / "cache.db"
+    cache = SQLiteResponseCache(path, max_entries=2, ttl=60)
+    cache.set("a", _resp("a"))
+    cache.set("a", _resp("a" * 10))
+    cache.set("b", _resp("b"))
+    time.sleep(0.01)
+    cache.set("c", _resp("c"))
+
+    expected = cache._conn.execute("SELECT COUNT(*), SUM(size) FROM responses").fetchone()
+    assert cache._totals() == expected == (2, 2 * len(_resp("b").model_dump_json()))
+    cache.clear()
+    assert cache._totals() == (0, 0)
+    cache.close()
+
+    # A database written before the totals existed is counted once on open.
+    conn = sqlite3.connect(str(path))
+    for trigger in ("responses_insert", "responses_delete", "responses_resize"):
+        conn.execute(f"DROP TRIGGER {trigger}")
+    conn.execute("DROP TABLE responses_totals")
+    conn.execute("INSERT INTO responses VALUES ('x', '{}', 2, 0, 0)")
+    conn.commit()
+    conn.close()
+    assert SQLiteResponseCache(path)._totals() == (1, 2)
@@ -0,0 +1,109 @@
+import re
+
+import numpy as np
+
+from fyras_models import SelectorVote
+from llm_router.cache import KeyedResponseCache, ResponseCache, SemanticCache
+from llm_router.providers import ProviderResponse
+from llm_router.selectors.semantic import SemanticCachingSelector
+
+VOCAB = ["hello", "world", "price", "stock", "python", "code", "name"]
+
+
+class BagOfWordsEncoder:
+    """Deterministic encoder: counts vocabulary words, ignoring everything else."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, texts):
+        self.calls += 1
+        out = np.zeros((len(texts), len(VOCAB) + 1), dtype=np.float32)
+        for i, text in enumerate(texts):
+            words = re.findall(r"[a-z]+", text.lower())
+            for word in words:
+                if word in VOCAB:
+                    out[i, VOCAB.index(word)] += 1
+            out[i, -1] = 0.1
+        return out
+
+
+def _vote(model="m"):
+    return SelectorVote(selector_name="Test", model=model)
+
+
+def test_semantic_vote_reuse_for_near_duplicates():
+    """Test that prompts differing only in names/numbers reuse the vote"""
+    cache = SemanticCache(encoder=BagOfWordsEncoder(), threshold=0.9, capacity=8)
+    cache.store_vote("stock price for ACME 42", _vote("finance"))
+
+    assert cache.lookup_vote("stock price for Globex 7").model == "finance"
+    assert cache.lookup_vote("python code please") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_semantic_response_reuse_requires_same_model():
+    cache = SemanticCache(encoder=BagOfWordsEncoder(), response_threshold=0.95)
+    resp = ProviderResponse(text="hi", prompt_tokens=1, completion_tokens=1)
+    cache.store("openai", "gpt", "hello world", resp)
+
+    assert cache.lookup("openai", "gpt", "Hello,  world!") == resp
+    assert cache.lookup("google", "gemini", "hello world") is None
+
+
+def test_semantic_cache_is_a_response_cache():
+    """The semantic cache implements the whole interface the router uses."""
+    cache = SemanticCache(encoder=BagOfWordsEncoder())
+    assert isinstance(cache, ResponseCache)
+    assert not isinstance(cache, KeyedResponseCache)
+    cache.store("openai", "gpt", "hello world", ProviderResponse(text="hi", prompt_tokens=1, completion_tokens=1))
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_semantic_exact_hit_skips_encoder():
+    encoder = BagOfWordsEncoder()
+    cache = SemanticCache(encoder=encoder)
+    cache.store("openai", "gpt", "hello", ProviderResponse(text="x", prompt_tokens=1, completion_tokens=1))
+    calls = encoder.calls
+    cache._embeddings.clear()
+    assert cache.lookup("openai", "gpt", "hello") is not None
+    assert encoder.calls == calls
+
+
+def test_semantic_capacity_overwrites_oldest():
+    cache = SemanticCache(encoder=BagOfWordsEncoder(), capacity=2)
+    cache.store_vote("hello", _vote("a"))
+    cache.store_vote("python", _vote("b"))
+    cache.store_vote("stock", _vote("c"))
+    assert len(cache) == 2
+    assert cache.lookup_vote("hello") is None
+    assert cache.lookup_vote("stock").model == "c"
+
+
+def test_semantic_index_persists(tmp_path):
+    """Test that a saved memory-mapped index is reloaded warm"""
+    cache = SemanticCache(encoder=BagOfWordsEncoder(), capacity=4, path=tmp_path)
+    cache.store_vote("python code", _vote("programming"))
+    cache.save()
+
+    reloaded = SemanticCache(encoder=BagOfWordsEncoder(), capacity=4, path=tmp_path)
+    assert len(reloaded) == 1
+    assert reloaded.lookup_vote("code in python").model == "programming"
+
+
+def test_semantic_caching_selector():
+    class Inner:
+        def __init__(self):
+            self.prompts = []
+
+        def select_model(self, prompt):
+            self.prompts.append(prompt)
+            return _vote("general")
+
+    inner = Inner()
+    selector = SemanticCachingSelector(inner, SemanticCache(encoder=BagOfWordsEncoder()))
+    selector.select_model("hello world, my name is Ann")
+    selector.select_model("hello world, my name is Bob")
+    assert inner.prompts == ["hello world, my name is Ann"]
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from fyras_models import SelectorVote
+from llm_router.councils.iterative import IterativeCouncil
+from llm_router.councils.parallel import ParallelCouncil
+from llm_router.councils.random import RandomCouncil
+from llm_router.councils.weighted import UnanimousCouncil, WeightedCouncil
+from llm_router.exceptions.exceptions import CouncilError
+
+
+class FixedSelector:
+    """Selector double voting for one model after an optional delay."""
+
+    def __init__(self, model, weight=1.0, delay=0.0, error=None):
+        self.model = model
+        self.weight = weight
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.threads = set()
+
+    def select_model(self, prompt):
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return SelectorVote(selector_name=f"Fixed-{self.model}", model=self.model, weight=self.weight)
+
+
+def test_selectors_run_concurrently():
+    """Three selectors sleeping 0.2s each decide in about 0.2s, not 0.6s."""
+    council = WeightedCouncil([FixedSelector(m, delay=0.2) for m in ("a", "b", "c")])
+    start = time.perf_counter()
+    decision = council.decide("hi")
+    assert time.perf_counter() - start < 0.5
+    assert len(decision.votes) == 3
+    assert decision.metadata["prompt_length"] == "2"
+
+
+def test_timeout_drops_slow_selector():
+    """A selector slower than the timeout is left out of the decision."""
+    council = WeightedCouncil(
+        [FixedSelector("fast"), FixedSelector("slow", weight=5.0, delay=1.0)], timeout=0.1
+    )
+    start = time.perf_counter()
+    decision = council.decide("hi")
+    assert time.perf_counter() - start < 0.5
+    assert decision.final_model == "fast"
+    assert decision.weighted_results == {"fast": 1.0}
+    assert decision.metadata["timed_out"] == "FixedSelector"
+    council.close()
+
+
+def test_hung_selector_does_not_starve_the_others():
+    """Once a selector's threads are all stuck it is skipped without waiting."""
+    release = threading.Event()
+
+    class HungSelector:
+        def select_model(self, prompt):
+            release.wait()
+
+    council = WeightedCouncil([HungSelector(), FixedSelector("fast")], timeout=0.05, max_workers=2)
+    try:
+        decisions = [council.decide("hi") for _ in range(20)]
+        assert all(decision.final_model == "fast" for decision in decisions)
+        start = time.perf_counter()
+        assert council.decide("hi").metadata["timed_out"] == "HungSelector"
+        assert time.perf_counter() - start < 0.05
+    finally:
+        release.set()
+        council.close()
+
+
+def test_failing_selector_is_skipped_and_all_failing_raises():
+    council = ParallelCouncil([FixedSelector("a"), FixedSelector("b", error=RuntimeError("boom"))])
+    decision = council.decide("hi")
+    assert decision.final_model == "a"
+    assert decision.metadata["failed"] == "FixedSelector"
+
+    with pytest.raises(CouncilError):
+        ParallelCouncil([FixedSelector("b", error=RuntimeError("boom"))]).decide("hi")
+
+
+def test_weighted_and_majority_aggregation():
+    """Weights decide a weighted council; vote counts decide a parallel one."""
+    selectors = [FixedSelector("a", 0.4), FixedSelector("a", 0.4), FixedSelector("b", 0.9)]
+    weighted = WeightedCouncil(selectors).decide("hi")
+    assert weighted.weighted_results == pytest.approx({"a": 0.8, "b": 0.9})
+    assert weighted.final_model == "b"
+    assert ParallelCouncil(selectors).decide("hi").final_model == "a"
+
+    boosted = WeightedCouncil(selectors, weights=[2.0, 2.0, 1.0]).decide("hi")
+    assert boosted.final_model == "a"
+    assert boosted.weighted_results["a"] == pytest.approx(1.6)
+
+
+def test_unanimous_council():
+    assert UnanimousCouncil([FixedSelector("a"), FixedSelector("a")]).decide("hi").final_model == "a"
+    split = [FixedSelector("a"), FixedSelector("b")]
+    assert UnanimousCouncil(split, fallback_model="c").decide("hi").final_model == "c"
+    with pytest.raises(CouncilError):
+        UnanimousCouncil(split).decide("hi")
+
+
+def test_random_council_draws_voted_models():
+    council = RandomCouncil([FixedSelector("a"), FixedSelector("b", weight=0.0)], seed=1)
+    assert {council.decide("hi").final_model for _ in range(10)} == {"a"}
+
+
+def test_iterative_council_stops_early():
+    """Once a model holds the threshold the remaining selectors aren't asked."""
+    selectors = [FixedSelector("a"), FixedSelector("a"), FixedSelector("b"), FixedSelector("b")]
+    decision = IterativeCouncil(selectors, threshold=0.5).decide("hi")
+    assert decision.final_model == "a"
+    assert decision.metadata["rounds"] == "2"
+    assert [s.calls for s in selectors] == [1, 1, 0, 0]
@@ -0,0 +1,133 @@
+"""Test doubles shared by several test modules."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import ProviderCompletionError
+from llm_router.providers import Provider, ProviderResponse, ProviderStreamSummary
+from llm_router.schemas.responses import RoutingVote
+
+
+class StubProvider(Provider):
+    """Provider double that echoes the prompt and records each call."""
+
+    api_key_env = "ANTHROPIC_API_KEY"
+
+    def __init__(self, env_path: Path | None = None, name: str = "anthropic") -> None:
+        self._name = name
+        self.calls = []
+        super().__init__(env_path=env_path)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def complete(self, model: str, prompt: str) -> ProviderResponse:
+        self.calls.append((model, prompt))
+        return ProviderResponse(text=f"{model}:{prompt}", prompt_tokens=10, completion_tokens=20)
+
+    async def acomplete(self, model: str, prompt: str) -> ProviderResponse:
+        await asyncio.sleep(0.01)
+        return self.complete(model, prompt)
+
+    def stream(self, model: str, prompt: str):
+        self.calls.append((model, prompt))
+        words = prompt.split()
+        for word in words:
+            yield word + " "
+        yield ProviderStreamSummary(
+            text=" ".join(words) + " ",
+            prompt_tokens=len(words),
+            completion_tokens=len(words),
+            cost=0.01,
+            time_to_first_token=0.001,
+            latency=0.002,
+        )
+
+    def get_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        return (prompt_tokens + completion_tokens) / 1000
+
+
+class StaticSelector:
+    """Selector double that always votes for the same model."""
+
+    def __init__(self, model: str = "claude-3-haiku-20240307") -> None:
+        self.model = model
+        self.prompts = []
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        self.prompts.append(prompt)
+        return SelectorVote(selector_name="StaticSelector", model=self.model, rationale="static")
+
+
+class VotingSelector:
+    """Selector double voting for a fixed (provider, model) pair."""
+
+    def __init__(self, provider="anthropic", model="claude-3-haiku-20240307", topic="SIMPLE"):
+        self.vote = RoutingVote(
+            selector_name="VotingSelector", model=model, rationale="static",
+            topic=topic, provider=provider,
+        )
+
+    def select_model(self, prompt):
+        return self.vote
+
+
+class HTTPError(Exception):
+    """HTTP client error double carrying a status code and headers."""
+
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.status_code = status
+        self.response = SimpleNamespace(status_code=status, headers=headers or {})
+
+
+class FlakyProvider(StubProvider):
+    """Stub provider that fails with ``error`` for the first ``failures`` calls."""
+
+    def __init__(self, env_path, name="anthropic", failures=0, error=None):
+        self.failures = failures
+        self.error = error or HTTPError(503)
+        self.attempts = 0
+        super().__init__(env_path=env_path, name=name)
+
+    def complete(self, model, prompt):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            try:
+                raise self.error
+            except Exception as exc:
+                raise ProviderCompletionError(str(exc), provider=self.name, model=model) from exc
+        return super().complete(model, prompt)
+
+    async def acomplete(self, model, prompt):
+        return self.complete(model, prompt)
+
+
+class FakeClassifier:
+    """Zero-shot pipeline double that always ranks ``label`` first."""
+
+    def __init__(self, label: str = "PROGRAMMING") -> None:
+        self.label = label
+
+    def __call__(self, prompt, labels, **kwargs):
+        return {"sequence": prompt, "labels": [self.label], "scores": [1.0]}
+
+
+def fake_completion(seen):
+    """Return a ``completion`` stand-in that records the client it is given."""
+
+    class Usage:
+        prompt_tokens = 1
+        completion_tokens = 1
+
+    class Resp(dict):
+        usage = Usage()
+
+    def completion(model, messages, client, **kwargs):
+        seen.append(client)
+        return Resp(choices=[{"message": {"content": "ok"}}])
+
+    return completion
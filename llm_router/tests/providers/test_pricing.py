@@ -0,0 +1,73 @@
+import json
+import math
+from pathlib import Path
+
+import pytest
+from litellm import cost_per_token
+
+from llm_router.exceptions.exceptions import ProviderCostError
+from llm_router.providers import ModelPrice, OpenAIProvider, PricingTable
+from llm_router.schemas.config import TOPIC_TO_MODEL
+
+
+def test_table_matches_litellm_sum():
+    """Costs include both prompt and completion tokens."""
+    table = PricingTable.for_models(["gpt-4o"])
+    prompt_cost, completion_cost = cost_per_token(
+        model="gpt-4o", prompt_tokens=1000, completion_tokens=500
+    )
+    assert table.cost("gpt-4o", 1000, 500) == pytest.approx(prompt_cost + completion_cost)
+
+
+def test_provider_resolves_topic_models(tmp_path: Path):
+    """Provider initialization prices every model it serves in TOPIC_TO_MODEL."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("OPENAI_API_KEY=a\n")
+    provider = OpenAIProvider(env_path=env_file)
+    for models in TOPIC_TO_MODEL.values():
+        assert models["openai"] in provider.pricing
+    assert provider.get_cost("gpt-4o", 10, 10) > provider.get_cost("gpt-4o", 10, 0)
+
+
+def test_overrides_from_json(tmp_path: Path):
+    """JSON overrides take precedence and work for unmapped models."""
+    path = tmp_path / "prices.json"
+    path.write_text(json.dumps({
+        "gpt-4o": {"input_cost_per_token": 1.0, "output_cost_per_token": 2.0},
+        "in-house": {"input_cost_per_token": 0.5, "output_cost_per_token": 0.5},
+    }))
+    table = PricingTable.for_models(["gpt-4o"], overrides=path)
+    assert table.cost("gpt-4o", 3, 1) == 5.0
+    assert table.cost("in-house", 2, 2) == 2.0
+
+
+def test_unknown_model_raises(tmp_path: Path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("OPENAI_API_KEY=a\n")
+    provider = OpenAIProvider(env_path=env_file, pricing=PricingTable())
+    with pytest.raises(ProviderCostError):
+        provider.get_cost("unpriced-model", 1, 1)
+
+
+def test_cost_many():
+    """Bulk costs match the per-request costs; unpriced models are nan."""
+    table = PricingTable({
+        "a": ModelPrice(input_cost_per_token=0.001, output_cost_per_token=0.002),
+        "b": ModelPrice(input_cost_per_token=0.01, output_cost_per_token=0.0),
+    })
+    costs = table.cost_many(["a", "b", "a", "unpriced-model"], [10, 10, 0, 5], [5, 5, 100, 5])
+    assert costs[:3].tolist() == pytest.approx([0.02, 0.1, 0.2])
+    assert math.isnan(costs[3])
+
+
+def test_long_context_tier_matches_litellm():
+    """Prompts past a model's long-context tier are priced at the tier's rates."""
+    table = PricingTable.for_models(["gemini-2.5-pro"])
+    prompt_cost, completion_cost = cost_per_token(
+        model="gemini-2.5-pro", prompt_tokens=300_000, completion_tokens=1000
+    )
+    assert table.cost("gemini-2.5-pro", 300_000, 1000) == pytest.approx(prompt_cost + completion_cost)
+    assert table.cost_many(["gemini-2.5-pro"] * 2, [300_000, 1000], [1000, 1000]).tolist() == pytest.approx(
+        [prompt_cost + completion_cost, table.cost("gemini-2.5-pro", 1000, 1000)]
+    )
+    assert table.cost("gemini-2.5-pro", 300_000, 0) > 2 * table.cost("gemini-2.5-pro", 150_000, 0)
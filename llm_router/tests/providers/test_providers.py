@@ -1,8 +1,17 @@
+import asyncio
+import httpx
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 
-from llm_router.providers import AnthropicProvider, OpenAIProvider, GoogleProvider
+from llm_router.providers import (
+    AnthropicProvider,
+    OpenAIProvider,
+    GoogleProvider,
+    ProviderStreamSummary,
+)
 from llm_router.schemas.env_validator import EnvVarError
+from llm_router.tests.helpers import fake_completion
 from llm_router.exceptions.exceptions import (
     ProviderCompletionError,
     ProviderCostError,
@@ -37,7 +46,7 @@ def test_provider_completion_error(monkeypatch, tmp_path: Path) -> None:
     def boom(*args, **kwargs):
         raise RuntimeError("fail")
 
-    monkeypatch.setattr("llm_router.providers.openai.completion", boom)
+    monkeypatch.setattr("llm_router.providers.base.completion", boom)
     with pytest.raises(ProviderCompletionError):
         provider.complete(model="gpt", prompt="hi")
 
@@ -50,6 +59,179 @@ def test_provider_cost_error(monkeypatch, tmp_path: Path) -> None:
     def boom(*args, **kwargs):
         raise RuntimeError("fail")
 
-    monkeypatch.setattr("llm_router.providers.openai.cost_per_token", boom)
+    monkeypatch.setattr("llm_router.providers.pricing.cost_per_token", boom)
     with pytest.raises(ProviderCostError):
-        provider.get_cost(model="gpt", prompt_tokens=1, completion_tokens=1)
+        provider.get_cost(model="unpriced-model", prompt_tokens=1, completion_tokens=1)
+
+
+def test_provider_acomplete(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("GEMINI_API_KEY=a\n")
+    provider = GoogleProvider(env_path=env_file)
+    seen = {}
+
+    class Usage:
+        prompt_tokens = 3
+        completion_tokens = 4
+
+    class Resp(dict):
+        usage = Usage()
+
+    async def fake_acompletion(model, messages, **kwargs):
+        seen["model"] = model
+        return Resp(choices=[{"message": {"content": "hello"}}])
+
+    monkeypatch.setattr("llm_router.providers.base.acompletion", fake_acompletion)
+    resp = asyncio.run(provider.acomplete(model="gemini-2.5-flash", prompt="hi"))
+
+    assert seen["model"] == "gemini/gemini-2.5-flash"
+    assert resp.text == "hello"
+    assert resp.completion_tokens == 4
+
+
+def test_provider_acomplete_error(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("OPENAI_API_KEY=a\n")
+    provider = OpenAIProvider(env_path=env_file)
+
+    async def boom(*args, **kwargs):
+        raise RuntimeError("fail")
+
+    monkeypatch.setattr("llm_router.providers.base.acompletion", boom)
+    with pytest.raises(ProviderCompletionError):
+        asyncio.run(provider.acomplete(model="gpt", prompt="hi"))
+
+
+def _chunk(text=None, usage=None):
+    delta = SimpleNamespace(content=text)
+    choices = [SimpleNamespace(delta=delta)] if text is not None else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def test_provider_stream(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    provider = AnthropicProvider(env_path=env_file)
+
+    def fake_completion(model, messages, stream, **kwargs):
+        assert stream is True
+        yield _chunk("Hel")
+        yield _chunk("lo")
+        yield _chunk(usage=SimpleNamespace(prompt_tokens=5, completion_tokens=2))
+
+    monkeypatch.setattr("llm_router.providers.base.completion", fake_completion)
+    monkeypatch.setattr(provider, "get_cost", lambda model, p, c: 0.5)
+
+    items = list(provider.stream(model="claude", prompt="hi"))
+
+    assert items[:2] == ["Hel", "lo"]
+    summary = items[-1]
+    assert isinstance(summary, ProviderStreamSummary)
+    assert summary.text == "Hello"
+    assert (summary.prompt_tokens, summary.completion_tokens) == (5, 2)
+    assert summary.cost == 0.5
+    assert 0 <= summary.time_to_first_token <= summary.latency
+
+
+def test_provider_stream_error(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("OPENAI_API_KEY=a\n")
+    provider = OpenAIProvider(env_path=env_file)
+
+    def boom(*args, **kwargs):
+        raise RuntimeError("fail")
+
+    monkeypatch.setattr("llm_router.providers.base.completion", boom)
+    with pytest.raises(ProviderCompletionError):
+        list(provider.stream(model="gpt", prompt="hi"))
+
+
+def test_provider_reuses_pooled_client(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    provider = AnthropicProvider(env_path=env_file)
+    seen = []
+    monkeypatch.setattr("llm_router.providers.base.completion", fake_completion(seen))
+
+    provider.complete(model="claude", prompt="hi")
+    provider.complete(model="claude", prompt="hi")
+
+    assert len(seen) == 2 and seen[0] is seen[1]
+    provider.close()
+    provider.complete(model="claude", prompt="hi")
+    assert seen[2] is not seen[0]
+
+
+def test_provider_async_handler_wraps_pooled_client(monkeypatch, tmp_path: Path) -> None:
+    """The async handler uses the pooled client only, and aclose closes it."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    provider = AnthropicProvider(env_path=env_file)
+    created = []
+
+    class CountingClient(httpx.AsyncClient):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", CountingClient)
+
+    async def run():
+        handler = provider._client(asynchronous=True)
+        assert provider._client(asynchronous=True) is handler
+        assert handler.client is created[0]
+        await provider.aclose()
+
+    asyncio.run(run())
+    assert len(created) == 1 and created[0].is_closed
+
+
+def test_provider_releases_clients_of_closed_loops(tmp_path: Path) -> None:
+    """A client left open when its loop ended is dropped on next use."""
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    provider = AnthropicProvider(env_path=env_file)
+
+    async def use():
+        provider._client(asynchronous=True)
+        return asyncio.get_running_loop()
+
+    first = asyncio.run(use())
+    second = asyncio.run(use())
+
+    assert list(provider._async_clients) == [second]
+    provider.close()
+    assert provider._async_clients == {}
+    assert first.is_closed()
+
+
+def test_provider_unpooled_builds_client_per_call(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("OPENAI_API_KEY=a\n")
+    provider = OpenAIProvider(env_path=env_file, pooled=False)
+    seen = []
+    monkeypatch.setattr("llm_router.providers.base.completion", fake_completion(seen))
+
+    provider.complete(model="gpt", prompt="hi")
+    provider.complete(model="gpt", prompt="hi")
+
+    assert seen[0] is not seen[1]
+    assert seen[0].is_closed()
+
+
+def test_provider_warmup_skips_recently_used_client(monkeypatch, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    provider = AnthropicProvider(env_path=env_file)
+    heads = []
+
+    class Transport:
+        def head(self, url, timeout):
+            heads.append(url)
+
+    monkeypatch.setattr(provider, "_transport", lambda client: Transport())
+
+    assert provider.warmup() is True
+    assert heads == ["https://api.anthropic.com"]
+    assert provider.warmup() is False
+    assert AnthropicProvider(env_path=env_file, pooled=False).warmup() is False
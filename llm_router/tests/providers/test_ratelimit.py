@@ -0,0 +1,84 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from llm_router.exceptions.exceptions import RateLimitExceededError
+from llm_router.providers import ModelLimits, RateLimiter, TokenBucket
+from llm_router.tests.helpers import fake_completion
+
+
+def test_token_bucket_wait_time() -> None:
+    bucket = TokenBucket(rate=10, capacity=5)
+    now = time.monotonic()
+
+    assert bucket.wait_time(5, now) == 0.0
+    bucket.take(5)
+    assert bucket.wait_time(2, now) == pytest.approx(0.2)
+
+
+def test_rate_limiter_blocks_on_request_budget() -> None:
+    limiter = RateLimiter(rpm=600)  # 10 requests per second, burst of 600
+    limiter._provider_buckets[0].level = 1
+
+    assert limiter.acquire("m", 1) == 0.0
+    waited = limiter.acquire("m", 1)
+
+    assert waited >= 0.09
+    assert limiter.stats()["waits"] == 1
+
+
+def test_rate_limiter_per_model_tokens_and_reconcile() -> None:
+    limiter = RateLimiter(models={"big": ModelLimits(tpm=600)}, max_wait=0.01)
+
+    limiter.acquire("big", 600)
+    limiter.acquire("other", 10_000)  # no limit configured for this model
+    with pytest.raises(RateLimitExceededError):
+        limiter.acquire("big", 100)
+
+    limiter.reconcile("big", reserved=600, used=100)
+    assert limiter.acquire("big", 100) == 0.0
+
+
+def test_provider_reserves_estimated_tokens(monkeypatch, tmp_path: Path) -> None:
+    from llm_router.providers import AnthropicProvider
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    limiter = RateLimiter(tpm=1000, completion_tokens_estimate=100)
+    provider = AnthropicProvider(env_path=env_file, rate_limiter=limiter)
+    monkeypatch.setattr("llm_router.providers.base.completion", fake_completion([]))
+    level = limiter._provider_buckets[1].level
+
+    provider.complete(model="claude", prompt="hello there")
+
+    # The estimate is reserved up front, then corrected to the 2 tokens used.
+    assert limiter._provider_buckets[1].level == pytest.approx(level - 2, abs=0.5)
+
+
+def test_provider_refunds_failed_and_abandoned_calls(monkeypatch, tmp_path: Path) -> None:
+    from llm_router.exceptions.exceptions import ProviderCompletionError
+    from llm_router.providers import AnthropicProvider
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("ANTHROPIC_API_KEY=a\n")
+    limiter = RateLimiter(tpm=1000, completion_tokens_estimate=100)
+    provider = AnthropicProvider(env_path=env_file, rate_limiter=limiter)
+    level = limiter._provider_buckets[1].level
+
+    def failing(**kwargs):
+        raise ConnectionError("reset")
+
+    monkeypatch.setattr("llm_router.providers.base.completion", failing)
+    with pytest.raises(ProviderCompletionError):
+        provider.complete(model="claude", prompt="hello there")
+    assert limiter._provider_buckets[1].level == pytest.approx(level, abs=0.5)
+
+    monkeypatch.setattr(
+        "llm_router.providers.base.completion", lambda **kwargs: iter([object()] * 3)
+    )
+    monkeypatch.setattr(AnthropicProvider, "_chunk_text", staticmethod(lambda chunk: "hi"))
+    chunks = provider.stream(model="claude", prompt="hello there")
+    next(chunks)
+    chunks.close()
+    assert limiter._provider_buckets[1].level == pytest.approx(level, abs=0.5)
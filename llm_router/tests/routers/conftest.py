@@ -0,0 +1,22 @@
+import pytest
+from pathlib import Path
+from llm_router.tests.helpers import StaticSelector, StubProvider
+
+
+@pytest.fixture
+def env_file(tmp_path) -> Path:
+    file = tmp_path / ".env"
+    file.write_text(
+        "HF_API_KEY=test\nPROMPTLAYER_API_KEY=test\nANTHROPIC_API_KEY=test\n"
+    )
+    return file
+
+
+@pytest.fixture
+def stub_provider(env_file) -> StubProvider:
+    return StubProvider(env_path=env_file)
+
+
+@pytest.fixture
+def static_selector() -> StaticSelector:
+    return StaticSelector()
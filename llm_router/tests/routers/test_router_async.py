@@ -0,0 +1,39 @@
+import asyncio
+import threading
+
+from llm_router.routers.router import LLMRouterService
+
+
+def test_ainvoke_runs_selector_off_loop(env_file, stub_provider, static_selector):
+    """Test that ainvoke offloads selection and awaits the provider"""
+    loop_threads = []
+
+    class ThreadRecordingSelector:
+        def select_model(self, prompt):
+            loop_threads.append(threading.get_ident())
+            return static_selector.select_model(prompt)
+
+    router = LLMRouterService(
+        Selector=ThreadRecordingSelector(), env_path=env_file, provider=stub_provider
+    )
+
+    async def run():
+        return threading.get_ident(), await router.ainvoke("hello")
+
+    loop_thread, response = asyncio.run(run())
+
+    assert loop_threads and loop_threads[0] != loop_thread
+    assert response.response == f"{static_selector.model}:hello"
+    assert response.cost == 0.03
+
+
+def test_ainvoke_concurrent(env_file, stub_provider, static_selector):
+    """Test many ainvoke calls can be in flight together"""
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=stub_provider)
+    prompts = [f"p{i}" for i in range(50)]
+
+    async def run():
+        return await asyncio.gather(*(router.ainvoke(p) for p in prompts))
+
+    responses = asyncio.run(run())
+    assert [r.prompt for r in responses] == prompts
@@ -0,0 +1,45 @@
+from fyras_models import SelectorVote
+from llm_router.routers.router import LLMRouterService
+
+
+class BatchSelector:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        raise AssertionError("select_models should be used for batches")
+
+    def select_models(self, prompts, batch_size=8):
+        self.batches.append((list(prompts), batch_size))
+        return [
+            SelectorVote(selector_name="BatchSelector", model=f"model-{len(p)}")
+            for p in prompts
+        ]
+
+
+def test_invoke_batch_uses_batched_selection(env_file, stub_provider):
+    """Test that invoke_batch classifies once and keeps prompt order"""
+    selector = BatchSelector()
+    router = LLMRouterService(Selector=selector, env_path=env_file, provider=stub_provider)
+    prompts = ["a", "bb", "ccc", "dddd"]
+
+    responses = router.invoke_batch(prompts, batch_size=2, max_workers=3)
+
+    assert selector.batches == [(prompts, 2)]
+    assert [r.prompt for r in responses] == prompts
+    assert [r.model for r in responses] == ["model-1", "model-2", "model-3", "model-4"]
+    assert responses[2].response == "model-3:ccc"
+    assert router.predicted_model() in {"model-1", "model-2", "model-3", "model-4"}
+
+
+def test_invoke_batch_falls_back_to_select_model(env_file, stub_provider, static_selector):
+    """Test selectors without select_models are called per prompt"""
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=stub_provider)
+    responses = router.invoke_batch(["x", "y"])
+    assert static_selector.prompts == ["x", "y"]
+    assert [r.prompt for r in responses] == ["x", "y"]
+
+
+def test_invoke_batch_empty(env_file, stub_provider, static_selector):
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=stub_provider)
+    assert router.invoke_batch([]) == []
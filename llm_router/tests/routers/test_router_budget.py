@@ -0,0 +1,135 @@
+import pytest
+
+from llm_router.exceptions.exceptions import ProviderCompletionError, UsableModelForPromptError
+from llm_router.routers.circuit import CircuitBreakers, CircuitState
+from llm_router.routers.resilience import RetryPolicy
+from llm_router.routers.router import LLMRouterService
+from llm_router.schemas.config import TOPIC_TO_MODEL
+from llm_router.utils.tokens import count_tokens
+from llm_router.tests.helpers import StubProvider, VotingSelector
+
+OPUS = TOPIC_TO_MODEL["COMPLEX"]["anthropic"]
+GENERAL = TOPIC_TO_MODEL["GENERAL"]["anthropic"]
+
+
+class WindowedProvider(StubProvider):
+    """Stub provider with fixed context windows and per-model prices per token."""
+
+    def __init__(self, env_path, name="anthropic", windows=None, prices=None):
+        self.windows = windows or {}
+        self.prices = prices or {}
+        super().__init__(env_path=env_path, name=name)
+
+    def context_window(self, model):
+        return self.windows.get(model)
+
+    def get_cost(self, model, prompt_tokens, completion_tokens):
+        return (prompt_tokens + completion_tokens) * self.prices.get(model, 0.001)
+
+
+class DownProvider(WindowedProvider):
+    """Windowed provider whose every call fails."""
+
+    def complete(self, model, prompt):
+        self.calls.append((model, prompt))
+        raise ProviderCompletionError("down", provider=self.name, model=model)
+
+
+def test_context_window_from_model_map(env_file):
+    """Context windows come from LiteLLM's model map."""
+    provider = StubProvider(env_path=env_file, name="openai")
+    assert provider.context_window("gpt-4o") >= 100_000
+    assert provider.context_window("no-such-model") is None
+
+
+def test_count_tokens_is_cached():
+    """Repeated counts of the same prompt are served from the cache."""
+    prompt = "count me " * 50
+    count_tokens.cache_clear()
+    count_tokens(prompt)
+    count_tokens(prompt)
+    assert count_tokens.cache_info().hits == 1
+
+
+def test_plain_call_keeps_model(env_file, static_selector):
+    """Prompts that fit and have no cost cap are not re-routed."""
+    provider = WindowedProvider(env_path=env_file)
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=provider)
+    response = router.invoke("hello")
+    assert provider.calls == [(static_selector.model, "hello")]
+    assert response.metadata is None
+
+
+def test_oversized_prompt_uses_larger_window(env_file):
+    """A prompt over the routed model's window goes to a model it fits."""
+    small = WindowedProvider(env_path=env_file, windows={OPUS: 5})
+    large = WindowedProvider(env_path=env_file, name="openai", windows={"gpt-4o": 10_000})
+    router = LLMRouterService(
+        Selector=VotingSelector(model=OPUS, topic="COMPLEX"),
+        env_path=env_file,
+        providers={"anthropic": small, "openai": large},
+    )
+    response = router.invoke("a prompt that is longer than five tokens for sure")
+    assert small.calls == []
+    assert large.calls[0][0] == "gpt-4o"
+    assert response.metadata.downgraded is True
+
+
+def test_max_cost_downgrades(env_file):
+    """An estimate over ``max_cost`` downgrades to a cheaper topic's model."""
+    provider = WindowedProvider(env_path=env_file, prices={OPUS: 1.0, GENERAL: 0.0001})
+    router = LLMRouterService(
+        Selector=VotingSelector(model=OPUS, topic="COMPLEX"), env_path=env_file, provider=provider
+    )
+    response = router.invoke("hello", max_cost=0.1)
+    assert provider.calls == [(GENERAL, "hello")]
+    assert response.metadata.downgraded is True
+    assert response.metadata.estimated_cost < 0.1
+
+    response = router.invoke("hello", max_cost=1000)
+    assert provider.calls[-1] == (OPUS, "hello")
+    assert response.metadata.downgraded is False
+
+
+def test_max_cost_unreachable_raises(env_file, static_selector):
+    """Without any model under the cap the request is rejected before calling."""
+    provider = WindowedProvider(env_path=env_file, prices={})
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=provider)
+    with pytest.raises(UsableModelForPromptError):
+        router.invoke("hello", max_cost=0.0)
+    assert provider.calls == []
+
+
+def test_failover_skips_alternatives_over_max_cost(env_file):
+    """Retries fail over only to models whose estimate is within ``max_cost``."""
+    primary = DownProvider(env_path=env_file, prices={OPUS: 0.0001})
+    pricey = WindowedProvider(env_path=env_file, name="openai", prices={"gpt-4o": 1.0})
+    cheap = WindowedProvider(env_path=env_file, name="google", prices={"gemini-2.5-pro": 0.0001})
+    router = LLMRouterService(
+        Selector=VotingSelector(model=OPUS, topic="COMPLEX"),
+        env_path=env_file,
+        providers={"anthropic": primary, "openai": pricey, "google": cheap},
+        retry=RetryPolicy(max_attempts=1),
+    )
+    response = router.invoke("hello", max_cost=0.1)
+    assert pricey.calls == []
+    assert cheap.calls == [("gemini-2.5-pro", "hello")]
+    assert response.metadata.failover is True
+
+
+def test_open_circuit_fallback_fits_context_window(env_file):
+    """The fallback for an open circuit must fit the prompt too."""
+    primary = WindowedProvider(env_path=env_file)
+    small = WindowedProvider(env_path=env_file, name="openai", windows={"gpt-4o": 5})
+    large = WindowedProvider(env_path=env_file, name="google")
+    router = LLMRouterService(
+        Selector=VotingSelector(model=OPUS, topic="COMPLEX"),
+        env_path=env_file,
+        providers={"anthropic": primary, "openai": small, "google": large},
+        circuit=CircuitBreakers(),
+    )
+    router.circuit.get("anthropic", OPUS)._transition(CircuitState.OPEN)
+    prompt = "a prompt that is longer than five tokens for sure"
+    router.invoke(prompt)
+    assert primary.calls == [] and small.calls == []
+    assert large.calls == [("gemini-2.5-pro", prompt)]
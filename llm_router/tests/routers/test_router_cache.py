@@ -0,0 +1,23 @@
+from llm_router.cache import InMemoryResponseCache
+from llm_router.routers.router import LLMRouterService
+
+
+def test_router_serves_repeats_from_cache(env_file, stub_provider, static_selector):
+    """Test that a repeated prompt skips the provider and reports a zero-cost hit"""
+    router = LLMRouterService(
+        Selector=static_selector,
+        env_path=env_file,
+        provider=stub_provider,
+        cache=InMemoryResponseCache(),
+    )
+
+    first = router.invoke("What is an FAQ?")
+    second = router.invoke("What is an FAQ?\n")
+
+    assert len(stub_provider.calls) == 1
+    assert first.cost > 0
+    assert first.metadata is None
+    assert second.response == first.response
+    assert second.cost == 0.0
+    assert second.latency >= 0
+    assert second.metadata.tags == ["cache-hit"]
@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+import pytest
+
+from llm_router.exceptions.exceptions import ModelExecutionError
+from llm_router.routers.circuit import CircuitBreaker, CircuitBreakers, CircuitState
+from llm_router.routers.router import LLMRouterService
+from llm_router.tests.helpers import FlakyProvider
+
+
+def test_breaker_opens_on_error_rate_and_recovers():
+    """Test closed -> open -> half-open -> closed transitions"""
+    changes = []
+    breaker = CircuitBreaker(
+        ("anthropic", "m"),
+        min_calls=4,
+        error_rate=0.5,
+        open_duration=0.05,
+        on_state_change=lambda key, old, new: changes.append((old, new)),
+    )
+
+    for success in (True, True, False, False):
+        assert breaker.allow()
+        breaker.record(success, 0.1)
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe while half-open
+    breaker.record(True, 0.1)
+
+    assert breaker.state is CircuitState.CLOSED
+    assert changes == [
+        (CircuitState.CLOSED, CircuitState.OPEN),
+        (CircuitState.OPEN, CircuitState.HALF_OPEN),
+        (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+    ]
+
+
+def test_breaker_opens_on_slow_calls():
+    """Test the latency threshold opens the breaker"""
+    breaker = CircuitBreaker(("anthropic", "m"), min_calls=3, slow_call_latency=1.0, slow_call_rate=0.6)
+
+    for latency in (2.0, 0.1, 3.0):
+        breaker.record(True, latency)
+
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_router_skips_open_circuit(env_file, static_selector):
+    """Test an open circuit routes straight to the topic's model on another provider"""
+    primary = FlakyProvider(env_file, failures=100)
+    backup = FlakyProvider(env_file, name="openai")
+    changes = []
+    router = LLMRouterService(
+        Selector=static_selector,
+        env_path=env_file,
+        provider=primary,
+        providers={"openai": backup},
+        circuit=CircuitBreakers(
+            min_calls=2, on_state_change=lambda key, old, new: changes.append((key, new))
+        ),
+    )
+
+    for _ in range(2):
+        with pytest.raises(ModelExecutionError):
+            router.invoke("hello")
+    assert changes == [(("anthropic", static_selector.model), CircuitState.OPEN)]
+
+    response = router.invoke("hello")
+
+    assert primary.attempts == 2
+    assert response.model == "gpt-3.5-turbo"
+    assert response.metadata.provider == "openai"
+    assert response.metadata.failover is True
+
+
+def _open_circuit(router, model, provider="anthropic"):
+    breaker = router.circuit.get(provider, model)
+    breaker._transition(CircuitState.OPEN)
+    breaker._opened_at -= breaker.open_duration
+    return breaker
+
+
+def test_router_skips_half_open_circuit_without_free_probe(env_file, static_selector):
+    """Test a half-open pair whose probe is taken routes to the fallback"""
+    primary = FlakyProvider(env_file)
+    backup = FlakyProvider(env_file, name="openai")
+    router = LLMRouterService(
+        Selector=static_selector, env_path=env_file, provider=primary,
+        providers={"openai": backup}, circuit=CircuitBreakers(),
+    )
+    breaker = _open_circuit(router, static_selector.model)
+    assert breaker.allow()  # an in-flight probe holds the only slot
+
+    response = router.invoke("hello")
+
+    assert primary.attempts == 0
+    assert response.metadata.provider == "openai"
+
+
+def test_cancelled_call_frees_half_open_probe(env_file, static_selector):
+    """Test a cancelled async call gives its probe back"""
+
+    class HangingProvider(FlakyProvider):
+        async def acomplete(self, model, prompt):
+            await asyncio.sleep(10)
+
+    provider = HangingProvider(env_file)
+    router = LLMRouterService(
+        Selector=static_selector, env_path=env_file, provider=provider, circuit=CircuitBreakers()
+    )
+    breaker = _open_circuit(router, static_selector.model)
+
+    async def cancel_call():
+        task = asyncio.ensure_future(router._acall(provider, static_selector.model, "hello"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_call())
+
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow()
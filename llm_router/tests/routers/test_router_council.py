@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from llm_router.councils.weighted import UnanimousCouncil, WeightedCouncil
+from llm_router.exceptions.exceptions import RouterError
+from llm_router.routers.router import LLMRouterService
+from llm_router.tests.helpers import StubProvider, VotingSelector
+
+
+def _router(env_file, council):
+    anthropic = StubProvider(env_path=env_file, name="anthropic")
+    openai = StubProvider(env_path=env_file, name="openai")
+    router = LLMRouterService(
+        council=council, env_path=env_file, providers={"anthropic": anthropic, "openai": openai}
+    )
+    return router, anthropic, openai
+
+
+def test_council_decision_is_routed_with_votes(env_file):
+    """The winning vote keeps its provider and the votes reach the metadata."""
+    council = WeightedCouncil([
+        VotingSelector(provider="openai", model="gpt-4o", topic="COMPLEX"),
+        VotingSelector(provider="openai", model="gpt-4o", topic="COMPLEX"),
+        VotingSelector(),
+    ])
+    router, anthropic, openai = _router(env_file, council)
+    response = router.invoke("hi")
+    assert openai.calls == [("gpt-4o", "hi")]
+    assert anthropic.calls == []
+    assert response.metadata.provider == "openai"
+    assert len(response.metadata.votes) == 3
+    assert response.metadata.weighted_results == {"gpt-4o": 2.0, "claude-3-haiku-20240307": 1.0}
+    assert "council-router" in response.metadata.tags
+
+
+def test_council_with_ainvoke(env_file):
+    router, anthropic, _ = _router(env_file, WeightedCouncil([VotingSelector()]))
+    response = asyncio.run(router.ainvoke("hi"))
+    assert anthropic.calls == [("claude-3-haiku-20240307", "hi")]
+    assert response.metadata.weighted_results == {"claude-3-haiku-20240307": 1.0}
+
+
+def test_router_needs_selector_or_council(env_file):
+    with pytest.raises(RouterError):
+        LLMRouterService(env_path=env_file, provider=StubProvider(env_path=env_file))
+
+
+def test_council_fallback_model_goes_to_its_provider(env_file):
+    """A model no selector voted for is sent to the provider serving it."""
+    split = [VotingSelector(), VotingSelector(provider="openai", model="gpt-4o", topic="COMPLEX")]
+    router, anthropic, openai = _router(env_file, UnanimousCouncil(split, fallback_model="gpt-4o-mini"))
+    response = router.invoke("hi")
+    assert openai.calls == [("gpt-4o-mini", "hi")]
+    assert anthropic.calls == []
+    assert response.metadata.provider == "openai"
+
+    router, _, _ = _router(env_file, UnanimousCouncil(split, fallback_model="unknown-model"))
+    with pytest.raises(RouterError):
+        router.invoke("hi")
+
+
+def test_council_skips_votes_for_unregistered_providers(env_file):
+    """A vote naming a provider the router lacks is routed to one serving the model."""
+    council = WeightedCouncil([VotingSelector(provider="google", model="gpt-4o", topic="COMPLEX")])
+    router, anthropic, openai = _router(env_file, council)
+    response = router.invoke("hi")
+    assert openai.calls == [("gpt-4o", "hi")]
+    assert response.metadata.provider == "openai"
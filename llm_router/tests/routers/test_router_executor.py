@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from llm_router.exceptions.exceptions import RouterError
+from llm_router.routers import ConcurrentExecutor
+from llm_router.routers.router import LLMRouterService
+from llm_router.tests.helpers import StubProvider
+
+
+class GatedProvider(StubProvider):
+    """Stub provider that blocks until ``gate`` is set and tracks concurrency."""
+
+    def __init__(self, env_path):
+        self.gate = threading.Event()
+        self.active = 0
+        self.peak = 0
+        self._count_lock = threading.Lock()
+        super().__init__(env_path=env_path)
+
+    def complete(self, model, prompt):
+        with self._count_lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.gate.wait(5)
+        with self._count_lock:
+            self.active -= 1
+        return super().complete(model, prompt)
+
+
+def test_executor_bounds_in_flight_requests(env_file, static_selector):
+    """Test no more than max_in_flight requests run at once"""
+    provider = GatedProvider(env_file)
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=provider)
+    prompts = [f"p{i}" for i in range(10)]
+
+    with ConcurrentExecutor(router, max_in_flight=3, max_queue=20) as executor:
+        futures = [executor.submit(p) for p in prompts]
+        time.sleep(0.05)
+        assert executor.stats()["in_flight"] == 3
+        assert executor.queue_depth == 7
+        provider.gate.set()
+        responses = [f.result() for f in futures]
+
+    assert [r.prompt for r in responses] == prompts
+    assert provider.peak == 3
+    stats = executor.stats()
+    assert stats["completed"] == 10 and stats["queue_wait_p95"] > 0
+
+
+def test_executor_applies_backpressure(env_file, static_selector):
+    """Test submit times out when the queue is full"""
+    provider = GatedProvider(env_file)
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=provider)
+
+    executor = ConcurrentExecutor(router, max_in_flight=1, max_queue=1, submit_timeout=0.05)
+    executor.submit("running")
+    time.sleep(0.05)
+    executor.submit("queued")
+    with pytest.raises(RouterError):
+        executor.submit("rejected")
+
+    provider.gate.set()
+    executor.shutdown()
+    assert executor.stats()["completed"] == 2
+
+
+def test_executor_shutdown_fails_queued_and_blocked_submits(env_file, static_selector):
+    """Test shutdown doesn't hang on a full queue or leave futures pending"""
+    provider = GatedProvider(env_file)
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=provider)
+
+    executor = ConcurrentExecutor(router, max_in_flight=1, max_queue=1)
+    running = executor.submit("running")
+    time.sleep(0.05)
+    queued = executor.submit("queued")
+    blocked = []
+
+    def submit_blocked():
+        try:
+            executor.submit("blocked")
+        except RouterError as exc:
+            blocked.append(exc)
+
+    submitter = threading.Thread(target=submit_blocked)
+    submitter.start()
+    time.sleep(0.05)
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    submitter.join(1)
+    with pytest.raises(RouterError):
+        queued.result(timeout=1)
+    assert len(blocked) == 1
+    with pytest.raises(RouterError):
+        executor.submit("late")
+
+    provider.gate.set()
+    assert running.result(timeout=1).prompt == "running"
+    executor.shutdown()
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from llm_router.routers import HedgePolicy
+from llm_router.routers.router import LLMRouterService
+from llm_router.tests.helpers import StubProvider
+
+
+class SlowProvider(StubProvider):
+    """Stub provider that sleeps ``delay`` seconds before answering."""
+
+    def __init__(self, env_path, name="anthropic", delay=0.0):
+        self.delay = delay
+        self.cancelled = False
+        super().__init__(env_path=env_path, name=name)
+
+    def complete(self, model, prompt):
+        time.sleep(self.delay)
+        return super().complete(model, prompt)
+
+    async def acomplete(self, model, prompt):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return super().complete(model, prompt)
+
+
+def _router(env_file, static_selector, primary_delay, secondary_delay, hedge_delay=0.05):
+    primary = SlowProvider(env_file, "anthropic", primary_delay)
+    secondary = SlowProvider(env_file, "openai", secondary_delay)
+    router = LLMRouterService(
+        Selector=static_selector,
+        env_path=env_file,
+        provider=primary,
+        providers={"openai": secondary},
+        hedge=HedgePolicy(delay=hedge_delay),
+    )
+    return router, primary, secondary
+
+
+def test_hedge_not_needed_when_primary_is_fast(env_file, static_selector):
+    """Test a fast primary answers without firing the hedge"""
+    router, primary, secondary = _router(env_file, static_selector, 0.0, 0.0)
+
+    response = router.invoke("hello")
+
+    hedge = response.metadata.hedge
+    assert not hedge.hedged and hedge.winner == "primary"
+    assert hedge.secondary_provider == "openai"
+    assert hedge.secondary_model == "gpt-3.5-turbo"
+    assert secondary.calls == []
+    assert response.cost == hedge.primary_cost == 0.03
+
+
+def test_hedge_secondary_wins_when_primary_is_slow(env_file, static_selector):
+    """Test the secondary leg answers first when the primary stalls"""
+    router, primary, secondary = _router(env_file, static_selector, 0.5, 0.0)
+
+    start = time.perf_counter()
+    response = router.invoke("hello")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.4
+    assert response.model == "gpt-3.5-turbo"
+    assert response.metadata.provider == "openai"
+    hedge = response.metadata.hedge
+    assert hedge.hedged and hedge.winner == "secondary"
+    assert hedge.primary_cost is None and hedge.secondary_cost == 0.03
+    assert hedge.pending == "primary"
+
+    time.sleep(0.6)  # the primary finishes 0.5s after it started
+    assert hedge.pending is None
+    assert hedge.primary_cost == 0.03
+    assert response.cost == 0.06
+    assert router.stats.get("anthropic", static_selector.model).cost_per_token is not None
+
+
+def test_concurrent_calls_within_delay_are_not_hedged(env_file, static_selector):
+    """Test time queued for a hedge worker doesn't count towards the delay"""
+    primary = SlowProvider(env_file, "anthropic", 0.5)
+    secondary = SlowProvider(env_file, "openai", 0.0)
+    router = LLMRouterService(
+        Selector=static_selector,
+        env_path=env_file,
+        provider=primary,
+        providers={"openai": secondary},
+        hedge=HedgePolicy(delay=0.8),
+        hedge_workers=4,
+    )
+
+    with ThreadPoolExecutor(max_workers=15) as pool:
+        responses = list(pool.map(router.invoke, ["hello"] * 15))
+
+    assert not any(response.metadata.hedge.hedged for response in responses)
+    assert secondary.calls == []
+    assert len(primary.calls) == 15
+
+
+def test_ainvoke_hedge_cancels_loser(env_file, static_selector):
+    """Test the async path cancels the slower leg"""
+    router, primary, secondary = _router(env_file, static_selector, 0.5, 0.0)
+
+    response = asyncio.run(router.ainvoke("hello"))
+
+    assert response.metadata.hedge.winner == "secondary"
+    assert primary.cancelled
+
+
+def test_hedge_policy_uses_observed_percentile():
+    """Test the adaptive delay follows recorded latencies"""
+    policy = HedgePolicy(min_samples=10, initial_delay=3.0)
+    assert policy.delay_for("anthropic", "m") == 3.0
+
+    for i in range(1, 101):
+        policy.record("anthropic", "m", i / 100)
+
+    assert policy.delay_for("anthropic", "m") == 0.95
+
+
+def test_hedge_policy_falls_back_to_same_provider():
+    """Test a single registered provider hedges with the fallback topic's model"""
+    policy = HedgePolicy()
+
+    assert policy.secondary("COMPLEX", "anthropic", "claude-opus-4-20250514", ["anthropic"]) == (
+        "anthropic",
+        "claude-3-5-haiku-20241022",
+    )
+    assert policy.secondary("COMPLEX", "anthropic", "claude-opus-4-20250514", ["anthropic", "google"]) == (
+        "google",
+        "gemini-2.5-pro",
+    )
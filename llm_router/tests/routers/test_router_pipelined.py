@@ -0,0 +1,113 @@
+import time
+
+from llm_router.routers.router import LLMRouterService
+from llm_router.tests.helpers import StaticSelector, StubProvider
+
+
+class SlowSelector(StaticSelector):
+    def select_model(self, prompt):
+        time.sleep(0.05)
+        return super().select_model(prompt)
+
+
+class WarmingProvider(StubProvider):
+    """Stub provider whose warmup and completion each take 50ms."""
+
+    def __init__(self, env_path):
+        self.warmups = 0
+        super().__init__(env_path=env_path)
+
+    def warmup(self):
+        self.warmups += 1
+        time.sleep(0.05)
+        return True
+
+    def complete(self, model, prompt):
+        time.sleep(0.05)
+        return super().complete(model, prompt)
+
+
+def test_invoke_pipelined_overlaps_warmup(env_file):
+    """Test warmup runs while the selector classifies"""
+    provider = WarmingProvider(env_file)
+    router = LLMRouterService(Selector=SlowSelector(), env_path=env_file, provider=provider)
+
+    start = time.perf_counter()
+    response = router.invoke_pipelined("hello")
+    elapsed = time.perf_counter() - start
+
+    assert provider.warmups == 1
+    assert elapsed < 0.14
+    assert response.metadata.overlap_saved >= 0.04
+    assert response.metadata.speculation is None
+
+
+def test_invoke_pipelined_speculative_hit(env_file):
+    """Test a correct prediction reuses the speculative request"""
+    provider = WarmingProvider(env_file)
+    selector = SlowSelector()
+    router = LLMRouterService(Selector=selector, env_path=env_file, provider=provider)
+    router.invoke("warm")
+
+    response = router.invoke_pipelined("hello", speculative=True)
+
+    assert response.metadata.speculation == "hit"
+    assert response.metadata.overlap_saved >= 0.04
+    assert provider.calls.count((selector.model, "hello")) == 1
+
+
+def test_invoke_pipelined_speculative_miss(env_file):
+    """Test a wrong prediction is abandoned and the chosen model is called"""
+    provider = WarmingProvider(env_file)
+    selector = SlowSelector(model="claude-3-haiku-20240307")
+    router = LLMRouterService(Selector=selector, env_path=env_file, provider=provider)
+    router.invoke("warm")
+    selector.model = "claude-opus-4-20250514"
+
+    response = router.invoke_pipelined("hello", speculative=True)
+
+    assert response.metadata.speculation == "miss"
+    assert response.metadata.overlap_saved == 0.0
+    assert response.model == "claude-opus-4-20250514"
+
+
+def test_invoke_pipelined_speculative_uses_cache(env_file):
+    """Test a cached prediction is answered without a speculative request"""
+    from llm_router.cache.memory import InMemoryResponseCache
+
+    provider = WarmingProvider(env_file)
+    selector = SlowSelector()
+    router = LLMRouterService(
+        Selector=selector, env_path=env_file, provider=provider, cache=InMemoryResponseCache()
+    )
+    router.invoke("hello")
+
+    response = router.invoke_pipelined("hello", speculative=True)
+
+    assert response.metadata.speculation == "hit"
+    assert "cache-hit" in response.metadata.tags
+    assert provider.calls == [(selector.model, "hello")]
+
+
+def test_invoke_pipelined_speculative_failure_falls_back(env_file):
+    """Test a failed speculative request is replaced by a regular call"""
+    from llm_router.exceptions.exceptions import ProviderCompletionError
+
+    class FailOnceProvider(WarmingProvider):
+        fail = False
+
+        def complete(self, model, prompt):
+            if self.fail:
+                self.fail = False
+                raise ProviderCompletionError("boom", provider=self.name, model=model)
+            return super().complete(model, prompt)
+
+    provider = FailOnceProvider(env_file)
+    router = LLMRouterService(Selector=SlowSelector(), env_path=env_file, provider=provider)
+    router.invoke("warm")
+    provider.fail = True
+
+    response = router.invoke_pipelined("hello", speculative=True)
+
+    assert response.metadata.speculation == "failed"
+    assert response.response.endswith(":hello")
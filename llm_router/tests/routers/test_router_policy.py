@@ -0,0 +1,159 @@
+import pytest
+
+from llm_router.exceptions.exceptions import ModelExecutionError
+from llm_router.routers.policy import AdaptivePolicy, LatencyCostPolicy
+from llm_router.routers.router import LLMRouterService
+from llm_router.routers.stats import RouterStats
+from llm_router.tests.helpers import FlakyProvider, StubProvider, VotingSelector
+
+
+def _router(env_file, selector, policy=None):
+    anthropic = StubProvider(env_path=env_file, name="anthropic")
+    openai = StubProvider(env_path=env_file, name="openai")
+    router = LLMRouterService(
+        Selector=selector,
+        env_path=env_file,
+        providers={"anthropic": anthropic, "openai": openai},
+        policy=policy,
+    )
+    return router, anthropic, openai
+
+
+def test_vote_selects_provider(env_file):
+    """A vote naming a registered provider is sent to that provider."""
+    router, anthropic, openai = _router(
+        env_file, VotingSelector(provider="openai", model="gpt-3.5-turbo")
+    )
+    response = router.invoke("hi")
+    assert openai.calls == [("gpt-3.5-turbo", "hi")]
+    assert anthropic.calls == []
+    assert response.metadata.provider == "openai"
+    assert response.metadata.failover is False
+
+
+def test_default_provider_is_first_registered(env_file):
+    """Without ``provider`` the first registered provider is the default."""
+    router, anthropic, _ = _router(env_file, VotingSelector(provider=None))
+    assert router.provider is anthropic
+
+
+def test_stats_record_latency_and_cost(env_file):
+    """Every call updates the pair's latency and cost per token."""
+    router, _, _ = _router(env_file, VotingSelector())
+    router.invoke("hi")
+    pair = router.stats.get("anthropic", "claude-3-haiku-20240307")
+    assert pair.calls == 1
+    assert pair.latency is not None
+    assert pair.cost_per_token == 30 / 1000 / 30
+
+
+def test_policy_explores_then_prefers_cheaper_faster(env_file):
+    """The policy measures every candidate, then picks the best score."""
+    router, anthropic, openai = _router(env_file, VotingSelector(), policy=LatencyCostPolicy())
+    router.invoke("a")
+    router.invoke("b")
+    assert len(anthropic.calls) == 1 and len(openai.calls) == 1
+
+    router.stats.alpha = 1.0
+    router.stats.record_call("anthropic", "claude-3-haiku-20240307", True, 2.0)
+    router.stats.record_call("openai", "gpt-3.5-turbo", True, 1.0)
+    response = router.invoke("c")
+    assert openai.calls[-1] == ("gpt-3.5-turbo", "c")
+    assert response.metadata.provider == "openai"
+
+
+def test_latency_cost_policy_weights():
+    """Weights trade latency against cost per token."""
+    stats = RouterStats(alpha=1.0)
+    stats.record_call("a", "m", True, 1.0)
+    stats.record_cost("a", "m", 4.0, 1)
+    stats.record_call("b", "m", True, 2.0)
+    stats.record_cost("b", "m", 1.0, 1)
+    candidates = [("a", "m"), ("b", "m")]
+    assert LatencyCostPolicy(latency_weight=10, cost_weight=1).choose(candidates, stats) == ("a", "m")
+    assert LatencyCostPolicy(latency_weight=1, cost_weight=10).choose(candidates, stats) == ("b", "m")
+
+
+def test_latency_cost_policy_avoids_failing_provider(env_file):
+    """A provider that only fails counts as measured and loses to a healthy one."""
+    anthropic = FlakyProvider(env_file, failures=100)
+    openai = StubProvider(env_path=env_file, name="openai")
+    router = LLMRouterService(
+        Selector=VotingSelector(), env_path=env_file,
+        providers={"anthropic": anthropic, "openai": openai}, policy=LatencyCostPolicy(),
+    )
+    with pytest.raises(ModelExecutionError):
+        router.invoke("hi")
+    for _ in range(19):
+        router.invoke("hi")
+    assert anthropic.attempts == 1
+    assert len(openai.calls) == 19
+
+
+def _measured(stats, pair, latencies, cost_per_token, failures=0):
+    for latency in latencies:
+        stats.record_call(*pair, True, latency)
+    for _ in range(failures):
+        stats.record_call(*pair, False, 0.0)
+    stats.record_cost(*pair, cost_per_token, 1)
+
+
+def test_stats_track_p95_and_error_rate():
+    """p95 comes from the latency window, the error rate is a moving average."""
+    stats = RouterStats(alpha=0.5, window=20)
+    for latency in range(1, 41):
+        stats.record_call("a", "m", True, latency / 10)
+    stats.record_call("a", "m", False, 0.0)
+    pair = stats.get("a", "m")
+    assert pair.p95_latency == 3.9
+    assert pair.error_rate == 0.5
+    assert pair.calls == 41 and pair.errors == 1
+
+
+def test_adaptive_policy_cheapest_within_slo():
+    """The cheapest pair wins unless its p95 or error rate breaks the SLO."""
+    stats = RouterStats()
+    cheap, fast, flaky = ("a", "cheap"), ("b", "fast"), ("c", "flaky")
+    _measured(stats, cheap, [3.0] * 10, 0.001)
+    _measured(stats, fast, [0.5] * 10, 0.01)
+    _measured(stats, flaky, [0.5] * 10, 0.0001, failures=10)
+    policy = AdaptivePolicy(slo_p95=2.0, epsilon=0.0)
+    assert policy.choose([cheap, fast, flaky], stats) == fast
+    assert AdaptivePolicy(slo_p95=None, max_error_rate=None, epsilon=0.0).choose(
+        [cheap, fast, flaky], stats
+    ) == flaky
+    assert AdaptivePolicy(objective="latency", epsilon=0.0).choose([cheap, fast], stats) == fast
+
+
+def test_adaptive_policy_falls_back_to_lowest_p95():
+    """When nothing meets the SLO the fastest pair is used."""
+    stats = RouterStats()
+    _measured(stats, ("a", "m"), [5.0] * 10, 0.001)
+    _measured(stats, ("b", "m"), [3.0] * 10, 0.01)
+    assert AdaptivePolicy(slo_p95=1.0, epsilon=0.0).choose([("a", "m"), ("b", "m")], stats) == ("b", "m")
+
+
+def test_adaptive_policy_explores():
+    """Unmeasured pairs are tried first and epsilon keeps exploring."""
+    stats = RouterStats()
+    _measured(stats, ("a", "m"), [0.1] * 10, 0.001)
+    candidates = [("a", "m"), ("b", "m")]
+    assert AdaptivePolicy(epsilon=0.0).choose(candidates, stats) == ("b", "m")
+
+    _measured(stats, ("b", "m"), [0.1] * 10, 0.01)
+    policy = AdaptivePolicy(epsilon=0.5, seed=1)
+    picks = {policy.choose(candidates, stats) for _ in range(50)}
+    assert picks == set(candidates)
+
+
+def test_router_with_adaptive_policy(env_file):
+    """Router calls feed the statistics the adaptive policy routes on."""
+    router, anthropic, openai = _router(
+        env_file, VotingSelector(), policy=AdaptivePolicy(min_samples=2, epsilon=0.0)
+    )
+    for i in range(4):
+        router.invoke(str(i))
+    assert len(anthropic.calls) == 2 and len(openai.calls) == 2
+    router.stats.record_cost("openai", "gpt-3.5-turbo", 0.0, 1000)
+    router.invoke("cheap")
+    assert openai.calls[-1] == ("gpt-3.5-turbo", "cheap")
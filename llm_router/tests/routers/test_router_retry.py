@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from llm_router.exceptions.exceptions import ModelExecutionError
+from llm_router.routers.resilience import RetryPolicy
+from llm_router.routers.router import LLMRouterService
+from llm_router.tests.helpers import FlakyProvider, HTTPError
+
+
+def _policy(**kwargs):
+    return RetryPolicy(base_delay=0.001, max_delay=0.01, **kwargs)
+
+
+def test_retry_recovers_from_transient_errors(env_file, static_selector):
+    """Test transient 5xx errors are retried on the same model"""
+    provider = FlakyProvider(env_file, failures=2)
+    router = LLMRouterService(
+        Selector=static_selector, env_path=env_file, provider=provider, retry=_policy()
+    )
+
+    response = router.invoke("hello")
+
+    assert response.metadata.attempts == 3
+    assert response.metadata.retry_time > 0
+    assert response.metadata.failover is False
+
+
+def test_retry_fails_over_to_other_provider(env_file, static_selector):
+    """Test exhausting the attempts moves to the topic's model on another provider"""
+    primary = FlakyProvider(env_file, failures=10, error=HTTPError(429))
+    backup = FlakyProvider(env_file, name="openai")
+    router = LLMRouterService(
+        Selector=static_selector,
+        env_path=env_file,
+        provider=primary,
+        providers={"openai": backup},
+        retry=_policy(max_attempts=2),
+    )
+
+    response = asyncio.run(router.ainvoke("hello"))
+
+    assert primary.attempts == 2
+    assert response.model == "gpt-3.5-turbo"
+    assert response.metadata.provider == "openai"
+    assert response.metadata.failover is True
+    assert response.metadata.attempts == 3
+
+
+def test_retry_does_not_retry_client_errors(env_file, static_selector):
+    """Test a 400 error is not retried and surfaces once every target failed"""
+    provider = FlakyProvider(env_file, failures=10, error=HTTPError(400))
+    router = LLMRouterService(
+        Selector=static_selector, env_path=env_file, provider=provider, retry=_policy()
+    )
+
+    with pytest.raises(ModelExecutionError):
+        router.invoke("hello")
+    assert provider.attempts == 1
+
+
+def test_retry_policy_honors_retry_after():
+    """Test Retry-After headers override the jittered backoff"""
+    policy = RetryPolicy(budget=5)
+
+    assert policy.next_delay(0, HTTPError(429, {"retry-after": "2"}), spent=0) == 2.0
+    assert policy.next_delay(0, HTTPError(429, {"retry-after-ms": "250"}), spent=0) == 0.25
+    assert policy.next_delay(0, HTTPError(429, {"retry-after": "10"}), spent=0) is None
+    assert 0 <= policy.next_delay(1, TimeoutError(), spent=0) <= 1.0
+    assert policy.next_delay(2, TimeoutError(), spent=0) is None
+
+
+@pytest.mark.parametrize(
+    "options", [{"max_attempts": 0}, {"base_delay": -1}, {"max_delay": -1}, {"budget": -1}]
+)
+def test_retry_policy_rejects_invalid_options(options):
+    """Test that a policy that could never make an attempt is rejected"""
+    with pytest.raises(ValueError):
+        RetryPolicy(**options)
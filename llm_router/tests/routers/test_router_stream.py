@@ -0,0 +1,63 @@
+import pytest
+
+from llm_router.exceptions.exceptions import ModelExecutionError, ProviderCompletionError
+from llm_router.routers.circuit import CircuitBreakers, CircuitState
+from llm_router.routers.router import LLMRouterService
+from llm_router.schemas.responses import LLMRouterStreamResponse
+from llm_router.tests.helpers import StubProvider
+
+
+class BrokenStreamProvider(StubProvider):
+    """Stub provider whose stream fails after the first chunk."""
+
+    def stream(self, model, prompt):
+        yield "partial "
+        raise ProviderCompletionError("stream dropped", provider=self.name, model=model)
+
+
+def test_invoke_stream_yields_chunks_then_summary(env_file, stub_provider, static_selector):
+    """Test that invoke_stream yields text chunks and a final summary record"""
+    router = LLMRouterService(Selector=static_selector, env_path=env_file, provider=stub_provider)
+
+    items = list(router.invoke_stream("tell me a story"))
+
+    assert items[:-1] == ["tell ", "me ", "a ", "story "]
+    final = items[-1]
+    assert isinstance(final, LLMRouterStreamResponse)
+    assert final.model == static_selector.model
+    assert final.response == "tell me a story "
+    assert final.prompt_tokens == 4
+    assert final.cost == 0.01
+    assert final.time_to_first_token == 0.001
+    assert final.latency == 0.002
+
+
+def test_invoke_stream_feeds_stats_and_circuit(env_file, stub_provider, static_selector):
+    """Test that streamed calls are recorded like invoke calls"""
+    router = LLMRouterService(
+        Selector=static_selector, env_path=env_file, provider=stub_provider, circuit=CircuitBreakers()
+    )
+
+    list(router.invoke_stream("tell me a story"))
+
+    pair = router.stats.get("anthropic", static_selector.model)
+    assert pair.calls == 1 and pair.error_rate == 0.0
+    assert pair.cost_per_token == 0.01 / 8
+    assert router.circuit.get("anthropic", static_selector.model).state is CircuitState.CLOSED
+
+
+def test_invoke_stream_records_failures(env_file, static_selector):
+    """Test that a failing stream counts against the provider and its circuit"""
+    provider = BrokenStreamProvider(env_path=env_file)
+    router = LLMRouterService(
+        Selector=static_selector,
+        env_path=env_file,
+        provider=provider,
+        circuit=CircuitBreakers(min_calls=1),
+    )
+
+    with pytest.raises(ModelExecutionError):
+        list(router.invoke_stream("tell me a story"))
+
+    assert router.stats.get("anthropic", static_selector.model).error_rate > 0
+    assert router.circuit.get("anthropic", static_selector.model).state is CircuitState.OPEN
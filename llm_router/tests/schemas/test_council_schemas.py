@@ -11,7 +11,7 @@ from llm_router.schemas.config import TOPIC_TO_MODEL
 
 def test_llm_response_creation():
     """Test LLMResponse creation with valid data"""
-    model = TOPIC_TO_MODEL["simple"]["openai"]
+    model = TOPIC_TO_MODEL["SIMPLE"]["openai"]
     response = LLMResponse(
         model=model,
         prompt="test prompt",
@@ -38,7 +38,7 @@ def test_router_metadata_creation():
 
 def test_llm_router_response_creation():
     """Test LLMRouterResponse creation with metadata"""
-    model = TOPIC_TO_MODEL["simple"]["openai"]
+    model = TOPIC_TO_MODEL["SIMPLE"]["openai"]
     metadata = RouterMetadata(
         votes=[{"selector": "test", "vote": 1}],
         weighted_results={"model1": 0.7, "model2": 0.3},
@@ -57,7 +57,7 @@ def test_llm_router_response_creation():
 
 def test_selector_vote_creation():
     """Test SelectorVote creation and validation"""
-    model = TOPIC_TO_MODEL["simple"]["openai"]
+    model = TOPIC_TO_MODEL["SIMPLE"]["openai"]
     vote = SelectorVote(
         selector_name="TestSelector",
         model=model,
@@ -69,7 +69,7 @@ def test_selector_vote_creation():
 
 def test_council_decision_creation():
     """Test CouncilDecision creation and validation"""
-    model = TOPIC_TO_MODEL["simple"]["openai"]
+    model = TOPIC_TO_MODEL["SIMPLE"]["openai"]
     vote = SelectorVote(
         selector_name="TestSelector",
         model=model,
@@ -87,7 +87,7 @@ def test_council_decision_creation():
 
 def test_invalid_llm_response():
     # response should be a string, cost should be a float
-    model = TOPIC_TO_MODEL["simple"]["openai"]
+    model = TOPIC_TO_MODEL["SIMPLE"]["openai"]
     with pytest.raises(ValidationError):
         LLMResponse(
             model=model,
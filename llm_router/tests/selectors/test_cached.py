@@ -0,0 +1,81 @@
+from fyras_models import SelectorVote
+from llm_router.schemas.abstractions import Selector
+from llm_router.schemas.responses import RoutingVote
+from llm_router.selectors.cached import CachingSelector
+
+
+class CountingSelector:
+    def __init__(self) -> None:
+        self.prompts = []
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        self.prompts.append(prompt)
+        return SelectorVote(selector_name="CountingSelector", model=f"m-{len(prompt)}")
+
+
+def test_caching_selector_is_selector():
+    assert isinstance(CachingSelector(CountingSelector()), Selector)
+
+
+def test_caching_selector_hits_and_misses():
+    """Test that repeated prompts are served from the cache"""
+    inner = CountingSelector()
+    selector = CachingSelector(inner)
+
+    first = selector.select_model("hello")
+    second = selector.select_model("hello")
+    selector.select_model("world!")
+
+    assert first == second
+    assert inner.prompts == ["hello", "world!"]
+    assert (selector.hits, selector.misses) == (1, 2)
+    assert selector.hit_rate == 1 / 3
+
+
+def test_caching_selector_lru_bound():
+    inner = CountingSelector()
+    selector = CachingSelector(inner, max_entries=2)
+    for prompt in ["a", "b", "a", "c", "b"]:
+        selector.select_model(prompt)
+    assert len(selector) == 2
+    assert inner.prompts == ["a", "b", "c", "b"]
+
+
+def test_caching_selector_prefix_key():
+    """Test that prompts sharing the configured prefix share a decision"""
+    inner = CountingSelector()
+    selector = CachingSelector(inner, prefix_chars=5)
+    selector.select_model("hello there")
+    selector.select_model("hello world, again")
+    assert inner.prompts == ["hello there"]
+
+
+def test_caching_selector_batch_only_classifies_misses():
+    class BatchSelector(CountingSelector):
+        def select_models(self, prompts, batch_size=8):
+            self.prompts.append(list(prompts))
+            return [self.select_model(p) for p in prompts]
+
+    inner = BatchSelector()
+    selector = CachingSelector(inner)
+    selector.select_model("a")
+    votes = selector.select_models(["a", "bb", "a", "ccc"])
+    assert [v.model for v in votes] == ["m-1", "m-2", "m-1", "m-3"]
+    assert ["bb", "a", "ccc"] not in inner.prompts
+    assert ["bb", "ccc"] in inner.prompts
+
+
+class FailingClassifierSelector(CountingSelector):
+    def select_model(self, prompt: str) -> SelectorVote:
+        self.prompts.append(prompt)
+        return RoutingVote(selector_name="Failing", model="fallback", fallback=True)
+
+
+def test_caching_selector_skips_fallback_votes():
+    """Test that a vote cast because classification failed isn't reused"""
+    inner = FailingClassifierSelector()
+    selector = CachingSelector(inner)
+    selector.select_model("hello")
+    selector.select_models(["hello", "world"])
+    assert inner.prompts == ["hello", "hello", "world"]
+    assert len(selector) == 0
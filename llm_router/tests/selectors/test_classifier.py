@@ -0,0 +1,102 @@
+import pytest
+
+from llm_router.selectors.registry import ModelRegistry
+from llm_router.schemas.config import TOPIC_TO_MODEL
+
+
+class BatchClassifier:
+    """Fake pipeline that labels prompts by keyword and records batch calls."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def _classify(self, prompt):
+        label = "PROGRAMMING" if "Python" in prompt else "FINANCE"
+        return {"sequence": prompt, "labels": [label], "scores": [1.0]}
+
+    def __call__(self, prompts, labels, **kwargs):
+        self.calls.append((prompts, kwargs))
+        if isinstance(prompts, str):
+            return self._classify(prompts)
+        return [self._classify(p) for p in prompts]
+
+
+@pytest.fixture
+def hf_selector(monkeypatch):
+    from llm_router.selectors import classifier
+
+    fake = BatchClassifier()
+    monkeypatch.setattr(classifier, "pipeline", lambda task, model: fake)
+    selector = classifier.HFZeroShotSelector(registry=ModelRegistry())
+    selector.fake = fake
+    return selector
+
+
+def test_select_models_single_batched_call(hf_selector):
+    """Test that select_models classifies all prompts in one call, in order"""
+    prompts = ["Write Python code", "Price of bonds", "Python decorators"]
+    votes = hf_selector.select_models(prompts, batch_size=16)
+
+    assert len(hf_selector.fake.calls) == 1
+    assert hf_selector.fake.calls[0][1] == {"batch_size": 16}
+    assert [v.model for v in votes] == [
+        TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"],
+        TOPIC_TO_MODEL["FINANCE"]["anthropic"],
+        TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"],
+    ]
+
+
+def test_select_models_empty(hf_selector):
+    """Test that an empty batch doesn't touch the classifier"""
+    assert hf_selector.select_models([]) == []
+    assert hf_selector.fake.calls == []
+
+
+def test_select_models_fallback_on_error(hf_selector):
+    """Test that a failing batch falls back to the SIMPLE model for every prompt"""
+    def boom(*args, **kwargs):
+        raise ValueError("bad input")
+
+    hf_selector.registry.unload()
+    hf_selector.registry.get(hf_selector.registry_key, lambda: boom)
+    votes = hf_selector.select_models(["a", "b"])
+    assert [v.model for v in votes] == [TOPIC_TO_MODEL["SIMPLE"]["anthropic"]] * 2
+    assert all(v.fallback for v in votes)
+
+
+def test_onnx_backend_uses_onnx_loader(monkeypatch):
+    """Test that the backend option selects the loader and the registry key"""
+    from llm_router.selectors import classifier
+
+    loaded = []
+    monkeypatch.setattr(
+        classifier,
+        "load_onnx_pipeline",
+        lambda model, quantize: loaded.append(quantize) or BatchClassifier(),
+    )
+    registry = ModelRegistry()
+    int8 = classifier.HFZeroShotSelector(registry=registry, backend="onnx-int8")
+    int8.select_model("Python")
+
+    assert loaded == [True]
+    assert int8.registry_key != classifier.HFZeroShotSelector(registry=registry).registry_key
+
+
+def test_unknown_backend_rejected():
+    from llm_router.exceptions.exceptions import SelectorError
+    from llm_router.selectors.classifier import HFZeroShotSelector
+
+    with pytest.raises(SelectorError):
+        HFZeroShotSelector(backend="tensorrt")
+
+
+def test_rankings_match_tolerance():
+    from llm_router.selectors.backends import rankings_match
+
+    reference = {"labels": ["A", "B", "C"], "scores": [0.6, 0.3, 0.1]}
+    close = {"labels": ["A", "B", "C"], "scores": [0.58, 0.23, 0.19]}
+    flipped = {"labels": ["B", "A", "C"], "scores": [0.46, 0.45, 0.09]}
+
+    assert rankings_match(reference, close, tolerance=0.1)
+    assert not rankings_match(reference, close, tolerance=0.01)
+    assert not rankings_match(reference, flipped, tolerance=1.0)
@@ -0,0 +1,105 @@
+import pytest
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import SelectorError
+from llm_router.schemas.config import TOPIC_TO_MODEL
+from llm_router.selectors.heuristics import HeuristicsSelector
+
+
+class RecordingSelector:
+    def __init__(self) -> None:
+        self.prompts = []
+
+    def select_model(self, prompt: str) -> SelectorVote:
+        self.prompts.append(prompt)
+        return SelectorVote(selector_name="Fallback", model="fallback-model")
+
+
+@pytest.fixture
+def fallback():
+    return RecordingSelector()
+
+
+@pytest.fixture
+def heuristics_selector(fallback):
+    return HeuristicsSelector(fallback=fallback)
+
+
+def test_heuristics_short_prompt(heuristics_selector, fallback):
+    result = heuristics_selector.select_model("hi")
+    assert result.model == TOPIC_TO_MODEL["SIMPLE"]["anthropic"]
+    assert "Short/simple prompt" in result.rationale
+    assert fallback.prompts == []
+
+
+def test_heuristics_code_fence(heuristics_selector):
+    result = heuristics_selector.select_model("Why does this fail?\n```\nx = [1, 2\n```")
+    assert result.model == TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"]
+
+
+def test_heuristics_code_lines_without_fence(fallback):
+    """Test source lines count as code with less confidence than a fence"""
+    selector = HeuristicsSelector(fallback=fallback, min_confidence=0.9)
+    result = selector.select_model("Why is this slow?\ndef total(xs):\n    return sum(xs)")
+    assert result.model == "fallback-model"
+
+    result = HeuristicsSelector(fallback=fallback).select_model("Why is this slow?\ndef total(xs):\n    return sum(xs)")
+    assert result.model == TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"]
+
+
+def test_heuristics_prose_is_not_code():
+    """Test capitalised prose that starts like a keyword isn't routed as code"""
+    selector = HeuristicsSelector()
+    for prompt in ("Class action lawsuits: how do they work?", "Select the best option from these three"):
+        assert "Code" not in selector.select_model(prompt).rationale
+
+
+def test_heuristics_keywords(heuristics_selector):
+    result = heuristics_selector.select_model(
+        "Should my portfolio hold more bonds now that the interest rate went up?"
+    )
+    assert result.model == TOPIC_TO_MODEL["FINANCE"]["anthropic"]
+
+
+def test_heuristics_long_prompt(heuristics_selector):
+    selector = HeuristicsSelector(long_min_tokens=50)
+    result = selector.select_model(" ".join(["word"] * 100))
+    assert result.model == TOPIC_TO_MODEL["COMPLEX"]["anthropic"]
+
+
+def test_heuristics_falls_through_when_unsure(heuristics_selector, fallback):
+    """Test that ambiguous prompts reach the fallback and are counted"""
+    heuristics_selector.select_model("hi")
+    result = heuristics_selector.select_model("Tell me something interesting about whales and their migration routes")
+    assert result.model == "fallback-model"
+    assert fallback.prompts == ["Tell me something interesting about whales and their migration routes"]
+    assert heuristics_selector.short_circuit_rate == 0.5
+
+
+def test_heuristics_configurable_cutoff(fallback):
+    strict = HeuristicsSelector(fallback=fallback, min_confidence=1.0)
+    strict.select_model("hi")
+    assert fallback.prompts == ["hi"]
+
+
+def test_heuristics_without_fallback_defaults_to_general():
+    result = HeuristicsSelector().select_model("Tell me something interesting about whales and their migration routes")
+    assert result.model == TOPIC_TO_MODEL["GENERAL"]["anthropic"]
+
+
+def test_heuristics_batch(heuristics_selector, fallback):
+    votes = heuristics_selector.select_models(["hi", "Tell me about whales and their migration routes", "thanks"])
+    assert [v.model for v in votes] == [
+        TOPIC_TO_MODEL["SIMPLE"]["anthropic"],
+        "fallback-model",
+        TOPIC_TO_MODEL["SIMPLE"]["anthropic"],
+    ]
+
+
+def test_heuristics_selector_error_handling(heuristics_selector, monkeypatch):
+    def mock_error(*args, **kwargs):
+        raise Exception("Test error")
+
+    monkeypatch.setattr(heuristics_selector, "_classify", mock_error)
+    with pytest.raises(SelectorError):
+        heuristics_selector.select_model("test")
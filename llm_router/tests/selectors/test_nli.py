@@ -0,0 +1,93 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from llm_router.selectors.nli import PackedZeroShotClassifier  # noqa: E402
+
+WORDS = ["<pad>", "<s>", "</s>", "this", "example", "is", "code", "money", "python", "stocks"]
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer over a tiny vocabulary with BART-style pair layout."""
+
+    pad_token_id = 0
+    model_max_length = 64
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def _ids(self, text):
+        return [WORDS.index(w) for w in text.lower().rstrip(".").split() if w in WORDS]
+
+    def __call__(self, texts, add_special_tokens=False, truncation=False, max_length=None):
+        self.calls.append(list(texts))
+        ids = [self._ids(t) for t in texts]
+        if truncation and max_length is not None:
+            ids = [i[:max_length] for i in ids]
+        return {"input_ids": ids}
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 4 if pair else 2
+
+    def build_inputs_with_special_tokens(self, a, b):
+        return [1] + a + [2, 2] + b + [2]
+
+
+class FakeConfig:
+    label2id = {"contradiction": 0, "neutral": 1, "entailment": 2}
+
+
+class FakeNLIModel:
+    """Entailment logit = overlap between premise words and the hypothesis label."""
+
+    config = FakeConfig()
+
+    def __init__(self) -> None:
+        self.batch_shapes = []
+
+    def eval(self):
+        return self
+
+    def __call__(self, input_ids, attention_mask):
+        self.batch_shapes.append(tuple(input_ids.shape))
+        logits = torch.zeros(input_ids.shape[0], 3)
+        for i, row in enumerate(input_ids.tolist()):
+            row = row[: int(attention_mask[i].sum())]
+            sep = row.index(2)
+            premise, label = set(row[1:sep]), row[-2]
+            logits[i, 2] = 5.0 if label in premise else 0.0
+        return type("Output", (), {"logits": logits})()
+
+
+@pytest.fixture
+def classifier():
+    return PackedZeroShotClassifier(FakeTokenizer(), FakeNLIModel())
+
+
+def test_packed_single_prompt(classifier):
+    result = classifier("python code", ["code", "money"])
+    assert result["labels"][0] == "code"
+    assert sum(result["scores"]) == pytest.approx(1.0)
+
+
+def test_packed_batch_single_forward_pass(classifier):
+    """Test that all label pairs of a batch go through one forward pass"""
+    results = classifier(["python code", "stocks money", "code"], ["code", "money"], batch_size=8)
+    assert [r["labels"][0] for r in results] == ["code", "money", "code"]
+    assert len(classifier.model.batch_shapes) == 1
+    assert classifier.model.batch_shapes[0][0] == 3 * 2
+
+
+def test_hypotheses_tokenized_once(classifier):
+    classifier("code", ["code", "money"])
+    classifier("money", ["code", "money"])
+    hypothesis_calls = [c for c in classifier.tokenizer.calls if c[0].startswith("This example")]
+    assert len(hypothesis_calls) == 1
+
+
+def test_premise_token_budget():
+    model = FakeNLIModel()
+    classifier = PackedZeroShotClassifier(FakeTokenizer(), model, max_premise_tokens=2)
+    result = classifier("this example money", ["money", "code"])
+    assert result["scores"][0] == pytest.approx(0.5)
+    assert model.batch_shapes[0][1] == 1 + 2 + 2 + 4 + 1
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import SelectorError
+from llm_router.selectors.pool import ProcessPoolSelector
+
+
+class WorkerSelector:
+    """Selector double reporting the worker pid and its thread setting."""
+
+    def select_model(self, prompt):
+        if prompt == "boom":
+            raise ValueError("classification failed")
+        return SelectorVote(
+            selector_name=f"{os.getpid()}",
+            model=prompt,
+            rationale=os.environ["OMP_NUM_THREADS"],
+        )
+
+
+def make_selector():
+    return WorkerSelector()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ProcessPoolSelector(make_selector, workers=2, threads_per_worker=3, timeout=60) as pool:
+        yield pool
+
+
+def test_votes_come_from_workers(pool):
+    """Votes are computed in worker processes with capped thread counts."""
+    vote = pool.select_model("hello")
+    assert vote.model == "hello"
+    assert vote.selector_name != str(os.getpid())
+    assert vote.rationale == "3"
+
+
+def test_select_models_order(pool):
+    prompts = [f"p{i}" for i in range(7)]
+    assert [vote.model for vote in pool.select_models(prompts, batch_size=2)] == prompts
+
+
+def test_warmup_starts_every_worker(pool):
+    assert len(pool.warmup()) == 2
+
+
+def test_errors_become_selector_errors(pool):
+    with pytest.raises(SelectorError):
+        pool.select_model("boom")
+
+
+def test_default_threads_split_cores():
+    pool = ProcessPoolSelector(make_selector, workers=2)
+    try:
+        assert pool.threads_per_worker == max(1, (os.cpu_count() or 1) // 2)
+    finally:
+        pool.shutdown()
+
+
+def broken_factory():
+    raise RuntimeError("model files missing")
+
+
+class CrashingSelector(WorkerSelector):
+    def select_model(self, prompt):
+        if prompt == "crash":
+            os._exit(1)
+        return super().select_model(prompt)
+
+
+def make_crashing_selector():
+    return CrashingSelector()
+
+
+def test_factory_error_is_reported():
+    """A factory failing in the workers surfaces as a SelectorError naming it."""
+    with ProcessPoolSelector(broken_factory, workers=1, timeout=60) as pool:
+        for _ in range(2):
+            with pytest.raises(SelectorError, match="model files missing"):
+                pool.select_model("hello")
+
+
+def test_pool_recovers_from_dead_worker():
+    """A worker dying breaks only the calls in flight; the pool is replaced."""
+    with ProcessPoolSelector(make_crashing_selector, workers=1, timeout=60) as pool:
+        with pytest.raises(SelectorError):
+            pool.select_model("crash")
+        assert pool.select_model("hello").model == "hello"
@@ -0,0 +1,115 @@
+import gc
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from llm_router.selectors import classifier
+from llm_router.selectors.backends import BACKENDS, read_safetensors_header
+from llm_router.selectors.prefork import memory_usage, preload
+from llm_router.selectors.registry import ModelRegistry
+from llm_router.tests.helpers import FakeClassifier
+
+linux_only = pytest.mark.skipif(
+    not os.path.exists("/proc/self/smaps_rollup"), reason="needs /proc/<pid>/smaps_rollup"
+)
+
+
+@pytest.fixture
+def unfreeze():
+    yield
+    gc.unfreeze()
+
+
+def _child_sees_loaded(registry, key, queue):
+    queue.put(registry.is_loaded(key))
+
+
+@linux_only
+def test_preload_shares_registry_with_children(monkeypatch, unfreeze):
+    """Pipelines loaded by preload are inherited by forked workers."""
+    loads = []
+    monkeypatch.setattr(classifier, "pipeline", lambda task, model: loads.append(1) or FakeClassifier())
+    selector = classifier.HFZeroShotSelector(registry=ModelRegistry())
+    preload(selector, object())
+    assert loads == [1]
+    assert gc.get_freeze_count() > 0
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_child_sees_loaded, args=(selector.registry, selector.registry_key, queue))
+    proc.start()
+    assert queue.get(timeout=10) is True
+    proc.join()
+
+
+@linux_only
+def test_memory_usage():
+    """USS is part of PSS, which is part of RSS."""
+    usage = memory_usage()
+    assert 0 < usage["uss"] <= usage["pss"] <= usage["rss"]
+
+
+def test_safetensors_header(tmp_path):
+    """The header index locates every tensor in the data section."""
+    save_file = pytest.importorskip("safetensors.numpy").save_file
+    path = tmp_path / "model.safetensors"
+    tensors = {"a": np.arange(6, dtype=np.float32).reshape(2, 3), "b": np.ones(4, dtype=np.int64)}
+    save_file(tensors, str(path))
+    data_start, header = read_safetensors_header(path)
+    assert header["a"]["shape"] == [2, 3] and header["a"]["dtype"] == "F32"
+    raw = path.read_bytes()
+    begin, end = header["a"]["data_offsets"]
+    values = np.frombuffer(raw[data_start + begin:data_start + end], dtype=np.float32)
+    assert values.tolist() == list(range(6))
+    assert "torch-mmap" in BACKENDS
+
+
+def test_mmap_state_dict(tmp_path):
+    """Memory-mapped tensors equal the saved ones without being copied."""
+    torch = pytest.importorskip("torch")
+    from safetensors.torch import save_file
+    from llm_router.selectors.backends import mmap_state_dict
+
+    path = tmp_path / "model.safetensors"
+    saved = {"w": torch.randn(3, 4), "empty": torch.zeros(0)}
+    save_file(saved, str(path))
+    state = mmap_state_dict(path)
+    assert torch.equal(state["w"], saved["w"])
+    assert state["empty"].shape == (0,)
+
+
+def test_mmap_model_matches_torch(tmp_path):
+    """A tied-embedding model loaded from the mmap file ranks labels like torch."""
+    torch = pytest.importorskip("torch")
+    from transformers import BartConfig, BartForSequenceClassification
+    from llm_router.selectors.backends import (
+        BACKEND_TOLERANCE,
+        load_mmap_model,
+        rankings_match,
+        save_mmap_model,
+    )
+
+    config = BartConfig(
+        vocab_size=64, d_model=16, encoder_layers=1, decoder_layers=1,
+        encoder_attention_heads=2, decoder_attention_heads=2,
+        encoder_ffn_dim=32, decoder_ffn_dim=32, max_position_embeddings=32, num_labels=3,
+    )
+    torch.manual_seed(0)
+    reference = BartForSequenceClassification(config).eval()
+    config.save_pretrained(tmp_path)
+    save_mmap_model(reference, tmp_path / "model.safetensors")
+    mapped = load_mmap_model(tmp_path)
+    assert torch.equal(mapped.model.shared.weight, reference.model.shared.weight)
+
+    input_ids = torch.tensor([[0, 5, 9, 7, 2]])
+    labels = ["a", "b", "c"]
+
+    def result(model):
+        with torch.no_grad():
+            scores = model(input_ids=input_ids).logits.softmax(-1)[0].tolist()
+        ranked = sorted(zip(labels, scores), key=lambda pair: -pair[1])
+        return {"labels": [l for l, _ in ranked], "scores": [s for _, s in ranked]}
+
+    assert rankings_match(result(reference), result(mapped), BACKEND_TOLERANCE["torch-mmap"])
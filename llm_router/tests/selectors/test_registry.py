@@ -0,0 +1,80 @@
+import threading
+
+import pytest
+
+from llm_router.selectors.registry import ModelRegistry
+from llm_router.schemas.config import TOPIC_TO_MODEL
+from llm_router.tests.helpers import FakeClassifier
+
+
+def test_registry_loads_once():
+    """Test that concurrent callers share a single load"""
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    key = registry.make_key("zero-shot-classification", "m")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get(key, loader)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_registry_unload():
+    """Test that unloading forces a reload on next use"""
+    registry = ModelRegistry()
+    key = registry.make_key("zero-shot-classification", "m")
+    first = registry.get(key, object)
+    registry.unload(key)
+    assert not registry.is_loaded(key)
+    assert registry.get(key, object) is not first
+
+
+@pytest.fixture
+def hf_selector(monkeypatch):
+    from llm_router.selectors import classifier
+
+    loads = []
+
+    def fake_pipeline(task, model):
+        loads.append(model)
+        return FakeClassifier()
+
+    monkeypatch.setattr(classifier, "pipeline", fake_pipeline)
+    selector = classifier.HFZeroShotSelector(registry=ModelRegistry())
+    selector.loads = loads
+    return selector
+
+
+def test_hf_selector_reuses_pipeline(hf_selector):
+    """Test that the pipeline is loaded once across select_model calls"""
+    hf_selector.warmup()
+    for _ in range(3):
+        vote = hf_selector.select_model("Write a Python function")
+    assert hf_selector.loads == ["facebook/bart-large-mnli"]
+    assert vote.model == TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"]
+
+
+def test_hf_selectors_share_registry(hf_selector):
+    """Test that selectors on the same registry share one pipeline"""
+    from llm_router.selectors.classifier import HFZeroShotSelector
+
+    other = HFZeroShotSelector(provider_name="openai", registry=hf_selector.registry)
+    hf_selector.select_model("hi")
+    other.select_model("hi")
+    assert len(hf_selector.loads) == 1
+
+    hf_selector.unload()
+    other.select_model("hi")
+    assert len(hf_selector.loads) == 2
@@ -1,61 +1,41 @@
 import pytest
-import responses
 
 from llm_router.selectors.heuristics import HeuristicsSelector
+from llm_router.selectors.registry import ModelRegistry
 from llm_router.exceptions.exceptions import SelectorError
 from llm_router.schemas.config import TOPIC_TO_MODEL
+from llm_router.tests.helpers import FakeClassifier
 
 # Test HFZeroShotSelector
 @pytest.fixture
 def hf_selector(monkeypatch):
-    monkeypatch.setenv("HF_API_KEY", "test")
-    monkeypatch.setenv("PROMPTLAYER_API_KEY", "test")
-    from llm_router.selectors.classifier import HFZeroShotSelector
+    from llm_router.selectors import classifier
 
-    return HFZeroShotSelector()
+    fake = FakeClassifier("PROGRAMMING")
+    monkeypatch.setattr(classifier, "pipeline", lambda task, model: fake)
+    return classifier.HFZeroShotSelector(registry=ModelRegistry())
 
-@responses.activate
 def test_hf_selector_successful_classification(hf_selector):
-    # Mock successful API response
-    responses.add(
-        responses.POST,
-        "https://api-inference.huggingface.co/models/facebook/bart-large-mnli",
-        json={"labels": ["code", "general", "math"], "scores": [0.8, 0.1, 0.1]},
-        status=200,
-    )
-
     result = hf_selector.select_model(
         "Write a Python function with a Flask API to sort a list in reverse order."
     )
-    assert result.model == TOPIC_TO_MODEL["code"]["anthropic"]
-    assert "Zero-shot classified" in result.rationale
+    assert result.model == TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"]
+    assert "by zero-shot model" in result.rationale
 
-@responses.activate
-def test_hf_selector_api_error(hf_selector):
-    # Mock API error
-    responses.add(
-        responses.POST,
-        "https://api-inference.huggingface.co/models/facebook/bart-large-mnli",
-        status=500
-    )
+def test_hf_selector_classification_error(hf_selector, monkeypatch):
+    def boom(*args, **kwargs):
+        raise ValueError("bad input")
 
+    monkeypatch.setattr(hf_selector, "_get_classifier", lambda: boom)
     result = hf_selector.select_model("test prompt")
-    assert result.model == TOPIC_TO_MODEL["simple"]["anthropic"]
-    assert "HF API error status 500" in result.rationale
-
-@responses.activate
-def test_hf_selector_invalid_json(hf_selector):
-    # Mock invalid JSON response
-    responses.add(
-        responses.POST,
-        "https://api-inference.huggingface.co/models/facebook/bart-large-mnli",
-        body="invalid json",
-        status=200
-    )
+    assert result.model == TOPIC_TO_MODEL["SIMPLE"]["anthropic"]
+    assert "Classification failed" in result.rationale
 
+def test_hf_selector_no_labels(hf_selector, monkeypatch):
+    monkeypatch.setattr(hf_selector, "_get_classifier", lambda: lambda *args, **kwargs: {"labels": []})
     result = hf_selector.select_model("test prompt")
-    assert result.model == TOPIC_TO_MODEL["simple"]["anthropic"]
-    assert "Invalid JSON from HF API" in result.rationale
+    assert result.model == TOPIC_TO_MODEL["SIMPLE"]["anthropic"]
+    assert "No labels returned" in result.rationale
 
 # Test HeuristicsSelector
 @pytest.fixture
@@ -63,30 +43,29 @@ def heuristics_selector():
     return HeuristicsSelector()
 
 def test_heuristics_code_related(heuristics_selector):
-    result = heuristics_selector.select_model("Write a Python code to sort a list")
-    assert result.model == TOPIC_TO_MODEL["code"]["anthropic"]
-    assert "code-related" in result.rationale
+    result = heuristics_selector.select_model("Sort this list:\n```\nxs = [3, 1, 2]\n```")
+    assert result.model == TOPIC_TO_MODEL["PROGRAMMING"]["anthropic"]
+    assert "Code block" in result.rationale
 
-def test_heuristics_math_related(heuristics_selector):
-    result = heuristics_selector.select_model("Solve this integral equation")
-    assert result.model == TOPIC_TO_MODEL["math"]["anthropic"]
-    assert "math-related" in result.rationale
+def test_heuristics_finance_related(heuristics_selector):
+    result = heuristics_selector.select_model("Should I invest in bonds while the mortgage is still open?")
+    assert result.model == TOPIC_TO_MODEL["FINANCE"]["anthropic"]
+    assert "keyword matches for FINANCE" in result.rationale
 
 def test_heuristics_short_simple(heuristics_selector):
     result = heuristics_selector.select_model("Hi there")
-    assert result.model == TOPIC_TO_MODEL["simple"]["anthropic"]
+    assert result.model == TOPIC_TO_MODEL["SIMPLE"]["anthropic"]
     assert "Short/simple prompt" in result.rationale
 
 def test_heuristics_medium_complexity(heuristics_selector):
     medium_prompt = "Write a summary of this paragraph that talks about various topics"
     result = heuristics_selector.select_model(medium_prompt)
-    assert result.model == TOPIC_TO_MODEL["general"]["anthropic"]
-    assert "Medium complexity" in result.rationale
+    assert result.model == TOPIC_TO_MODEL["GENERAL"]["anthropic"]
 
-def test_heuristics_long_complex(heuristics_selector):
+def test_heuristics_long_complex():
     long_prompt = " ".join(["complex"] * 100)
-    result = heuristics_selector.select_model(long_prompt)
-    assert result.model == TOPIC_TO_MODEL["complex"]["anthropic"]
+    result = HeuristicsSelector(long_min_tokens=50).select_model(long_prompt)
+    assert result.model == TOPIC_TO_MODEL["COMPLEX"]["anthropic"]
     assert "Long/complex prompt" in result.rationale
 
 # Error handling test for HeuristicsSelector
@@ -94,6 +73,6 @@ def test_heuristics_selector_error_handling(heuristics_selector, monkeypatch):
     def mock_error(*args, **kwargs):
         raise Exception("Test error")
 
-    monkeypatch.setattr(heuristics_selector, "_select_sync", mock_error)
+    monkeypatch.setattr(heuristics_selector, "_classify", mock_error)
     with pytest.raises(SelectorError):
         heuristics_selector.select_model("test")
@@ -0,0 +1,129 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from fyras_models import SelectorVote
+from llm_router.exceptions.exceptions import SelectorError
+from llm_router.selectors.server import ClassificationServer, MicroBatcher, RemoteSelector
+
+
+class BatchRecordingSelector:
+    """Selector double that echoes each prompt as the model and records batches."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.batches = []
+
+    def select_models(self, prompts, batch_size=8):
+        self.batches.append(list(prompts))
+        time.sleep(self.delay)
+        if "boom" in prompts:
+            raise ValueError("classification failed")
+        return [SelectorVote(selector_name="Batch", model=p, rationale="echo") for p in prompts]
+
+
+def make_selector():
+    return BatchRecordingSelector(delay=0.0)
+
+
+@pytest.fixture
+def server(tmp_path):
+    selector = BatchRecordingSelector()
+    server = ClassificationServer(tmp_path / "classify.sock", selector, max_batch_size=8, max_wait=0.05)
+    server.start()
+    yield server, selector
+    server.shutdown()
+
+
+def test_concurrent_requests_are_batched(server):
+    """Prompts from concurrent clients share forward passes."""
+    server, selector = server
+    client = RemoteSelector(server.path)
+    results = {}
+
+    def classify(i):
+        results[i] = client.select_model(f"prompt {i}").model
+
+    threads = [threading.Thread(target=classify, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == {i: f"prompt {i}" for i in range(16)}
+    assert max(len(batch) for batch in selector.batches) <= 8
+    assert len(selector.batches) < 16
+    assert server.stats()["requests"] == 16
+
+
+def test_select_models_keeps_order(server):
+    """Pipelined prompts from one client come back in input order."""
+    server, selector = server
+    votes = RemoteSelector(server.path).select_models(["a", "b", "c"])
+    assert [vote.model for vote in votes] == ["a", "b", "c"]
+    assert selector.batches == [["a", "b", "c"]]
+
+
+def test_errors_are_reported(server):
+    """A failed classification raises SelectorError and the client recovers."""
+    server, _ = server
+    client = RemoteSelector(server.path)
+    with pytest.raises(SelectorError):
+        client.select_model("boom")
+    assert client.select_model("fine").model == "fine"
+
+
+def test_unreachable_server(tmp_path):
+    with pytest.raises(SelectorError):
+        RemoteSelector(tmp_path / "missing.sock").select_model("hi")
+
+
+def test_batcher_waits_at_most_max_wait():
+    """A lone prompt is classified after about ``max_wait``."""
+    batcher = MicroBatcher(BatchRecordingSelector(delay=0.0), max_wait=0.02)
+    start = time.monotonic()
+    assert batcher.submit("solo").result(timeout=1).model == "solo"
+    assert time.monotonic() - start < 0.5
+    batcher.close()
+
+
+class ShortSelector(BatchRecordingSelector):
+    """Selector double that drops the last vote of every batch."""
+
+    def select_models(self, prompts, batch_size=8):
+        return super().select_models(prompts, batch_size)[:-1]
+
+
+def test_batcher_fails_prompts_without_a_vote():
+    """Prompts the selector returned no vote for fail instead of hanging."""
+    batcher = MicroBatcher(ShortSelector(delay=0.0), max_wait=0.05)
+    futures = [batcher.submit(prompt) for prompt in ("a", "b")]
+    assert futures[0].result(timeout=1).model == "a"
+    with pytest.raises(SelectorError):
+        futures[1].result(timeout=1)
+    batcher.close()
+
+
+def test_slow_client_does_not_block_the_batcher(server):
+    """Votes for a client that stops reading don't hold up other clients."""
+    server, _ = server
+    idle = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    idle.connect(server.path)
+    idle.sendall(b"".join(b'{"id": %d, "prompt": "%s"}\n' % (i, b"x" * 50_000) for i in range(20)))
+    try:
+        assert RemoteSelector(server.path, timeout=5).select_model("other").model == "other"
+    finally:
+        idle.close()
+
+
+def test_spawned_server(tmp_path):
+    """The server can run in its own process."""
+    path = tmp_path / "spawned.sock"
+    process = ClassificationServer.spawn(path, make_selector, timeout=60)
+    try:
+        assert RemoteSelector(path).select_model("remote").model == "remote"
+    finally:
+        process.terminate()
+        process.join()
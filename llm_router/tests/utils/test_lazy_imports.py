@@ -0,0 +1,25 @@
+import pytest
+
+from llm_router.benchmarks.bench_import_time import HEAVY_MODULES, import_times
+
+
+@pytest.mark.parametrize("module", ["llm_router", "llm_router.routers", "llm_router.providers", "llm_router.cache"])
+def test_import_defers_heavy_dependencies(module):
+    """Importing a package doesn't load LiteLLM, transformers and friends."""
+    times = import_times(module)
+    assert [name for name in HEAVY_MODULES if name in times] == []
+
+
+def test_lazy_exports_resolve():
+    """Lazy names resolve to the defining module's objects and are listed."""
+    import llm_router
+    from llm_router.routers import router
+    from llm_router.providers.ratelimit import RateLimiter
+
+    assert llm_router.LLMRouterService is router.LLMRouterService
+    assert "LLMRouterService" in dir(llm_router)
+    from llm_router.providers import RateLimiter as exported
+
+    assert exported is RateLimiter
+    with pytest.raises(AttributeError):
+        llm_router.missing
@@ -0,0 +1,9 @@
+from .lazy import lazy_exports
+from .tokens import count_tokens, get_encoding
+
+
+__all__ = [
+    "count_tokens",
+    "get_encoding",
+    "lazy_exports",
+]
@@ -0,0 +1,34 @@
+"""Lazy package exports via module ``__getattr__`` (PEP 562)."""
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return ``__getattr__`` and ``__dir__`` functions for ``package``.
+
+    ``exports`` maps each exported name to the module defining it, relative
+    to ``package`` when it starts with a dot. The module is imported the
+    first time the name is accessed, and the value is then cached in the
+    package namespace so later lookups don't go through ``__getattr__``.
+    Keeping heavy dependencies (LiteLLM, PromptLayer, transformers, numpy)
+    out of package ``__init__`` modules this way keeps ``import llm_router``
+    cheap.
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,40 @@
+"""Fast prompt token counting with a process-wide tiktoken encoder cache."""
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(name: str = DEFAULT_ENCODING) -> Optional[Any]:
+    """Return the cached tiktoken encoding, or ``None`` if it can't be loaded.
+
+    Building an encoding parses a large BPE table, so it is done once per
+    process. If tiktoken or its data files are unavailable (e.g. offline
+    without a cache) callers fall back to a character-based estimate.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception as exc:
+        logger.warning("tiktoken encoding %s unavailable, estimating tokens: %s", name, exc)
+        return None
+
+
+@lru_cache(maxsize=256)
+def count_tokens(text: str, encoding: str = DEFAULT_ENCODING) -> int:
+    """Return the number of tokens in ``text``.
+
+    Recent counts are cached, so the router's context-window and cost checks
+    and the provider's rate limiter encode each prompt only once.
+    """
+    enc = get_encoding(encoding)
+    if enc is None:
+        return (len(text) + 3) // 4
+    return len(enc.encode(text, disallowed_special=()))
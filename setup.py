@@ -12,9 +12,15 @@ setup(
         "python-dotenv",
         "langchain-ollama",
         "requests",
+        "httpx",
         "pydantic",
         "tqdm",
+        "numpy",
     ],
+    extras_require={
+        "semantic": ["sentence-transformers"],
+        "onnx": ["optimum[onnxruntime]"],
+    },
     python_requires=">=3.10",
     author="Srihari Raman",
     author_email="sriharii@fyrassolutions.com",